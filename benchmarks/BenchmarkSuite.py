@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# A minimal harness for benchmark suites: records results, writes them as
+# JSON, and compares them against a baseline.
+#
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from typing import Any, Callable, Optional
+
+
+class BenchmarkSuite:
+    """
+    A named collection of benchmark cases.
+
+    ---
+    Each case returns a single measurement for which lower is better (a time or a size.) Times are the best of several repeats, which excludes most of the noise caused by other processes.
+    """
+
+    name: str
+    cases: list[tuple[str, str, Callable[[], float]]]
+
+    def __init__(self, name: str):
+        self.name = name
+        self.cases = []
+
+    def case(self, name: str, unit: str = 'usec') -> Callable[[Callable[[], float]], Callable[[], float]]:
+        """
+        Decorates a function as a benchmark case, the function returns the measurement in `unit`.
+        """
+        def decorator(func: Callable[[], float]) -> Callable[[], float]:
+            self.cases.append((name, unit, func))
+            return func
+        return decorator
+
+    def run(self, pattern: Optional[str] = None, out: Any = sys.stdout) -> list[dict[str, Any]]:
+        """
+        Run all cases (whose names contain `pattern`, if specified), returns the results.
+        """
+        results = []
+        for name, unit, func in self.cases:
+            if pattern is not None and pattern not in name:
+                continue
+            value = func()
+            results.append({'name': name, 'value': value, 'unit': unit})
+            print(f'{name:<48} {value:>14.3f} {unit}', file=out)
+        return results
+
+    def main(self, argv: Optional[list[str]] = None) -> int:
+        """
+        Command-line entry point, returns a process exit code.
+        """
+        parser = argparse.ArgumentParser(description=f'Run the {self.name} benchmarks.')
+        parser.add_argument('--filter', help='only run cases whose names contain this text')
+        parser.add_argument('--json', metavar='PATH', help='write results as JSON to PATH')
+        parser.add_argument('--compare', metavar='PATH', help='compare results against a baseline previously written by --json')
+        parser.add_argument('--threshold', type=float, default=10.0, help='the regression (in percent) which fails a comparison, default 10')
+        args = parser.parse_args(argv)
+        results = self.run(args.filter)
+        if args.json is not None:
+            with open(args.json, 'w') as f:
+                json.dump({
+                    'suite': self.name,
+                    'python': platform.python_version(),
+                    'implementation': platform.python_implementation(),
+                    'machine': platform.machine(),
+                    'results': results
+                }, f, indent=2)
+        if args.compare is not None:
+            with open(args.compare) as f:
+                baseline = json.load(f)
+            return 1 if BenchmarkSuite.compare(baseline['results'], results, args.threshold) else 0
+        return 0
+
+    @staticmethod
+    def compare(baseline: list[dict[str, Any]], results: list[dict[str, Any]], threshold: float, out: Any = sys.stdout) -> list[str]:
+        """
+        Compare results against a baseline, returns the names of cases which regressed by more than `threshold` percent.
+        """
+        previous = {result['name']: result['value'] for result in baseline}
+        regressions = []
+        print(f'\n{"case":<48} {"baseline":>14} {"current":>14} {"change":>9}', file=out)
+        for result in results:
+            name = result['name']
+            before = previous.get(name)
+            if before is None or before <= 0:
+                continue
+            change = ((result['value'] - before) / before) * 100
+            regressed = change > threshold
+            if regressed:
+                regressions.append(name)
+            print(f'{name:<48} {before:>14.3f} {result["value"]:>14.3f} {change:>+8.1f}%{" REGRESSED" if regressed else ""}', file=out)
+        if len(regressions) > 0:
+            print(f'\n{len(regressions)} case(s) regressed by more than {threshold}%', file=out)
+        return regressions
+
+
+def best_usec(func: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """
+    Returns the best average time (in microseconds) of `func` across `repeat` runs of `number` calls.
+    """
+    return (min(timeit.repeat(func, number=number, repeat=repeat)) / number) * 1_000_000
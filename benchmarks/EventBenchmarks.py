@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# Microbenchmarks for raising events.
+#
+# usage:
+#
+#   PYTHONPATH=src python benchmarks/EventBenchmarks.py
+#
+
+import timeit
+from harami import DispatchCollector, EventArgs, event, set_instrument
+
+
+class FakeEventArgs(EventArgs):
+    """A fake `EventArgs` subclass used for benchmarking."""
+
+    @property
+    def value(self) -> int:
+        return self.args[0]
+
+
+class FakeEventProvider:
+    """A fake concrete class that exposes an event."""
+
+    @event(FakeEventArgs)
+    def on_changed(self, value: int) -> None:
+        pass
+
+
+def handler(sender: object, e: FakeEventArgs) -> None:
+    pass
+
+
+def raise_with_handlers(handler_count: int, number: int) -> float:
+    """Returns the average time (in microseconds) to raise an event with `handler_count` handlers."""
+    target = FakeEventProvider()
+    source = target.on_changed
+    # distinct callables, otherwise handler de-duplication applies
+    handlers = [lambda s, e: handler(s, e) for i in range(handler_count)]
+    for h in handlers:
+        source.add_handler(h)
+    best = min(timeit.repeat(lambda: source(1), number=number, repeat=5))
+    for h in handlers:
+        source.remove_handler(h)
+    return (best / number) * 1_000_000
+
+
+def raise_instrumented(instrumented: bool, number: int) -> float:
+    """Returns the average time (in microseconds) to raise an event with 10 handlers, with or without a `DispatchCollector` installed."""
+    set_instrument(DispatchCollector() if instrumented else None)
+    try:
+        return raise_with_handlers(10, number)
+    finally:
+        set_instrument(None)
+
+
+def main() -> None:
+    print(f'{"handlers":>10} {"usec/raise":>12} {"usec/handler":>14}')
+    for handler_count in (1, 10, 100, 1000):
+        number = max(100, 100_000 // handler_count)
+        usec = raise_with_handlers(handler_count, number)
+        print(f'{handler_count:>10} {usec:>12.3f} {usec / handler_count:>14.4f}')
+    print()
+    print(f'{"collector":>10} {"usec/raise":>12}')
+    for instrumented in (False, True):
+        usec = raise_instrumented(instrumented, 100_000)
+        print(f'{"on" if instrumented else "off":>10} {usec:>12.3f}')
+
+
+if __name__ == '__main__':
+    main()
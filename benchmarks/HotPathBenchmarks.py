@@ -0,0 +1,339 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# Benchmarks for the hot paths of raising events and notifying observers,
+# suitable for guarding against regressions.
+#
+# usage:
+#
+#   PYTHONPATH=src python benchmarks/HotPathBenchmarks.py --json baseline.json
+#   PYTHONPATH=src python benchmarks/HotPathBenchmarks.py --compare baseline.json --threshold 10
+#
+
+import asyncio
+import gc
+import sys
+import tempfile
+import tracemalloc
+from typing import Any, Callable
+from harami import EventArgs, EventArgsField, EventSource, Observable, ReplayObservable, SegmentLog, TimerWheel, TopicBus, event
+from BenchmarkSuite import BenchmarkSuite, best_usec
+
+
+suite = BenchmarkSuite('hot path')
+
+
+class Widget:
+    """A class which raises events, to compare raising an event nobody listens to with calling a method."""
+
+    def create(self, value: int) -> None:
+        pass
+
+    @event
+    def on_created(self, value: int) -> None:
+        pass
+
+    @event(shared=True)
+    def on_created_shared(self, value: int) -> None:
+        pass
+
+
+class FieldEventArgs(EventArgs):
+    """An `EventArgs` subclass with field accessors."""
+    __slots__ = ()
+    value = EventArgsField(0)
+
+
+def sync_handler(sender: object, e: EventArgs) -> None:
+    pass
+
+
+async def async_handler(sender: object, e: EventArgs) -> None:
+    pass
+
+
+def observer(state: int) -> None:
+    pass
+
+
+async def async_observer(state: int) -> None:
+    pass
+
+
+def create_source(handler_count: int, handler: Callable[..., Any] = sync_handler) -> EventSource:
+    source = EventSource(None)
+    for i in range(handler_count):
+        # distinct callables, otherwise handler de-duplication applies
+        source.add_handler(wrap(handler))
+    return source
+
+
+def create_observable(observer_count: int, target: Callable[..., Any] = observer) -> Observable[int]:
+    o: Observable[int] = Observable()
+    for i in range(observer_count):
+        o.attach(wrap(target))
+    return o
+
+
+def wrap(func: Callable[..., Any]) -> Callable[..., Any]:
+    # a distinct callable with the same signature (and async-ness) as `func`
+    if asyncio.iscoroutinefunction(func):
+        async def async_wrapper(*args: Any) -> Any:
+            return await func(*args)
+        return async_wrapper
+    return lambda *args: func(*args)
+
+
+def register_raise_cases(handler_count: int) -> None:
+    number = max(200, 100_000 // max(handler_count, 1))
+
+    @suite.case(f'raise.sync[handlers={handler_count}]')
+    def raise_sync() -> float:
+        source = create_source(handler_count)
+        return best_usec(lambda: source(None, 1), number)
+
+    @suite.case(f'notify.sync[observers={handler_count}]')
+    def notify_sync() -> float:
+        o = create_observable(handler_count)
+        return best_usec(lambda: o.notify(1), number)
+
+
+def register_async_cases(handler_count: int) -> None:
+    number = max(100, 10_000 // handler_count)
+
+    @suite.case(f'raise.async[handlers={handler_count}]')
+    def raise_async() -> float:
+        source = create_source(handler_count, async_handler)
+        loop = asyncio.new_event_loop()
+        try:
+            return best_usec(lambda: loop.run_until_complete(source.raise_async(None, 1)), number)
+        finally:
+            loop.close()
+
+    @suite.case(f'notify.async[observers={handler_count}]')
+    def notify_async() -> float:
+        o = create_observable(handler_count, async_observer)
+        loop = asyncio.new_event_loop()
+        try:
+            return best_usec(lambda: loop.run_until_complete(o.notify_async(1)), number)
+        finally:
+            loop.close()
+
+
+def register_fanout_cases(fanout: str, handler_count: int) -> None:
+    # compares the strategies which run the coroutines of async handlers
+    # (see `AsyncDispatcher`), 'eager' is the same as 'task' before 3.12
+    number = max(100, 10_000 // handler_count)
+
+    def create_fanout_source() -> tuple[EventSource, list[int]]:
+        completed = [0]
+
+        async def handler(sender: object, e: EventArgs) -> None:
+            completed[0] += 1
+        source = EventSource(None, fanout=fanout)
+        for i in range(handler_count):
+            source.add_handler(wrap(handler))
+        return source, completed
+
+    @suite.case(f'raise.fanout.{fanout}[handlers={handler_count}]')
+    def raise_fanout() -> float:
+        source, completed = create_fanout_source()
+
+        async def raise_and_drain() -> None:
+            # a fire-and-forget raise, then yield to the loop until every handler has run
+            target = completed[0] + handler_count
+            source(None, 1)
+            while completed[0] < target:
+                await asyncio.sleep(0)
+        loop = asyncio.new_event_loop()
+        try:
+            return best_usec(lambda: loop.run_until_complete(raise_and_drain()), number)
+        finally:
+            loop.close()
+
+    @suite.case(f'raise_async.fanout.{fanout}[handlers={handler_count}]')
+    def raise_async_fanout() -> float:
+        source, completed = create_fanout_source()
+        loop = asyncio.new_event_loop()
+        try:
+            return best_usec(lambda: loop.run_until_complete(source.raise_async(None, 1)), number)
+        finally:
+            loop.close()
+
+
+for count in (0, 1, 10, 100, 1000):
+    register_raise_cases(count)
+for count in (1, 10, 100):
+    register_async_cases(count)
+for count in (1, 10, 100):
+    for fanout in ('task', 'driver', 'eager'):
+        register_fanout_cases(fanout, count)
+
+
+@suite.case('eventargs.construct[args=1]')
+def eventargs_construct() -> float:
+    return best_usec(lambda: EventArgs(1), 1_000_000)
+
+
+@suite.case('eventargs.construct[kwargs=1]')
+def eventargs_construct_kwargs() -> float:
+    return best_usec(lambda: EventArgs(value=1), 1_000_000)
+
+
+@suite.case('eventargs.field[args=1]')
+def eventargs_field() -> float:
+    e = FieldEventArgs(1)
+    return best_usec(lambda: e.value, 1_000_000)
+
+
+@suite.case('call.direct')
+def call_direct() -> float:
+    widget = Widget()
+    return best_usec(lambda: widget.create(1), 1_000_000)
+
+
+@suite.case('raise.unobserved[scope=instance]')
+def raise_unobserved() -> float:
+    widget = Widget()
+    return best_usec(lambda: widget.on_created(1), 1_000_000)
+
+
+@suite.case('raise.unobserved[scope=shared]')
+def raise_unobserved_shared() -> float:
+    widget = Widget()
+    return best_usec(lambda: widget.on_created_shared(1), 1_000_000)
+
+
+@suite.case('raise.unobserved.ratio[scope=instance]', 'x')
+def raise_unobserved_ratio() -> float:
+    # the cost of raising an event without handlers, relative to calling a method
+    widget = Widget()
+    return best_usec(lambda: widget.on_created(1), 1_000_000) / best_usec(lambda: widget.create(1), 1_000_000)
+
+
+@suite.case('raise.eventargs.empty[handlers=1]')
+def raise_empty() -> float:
+    source = create_source(1)
+    return best_usec(lambda: source(None), 100_000)
+
+
+@suite.case('notify.replay[observers=1]')
+def notify_replay() -> float:
+    o: ReplayObservable[int] = ReplayObservable()
+    o.attach(observer)
+    return best_usec(lambda: o.notify(1), 100_000)
+
+
+@suite.case('notify.replay.log[observers=1]')
+def notify_replay_log() -> float:
+    with tempfile.TemporaryDirectory() as path:
+        with SegmentLog(path) as log:
+            o: ReplayObservable[int] = ReplayObservable(log=log)
+            o.attach(observer)
+            return best_usec(lambda: o.notify(1), 10_000)
+
+
+def register_topic_case(pattern_count: int) -> None:
+    @suite.case(f'publish.topic[patterns={pattern_count}]')
+    def publish_topic() -> float:
+        # a single matching pattern, among `pattern_count` unrelated patterns
+        bus = TopicBus()
+        for i in range(pattern_count):
+            bus.subscribe(f'entity{i}.#', sync_handler)
+        bus.subscribe('widget.*.red', sync_handler)
+        return best_usec(lambda: bus.publish('widget.created.red', 1), 100_000)
+
+
+for count in (0, 1000):
+    register_topic_case(count)
+
+
+def register_filtered_cases(handler_count: int) -> None:
+    number = max(200, 100_000 // handler_count)
+
+    @suite.case(f'raise.filtered.inline[handlers={handler_count}]')
+    def raise_filtered_inline() -> float:
+        # handlers which filter for themselves, the baseline for `where=`
+        source = EventSource(None)
+        for i in range(handler_count):
+            def handler(sender: object, e: EventArgs, i: int = i) -> None:
+                if e.args[0] != i:
+                    return
+            source.add_handler(handler)
+        return best_usec(lambda: source(None, 0), number)
+
+    @suite.case(f'raise.filtered.where[handlers={handler_count}]')
+    def raise_filtered_where() -> float:
+        source = EventSource(None)
+        for i in range(handler_count):
+            source.add_handler(wrap(sync_handler), where={0: i})
+        return best_usec(lambda: source(None, 0), number)
+
+
+for count in (10, 1000):
+    register_filtered_cases(count)
+
+
+def register_churn_case(handler_count: int) -> None:
+    @suite.case(f'subscribe.churn[handlers={handler_count}]')
+    def churn() -> float:
+        source = create_source(handler_count)
+
+        def add_remove() -> None:
+            source.add_handler(sync_handler)
+            source.remove_handler(sync_handler)
+        return best_usec(add_remove, max(100, 100_000 // (handler_count + 1)))
+
+
+for count in (0, 10, 1000):
+    register_churn_case(count)
+
+
+def register_timer_cases(timer_count: int) -> None:
+    # scheduling (and cancelling) a deferral while `timer_count` deferrals are pending
+    @suite.case(f'schedule.wheel[pending={timer_count}]')
+    def schedule_wheel() -> float:
+        wheel = TimerWheel()
+        for i in range(timer_count):
+            wheel.schedule_later(60.0 + i * 0.001, observer, 1)
+        return best_usec(lambda: wheel.schedule_later(30.0, observer, 1).cancel(), 100_000)
+
+    @suite.case(f'schedule.call_later[pending={timer_count}]')
+    def schedule_call_later() -> float:
+        loop = asyncio.new_event_loop()
+        try:
+            for i in range(timer_count):
+                loop.call_later(60.0 + i * 0.001, observer, 1)
+            return best_usec(lambda: loop.call_later(30.0, observer, 1).cancel(), 100_000)
+        finally:
+            loop.close()
+
+
+for count in (0, 100_000):
+    register_timer_cases(count)
+
+
+def register_memory_case(weak: bool) -> None:
+    @suite.case(f'memory.subscription[weak={weak}]', 'bytes')
+    def memory() -> float:
+        count = 1000
+        source = EventSource(None)
+        handlers = [lambda s, e: None for i in range(count)]
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for h in handlers:
+                source.add_handler(h, weak=weak)
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        return (after - before) / count
+
+
+for weak in (False, True):
+    register_memory_case(weak)
+
+
+if __name__ == '__main__':
+    sys.exit(suite.main())
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# Benchmarks for the cost of importing harami, as reported by
+# `python -X importtime`, suitable for guarding against regressions.
+#
+# usage:
+#
+#   PYTHONPATH=src python benchmarks/ImportBenchmarks.py --json baseline.json
+#   PYTHONPATH=src python benchmarks/ImportBenchmarks.py --compare baseline.json --threshold 10
+#
+
+import os
+import subprocess
+import sys
+
+from BenchmarkSuite import BenchmarkSuite
+
+
+suite = BenchmarkSuite('import')
+
+repeat = 7
+
+
+def import_usec(code: str) -> float:
+    """
+    Returns the best time (in usec) spent importing modules while running `code`, as reported by `python -X importtime`.
+    """
+    best = float('inf')
+    for i in range(repeat):
+        # a fresh interpreter each time, the point is to measure a cold import.
+        # `-X importtime` reports to stderr as `import time: self | cumulative | name`,
+        # where nested imports are indented, the outermost imports which follow the
+        # interpreter startup (ie. from the first `harami` import on) are summed.
+        process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, env=os.environ, check=True)
+        total = 0.0
+        started = False
+        for line in process.stderr.splitlines():
+            fields = line.split('|')
+            if len(fields) != 3 or not fields[1].strip().isdigit():
+                continue
+            name = fields[2][1:]
+            if name.startswith(' '):
+                continue
+            if name.startswith('harami'):
+                started = True
+            if started:
+                total += float(fields[1])
+        best = min(best, total)
+    return best
+
+
+def modules_loaded(code: str) -> list[str]:
+    """
+    Returns the names of the modules loaded after running `code` in a fresh interpreter.
+    """
+    process = subprocess.run([sys.executable, '-c', f'{code}\nimport sys\nprint(" ".join(sys.modules))'], capture_output=True, text=True, env=os.environ, check=True)
+    return process.stdout.split()
+
+
+@suite.case('import.harami')
+def import_harami() -> float:
+    return import_usec('import harami')
+
+
+@suite.case('import.harami.EventSource')
+def import_event_source() -> float:
+    return import_usec('from harami import EventSource')
+
+
+@suite.case('import.harami.Observable')
+def import_observable() -> float:
+    return import_usec('from harami import Observable')
+
+
+@suite.case('import.harami.*')
+def import_all() -> float:
+    return import_usec('from harami import *')
+
+
+@suite.case('import.sync.modules', unit='modules')
+def sync_modules() -> float:
+    # purely synchronous use should never import `asyncio` (or its dependencies)
+    loaded = modules_loaded('from harami import EventSource, Observable\nsource = EventSource(None)\nsource.add_handler(lambda s, e: None)\nsource(None, 1)')
+    for name in ('asyncio', 'concurrent.futures', 'inspect'):
+        if name in loaded:
+            print(f'warning: {name} was imported by synchronous use', file=sys.stderr)
+    return float(len(loaded))
+
+
+if __name__ == '__main__':
+    sys.exit(suite.main())
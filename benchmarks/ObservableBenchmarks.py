@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# Microbenchmarks for notifying observers.
+#
+# usage:
+#
+#   PYTHONPATH=src python benchmarks/ObservableBenchmarks.py
+#
+
+import timeit
+from harami import Observable
+
+
+def observer(state: int) -> None:
+    pass
+
+
+def notify_with_observers(observer_count: int, number: int) -> float:
+    """Returns the average time (in microseconds) to notify `observer_count` observers."""
+    o: Observable[int] = Observable()
+    for i in range(observer_count):
+        o.attach(lambda state: observer(state))
+    best = min(timeit.repeat(lambda: o.notify(1), number=number, repeat=5))
+    return (best / number) * 1_000_000
+
+
+def pipeline(fused: bool, number: int) -> float:
+    """Returns the average time (in microseconds) to push a value through a 5-stage pipeline."""
+    o: Observable[int] = Observable()
+    if fused:
+        o.map(lambda v: v + 1).filter(lambda v: v > 0).map(lambda v: v * 2).skip(0).map(lambda v: v - 1).attach(observer)
+    else:
+        # the equivalent pipeline, each stage an Observable forwarding to the next
+        stages: list[Observable[int]] = [Observable() for i in range(5)]
+        o.attach(lambda v: stages[0].notify(v + 1))
+        stages[0].attach(lambda v: stages[1].notify(v) if v > 0 else None)
+        stages[1].attach(lambda v: stages[2].notify(v * 2))
+        stages[2].attach(lambda v: stages[3].notify(v))
+        stages[3].attach(lambda v: stages[4].notify(v - 1))
+        stages[4].attach(observer)
+    best = min(timeit.repeat(lambda: o.notify(1), number=number, repeat=5))
+    return (best / number) * 1_000_000
+
+
+def main() -> None:
+    print(f'{"observers":>10} {"usec/notify":>12} {"usec/observer":>14}')
+    for observer_count in (1, 10, 100, 1000):
+        number = max(100, 100_000 // observer_count)
+        usec = notify_with_observers(observer_count, number)
+        print(f'{observer_count:>10} {usec:>12.3f} {usec / observer_count:>14.4f}')
+    print()
+    print(f'{"pipeline":>10} {"usec/notify":>12}')
+    for fused in (False, True):
+        usec = pipeline(fused, 100_000)
+        print(f'{"fused" if fused else "chained":>10} {usec:>12.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# Throughput benchmarks for delivering events between processes.
+#
+# usage:
+#
+#   PYTHONPATH=src python benchmarks/TransportBenchmarks.py
+#
+
+import multiprocessing
+import pickle
+import time
+from typing import Any
+from harami import SharedMemoryBus
+
+
+def reader(bus: SharedMemoryBus, results: Any) -> None:
+    received = 0
+    done = False
+
+    def on_bench(sender: object, e: object) -> None:
+        nonlocal received
+        received += 1
+
+    def on_done(sender: object, e: object) -> None:
+        nonlocal done
+        done = True
+    bus.channel('bench').add_handler(on_bench)
+    bus.channel('done').add_handler(on_done)
+    results.put(None)
+    while not done:
+        bus.poll()
+    results.put((received, bus.overruns))
+
+
+def throughput(payload_size: int, count: int) -> tuple[float, int]:
+    """Returns the number of messages per second received by another process, and the number of messages it missed (by falling behind.)"""
+    context = multiprocessing.get_context('spawn')
+    with SharedMemoryBus(capacity=1 << 26, context=context) as bus:
+        results = context.Queue()
+        process = context.Process(target=reader, args=(bus, results))
+        process.start()
+        # exclude process start-up from the measurement
+        results.get()
+        # large payloads are written out-of-band, directly into the ring
+        payload = pickle.PickleBuffer(bytearray(payload_size)) if payload_size >= 4096 else bytes(payload_size)
+        start = time.perf_counter()
+        for i in range(count):
+            bus.publish('bench', i, payload)
+        bus.publish('done')
+        bus.flush()
+        received, overruns = results.get()
+        elapsed = time.perf_counter() - start
+        process.join()
+    return received / elapsed, count - received
+
+
+def main() -> None:
+    print(f'{"payload":>10} {"msgs/sec":>12} {"MB/sec":>10} {"missed":>8}')
+    for payload_size in (0, 64, 1024, 65536):
+        count = 200_000 if payload_size < 65536 else 500
+        rate, missed = throughput(payload_size, count)
+        print(f'{payload_size:>10} {rate:>12.0f} {rate * payload_size / 1_000_000:>10.1f} {missed:>8}')
+
+
+if __name__ == '__main__':
+    main()
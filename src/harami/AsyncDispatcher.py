@@ -0,0 +1,246 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import sys
+import traceback
+from collections import deque
+from typing import Any, Coroutine, Iterable, Optional
+
+
+class AsyncDispatcher:
+    """
+    Schedules the coroutines returned by async subscribers, and tracks the futures returned by executor subscribers.
+
+    ---
+    Strong references are held to all in-flight tasks (so tasks cannot be garbage collected mid-flight), and exceptions raised by tasks nobody awaits are reported to the event loop exception handler rather than being lost. The same is true of tracked futures, except that when no event loop was running when the future was tracked the exception is printed to `sys.stderr` (as `threading` does for exceptions raised by a thread.)
+
+    When `max_concurrency` is specified at most that many tasks are in-flight at once, additional coroutines are queued (FIFO) and only become tasks once an in-flight task completes.
+
+    The `fanout` strategy determines how coroutines become tasks:
+
+    - `'task'` (the default) creates a task per coroutine.
+    - `'driver'` creates no task per coroutine, scheduled coroutines are queued and awaited one at a time (in order) by a single driver task, which exits once the queue is empty. The coroutines of every dispatch made before the driver runs share one task, which suits handlers that rarely (or briefly) suspend. `gather()` awaits coroutines in the calling task, and `max_concurrency` does not apply (coroutines never run concurrently.)
+    - `'eager'` starts each task eagerly (see `asyncio.eager_task_factory`), a coroutine runs until it first suspends before `schedule()` returns, and one which completes without suspending is never scheduled on the event loop. Requires Python 3.12 or later, otherwise it is the same as `'task'`.
+    """
+
+    __max_concurrency: Optional[int]
+    __fanout: str
+    __eager: bool
+    __tasks: set[asyncio.Task]
+    __futures: set[concurrent.futures.Future]
+    __backlog: deque[tuple[Coroutine[Any, Any, Any], Optional[asyncio.Future]]]
+    __queue: deque[Coroutine[Any, Any, Any]]
+    __driver: Optional[asyncio.Task]
+
+    def __init__(self, max_concurrency: Optional[int] = None, fanout: str = 'task'):
+        """
+        Create an AsyncDispatcher.
+
+        :param int max_concurrency: The maximum number of in-flight tasks, or `None` for no limit.
+        :param str fanout: The strategy used to run coroutines, one of `'task'`, `'driver'` or `'eager'`.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError('max_concurrency must be a positive integer')
+        if fanout not in ('task', 'driver', 'eager'):
+            raise ValueError(f'Unsupported fanout {fanout!r}')
+        self.__max_concurrency = max_concurrency
+        self.__fanout = fanout
+        self.__eager = fanout == 'eager' and hasattr(asyncio, 'eager_task_factory')
+        self.__tasks = set()
+        self.__futures = set()
+        self.__backlog = deque()
+        self.__queue = deque()
+        self.__driver = None
+
+    @property
+    def fanout(self) -> str:
+        """
+        The strategy used to run coroutines.
+        """
+        return self.__fanout
+
+    def __len__(self) -> int:
+        """
+        The number of coroutines in-flight or queued, and tracked futures not yet done.
+        """
+        return len(self.__tasks) + len(self.__backlog) + len(self.__futures) + len(self.__queue) + (0 if self.__driver is None else 1)
+
+    def schedule(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """
+        Schedule a coroutine without awaiting it (ie. "fire and forget".)
+        """
+        if self.__fanout == 'driver':
+            self.__queue.append(coro)
+            if self.__driver is None:
+                self.__driver = asyncio.create_task(self.__drive())
+            return
+        if self.__max_concurrency is None or len(self.__tasks) < self.__max_concurrency:
+            self.__start(coro, None)
+        else:
+            self.__backlog.append((coro, None))
+
+    def track(self, future: concurrent.futures.Future) -> None:
+        """
+        Track a future without awaiting it (ie. "fire and forget".)
+
+        ---
+        Tracked futures are not subject to `max_concurrency`, the executor which produced the future is responsible for limiting concurrency.
+        """
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        self.__futures.add(future)
+        future.add_done_callback(lambda f: self.__on_future_done(f, loop))
+
+    async def gather(self, coros: Iterable[Coroutine[Any, Any, Any]], return_exceptions: bool = False) -> list[Any]:
+        """
+        Schedule coroutines and wait for all of them to complete.
+
+        ---
+        Behaves like `asyncio.gather()`, results are returned in order and the first exception raised is propagated to the caller (unless `return_exceptions` is `True`), but the concurrency limit of the dispatcher is respected.
+        """
+        if self.__fanout == 'driver':
+            return await AsyncDispatcher.__await_all(list(coros), return_exceptions)
+        futures: list[asyncio.Future] = []
+        for coro in coros:
+            future = asyncio.get_running_loop().create_future()
+            if self.__max_concurrency is None or len(self.__tasks) < self.__max_concurrency:
+                self.__start(coro, future)
+            else:
+                self.__backlog.append((coro, future))
+            futures.append(future)
+        if len(futures) == 0:
+            return []
+        return await asyncio.gather(*futures, return_exceptions=return_exceptions)
+
+    async def wait(self, awaitables: Iterable[Coroutine[Any, Any, Any] | concurrent.futures.Future], return_exceptions: bool = False) -> list[Any]:
+        """
+        Wait for the awaitables returned by subscribers (coroutines, and futures returned by executor subscribers) to complete, returns their results in order.
+
+        ---
+        Coroutines are scheduled as for `gather()`, the first exception raised by any awaitable is propagated to the caller, unless `return_exceptions` is `True` (in which case exceptions are returned as results.)
+        """
+        coros: list[Coroutine[Any, Any, Any]] = []
+        futures: list[asyncio.Future] = []
+        is_future: list[bool] = []
+        for x in awaitables:
+            if isinstance(x, concurrent.futures.Future):
+                futures.append(asyncio.wrap_future(x))
+                is_future.append(True)
+            else:
+                coros.append(x)
+                is_future.append(False)
+        if len(futures) == 0:
+            return await self.gather(coros, return_exceptions)
+        coro_results, *future_results = await asyncio.gather(self.gather(coros, return_exceptions), *futures, return_exceptions=return_exceptions)
+        coro_iter = iter(coro_results)
+        future_iter = iter(future_results)
+        return [next(future_iter) if f else next(coro_iter) for f in is_future]
+
+    async def join(self) -> None:
+        """
+        Wait until all in-flight and queued coroutines, and all tracked futures, have completed.
+        """
+        while len(self.__tasks) > 0 or len(self.__futures) > 0 or self.__driver is not None:
+            driver = () if self.__driver is None else (self.__driver,)
+            await asyncio.wait(tuple(self.__tasks) + driver + tuple(asyncio.wrap_future(f) for f in tuple(self.__futures)))
+
+    async def __drive(self) -> None:
+        queue = self.__queue
+        try:
+            while len(queue) > 0:
+                coro = queue.popleft()
+                try:
+                    await coro
+                except Exception as ex:
+                    asyncio.get_running_loop().call_exception_handler({
+                        'message': 'Unhandled exception in async subscriber',
+                        'exception': ex
+                    })
+        except BaseException:
+            # cancelled, the queued coroutines will never run
+            while len(queue) > 0:
+                queue.popleft().close()
+            raise
+        finally:
+            self.__driver = None
+
+    @staticmethod
+    async def __await_all(coros: list[Coroutine[Any, Any, Any]], return_exceptions: bool) -> list[Any]:
+        results: list[Any] = []
+        try:
+            for coro in coros:
+                if return_exceptions:
+                    try:
+                        results.append(await coro)
+                    except Exception as ex:
+                        results.append(ex)
+                else:
+                    results.append(await coro)
+        finally:
+            # after an exception, the remaining coroutines are never awaited
+            for coro in coros[len(results) + 1:]:
+                coro.close()
+        return results
+
+    def __start(self, coro: Coroutine[Any, Any, Any], future: Optional[asyncio.Future]) -> None:
+        if self.__eager:
+            task = asyncio.eager_task_factory(asyncio.get_running_loop(), coro)   # type: ignore[attr-defined]
+            if task.done():
+                # completed without suspending, no need to track it
+                self.__on_done(task, future)
+                return
+        else:
+            task = asyncio.create_task(coro)
+        self.__tasks.add(task)
+        task.add_done_callback(lambda t: self.__on_done(t, future))
+
+    def __on_done(self, task: asyncio.Task, future: Optional[asyncio.Future]) -> None:
+        self.__tasks.discard(task)
+        if len(self.__backlog) > 0:
+            self.__start(*self.__backlog.popleft())
+        if task.cancelled():
+            if future is not None:
+                future.cancel()
+            return
+        exception = task.exception()
+        if future is not None:
+            if future.cancelled():
+                pass
+            elif exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(task.result())
+        elif exception is not None:
+            task.get_loop().call_exception_handler({
+                'message': 'Unhandled exception in async subscriber',
+                'exception': exception,
+                'task': task
+            })
+
+    def __on_future_done(self, future: concurrent.futures.Future, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        # NOTE: called from the thread which completed the future (typically an executor thread)
+        self.__futures.discard(future)
+        if future.cancelled():
+            return
+        exception = future.exception()
+        if exception is None:
+            return
+        message = 'Unhandled exception in executor subscriber'
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.call_exception_handler, {
+                'message': message,
+                'exception': exception,
+                'future': future
+            })
+        else:
+            print(f'{message}:', file=sys.stderr)
+            traceback.print_exception(exception, file=sys.stderr)
+
+
+__all__ = ['AsyncDispatcher']
@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# Recognizes the awaitable results of subscribers without importing
+# `asyncio`, `concurrent.futures` or `inspect`, so that purely synchronous
+# users of harami never pay to import them.
+#
+# None of these modules need to be imported to answer the question: a
+# future can only exist once `concurrent.futures` has been imported by
+# someone, and an event loop can only be running once `asyncio` has been.
+#
+
+from __future__ import annotations
+
+import collections.abc
+import sys
+from functools import partial
+from types import CoroutineType, FunctionType, MethodType
+from typing import TYPE_CHECKING, Any, Coroutine, Optional, TypeGuard
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+_COROUTINE_TYPES = (CoroutineType, collections.abc.Coroutine)
+_CO_COROUTINE = 0x80
+
+
+def iscoroutine(obj: Any) -> TypeGuard[Coroutine[Any, Any, Any]]:
+    """
+    Equivalent to `asyncio.iscoroutine()`.
+    """
+    return isinstance(obj, _COROUTINE_TYPES)
+
+
+def iscoroutinefunction(func: Any) -> bool:
+    """
+    Equivalent to `inspect.iscoroutinefunction()`.
+    """
+    inspect = sys.modules.get('inspect')
+    if inspect is not None:
+        # defers to `inspect` once imported, which also recognizes functions marked by `inspect.markcoroutinefunction()`
+        return inspect.iscoroutinefunction(func)
+    while True:
+        if type(func) is MethodType:
+            func = func.__func__
+        elif isinstance(func, partial):
+            func = func.func
+        else:
+            break
+    return isinstance(func, FunctionType) and (func.__code__.co_flags & _CO_COROUTINE) != 0
+
+
+def isfuture(obj: Any) -> bool:
+    """
+    Returns `True` if `obj` is a `concurrent.futures.Future`.
+    """
+    futures = sys.modules.get('concurrent.futures')
+    return futures is not None and isinstance(obj, futures.Future)
+
+
+def get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """
+    Returns the event loop running on the calling thread, or `None`.
+    """
+    asyncio = sys.modules.get('asyncio')
+    if asyncio is None:
+        return None
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+__all__ = ['get_running_loop', 'iscoroutine', 'iscoroutinefunction', 'isfuture']
@@ -0,0 +1,300 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterator, Mapping, Optional, TypeVar
+
+from .Observable import Observable
+from .Observer import Observer
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+T = TypeVar('T')
+
+_UNSET: Any = object()
+# the graph is invalidated before any other Observer of an input is notified,
+# so those Observers never read a stale Computed.
+_PRIORITY = 1 << 62
+
+
+class _Transaction(threading.local):
+    """
+    The pending recomputation of the calling thread.
+    """
+
+    depth: int
+    flushing: bool
+    queue: list[tuple[int, int, Computed]]
+    # the dependencies read by each Computed being evaluated, innermost last
+    frames: list[dict[int, tuple[Observable, Any]]]
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.flushing = False
+        self.queue = []
+        self.frames = []
+
+
+_transaction = _Transaction()
+_sequence = itertools.count()
+
+
+class _Input:
+    """
+    Invalidates the Computeds which read an Observable (which is not itself a Computed) whenever it changes.
+    """
+
+    __slots__ = ('__weakref__', 'observable', 'dependents')
+
+    observable: weakref.ref
+    dependents: weakref.WeakSet[Computed]
+
+    __inputs: weakref.WeakKeyDictionary[Observable, _Input] = weakref.WeakKeyDictionary()
+
+    def __init__(self, observable: Observable):
+        self.observable = weakref.ref(observable)
+        self.dependents = weakref.WeakSet()
+
+    @staticmethod
+    def of(observable: Observable) -> _Input:
+        node = _Input.__inputs.get(observable)
+        if node is None:
+            node = _Input.__inputs[observable] = _Input(observable)
+            observable.attach(node.invalidate, priority=_PRIORITY)
+        return node
+
+    def invalidate(self, state: Any) -> None:
+        dependents = list(self.dependents)
+        if len(dependents) == 0:
+            observable = self.observable()
+            if observable is not None:
+                observable.detach(self.invalidate)
+                _Input.__inputs.pop(observable, None)
+            return
+        for dependent in dependents:
+            dependent._mark(True)
+        _flush()
+
+
+class Computed(Observable[T]):
+    """
+    An Observable whose state is computed by a function of other Observables, and recomputed when (and only when) one of them changes.
+
+    ---
+    The Observables a Computed depends on are discovered each time it is computed, every Observable read by calling it (`a()`, as opposed to reading `a.state`) is a dependency. Each notification of an Observable dependency is a change, including a notification of the state it already has (such as a list mutated in place), an Observable created with `distinct` does not notify unchanged states. A change to a dependency marks every Computed downstream of it as stale, but a stale Computed is not recomputed until it is read, or (if it has Observers) until the change has finished propagating.
+
+    Stale Computeds with Observers are recomputed in topological order (dependencies before dependents), so no Computed observes an inconsistent mix of new and old states (a "glitch"), and each Computed is recomputed at most once per change, or per `batch()`. A recomputed state which is unchanged (see `distinct`) is not notified, and does not cause dependents to recompute.
+
+    The graph is not synchronized, a change (and reads which depend on it) should be made by one thread at a time.
+    """
+
+    __func: Callable[[], T]
+    __value: Any
+    __notified: Any
+    __dirty: bool
+    __changed: bool
+    __queued: bool
+    __evaluating: bool
+    __height: int
+    __order: int
+    __dependencies: tuple[tuple[Observable, Any], ...]
+    __dependents: weakref.WeakSet[Computed]
+    __equality: bool
+
+    def __init__(self, func: Callable[[], T], distinct: str = 'equality', max_concurrency: Optional[int] = None):
+        """
+        Create a Computed[T].
+
+        :param Callable func: A function which accepts no parameters and computes the state, the Observables it calls are its dependencies.
+        :param str distinct: `'equality'` (the default) treats a recomputed state which is equal (`==`) to the prior state as unchanged, `'identity'` only treats the prior state itself (`is`) as unchanged.
+        :param int max_concurrency: The maximum number of async Observer tasks in-flight at once, or `None` for no limit.
+        """
+        if distinct not in ('identity', 'equality'):
+            raise ValueError(f'Unsupported distinct mode {distinct!r}')
+        super().__init__(max_concurrency)
+        self.__func = func
+        self.__value = _UNSET
+        self.__notified = _UNSET
+        self.__dirty = True
+        self.__changed = False
+        self.__queued = False
+        self.__evaluating = False
+        self.__height = 0
+        self.__order = next(_sequence)
+        self.__dependencies = ()
+        self.__dependents = weakref.WeakSet()
+        self.__equality = distinct == 'equality'
+        Observable._set_tracker(_track)
+
+    @property
+    def state(self) -> T | None:
+        """
+        The current state of the Computed, computed first if it is stale.
+        """
+        self.__refresh()
+        return self.__value
+
+    @state.setter
+    def state(self, state: T | None) -> None:
+        raise AttributeError('The state of a Computed cannot be assigned')
+
+    @property
+    def dependencies(self) -> tuple[Observable, ...]:
+        """
+        The Observables read the last time the Computed was computed.
+        """
+        return tuple(observable for observable, value in self.__dependencies)
+
+    def attach(self, observer: Observer, weak: bool = False, priority: int = 0, executor: Optional[Executor] = None, where: Optional[Mapping[Hashable, Hashable] | Callable[[Any], Any]] = None) -> Observable:
+        observed = self.has_observers
+        super().attach(observer, weak, priority, executor, where)
+        if not observed:
+            # Observers are notified of changes from the state current when
+            # the first of them attached.
+            self.__refresh()
+            self.__notified = self.__value
+        return self
+
+    def notify(self, state: T | None) -> None:
+        raise TypeError('A Computed cannot be notified, its state is computed')
+
+    async def notify_async(self, state: T | None) -> None:
+        raise TypeError('A Computed cannot be notified, its state is computed')
+
+    def _mark(self, notified: bool = False) -> None:
+        # NOTE: internal, called when a dependency changed, `notified` when it
+        # is an Observable which is not a Computed (see `__is_stale`.) every
+        # dependent of a stale Computed is also stale, so marking stops at a
+        # Computed which is already stale.
+        if notified and not self.__evaluating:
+            self.__changed = True
+        if self.__dirty or self.__evaluating:
+            return
+        self.__dirty = True
+        if not self.__queued and self.has_observers:
+            self.__queued = True
+            heapq.heappush(_transaction.queue, (self.__height, self.__order, self))
+        for dependent in list(self.__dependents):
+            dependent._mark()
+
+    def _settle(self) -> None:
+        # NOTE: internal, called by `_flush()` in topological order
+        self.__queued = False
+        self.__refresh()
+        value = self.__value
+        if value is not self.__notified and self.has_observers:
+            self.__notified = value
+            super().notify(value)
+
+    def __refresh(self) -> None:
+        if not self.__dirty:
+            return
+        if self.__evaluating:
+            raise RuntimeError('A Computed cannot depend on itself')
+        if self.__value is not _UNSET and not self.__changed and not self.__is_stale():
+            self.__dirty = False
+            return
+        self.__changed = False
+        self.__evaluating = True
+        frame: dict[int, tuple[Observable, Any]] = {}
+        _transaction.frames.append(frame)
+        try:
+            value = self.__func()
+        finally:
+            _transaction.frames.pop()
+            self.__evaluating = False
+        self.__link(tuple(frame.values()))
+        self.__dirty = False
+        prior = self.__value
+        if prior is _UNSET or not (value is prior or (self.__equality and bool(value == prior))):
+            self.__value = value
+
+    def __is_stale(self) -> bool:
+        # reading a Computed dependency refreshes it, so a dependency whose
+        # state is still the state last read is unchanged all the way up. an
+        # Observable which is not a Computed may be notified of the state it
+        # already has (mutated in place), a notification always marks its
+        # dependents as changed (see `_mark`.)
+        for observable, value in self.__dependencies:
+            if observable.state is not value:
+                return True
+        return False
+
+    def __link(self, dependencies: tuple[tuple[Observable, Any], ...]) -> None:
+        before = {id(observable): observable for observable, value in self.__dependencies}
+        after = {id(observable): observable for observable, value in dependencies}
+        for key, observable in before.items():
+            if key not in after:
+                Computed.__dependents_of(observable).discard(self)
+        height = 0
+        for key, observable in after.items():
+            if key not in before:
+                Computed.__dependents_of(observable).add(self)
+            if isinstance(observable, Computed):
+                height = max(height, observable.__height + 1)
+        self.__dependencies = dependencies
+        self.__height = height
+
+    @staticmethod
+    def __dependents_of(observable: Observable) -> weakref.WeakSet[Computed]:
+        if isinstance(observable, Computed):
+            return observable.__dependents
+        return _Input.of(observable).dependents
+
+
+def _track(observable: Observable, state: Any) -> None:
+    frames = _transaction.frames
+    if len(frames) > 0:
+        frames[-1].setdefault(id(observable), (observable, state))
+
+
+def _flush() -> None:
+    transaction = _transaction
+    if transaction.depth > 0 or transaction.flushing:
+        return
+    transaction.flushing = True
+    try:
+        queue = transaction.queue
+        while len(queue) > 0:
+            heapq.heappop(queue)[2]._settle()
+    finally:
+        transaction.flushing = False
+
+
+def computed(func: Callable[[], T], distinct: str = 'equality') -> Computed[T]:
+    """
+    Create a Computed, such as `total = computed(lambda: a() + b())`.
+
+    :param Callable func: A function which accepts no parameters and computes the state.
+    :param str distinct: See `Computed`.
+    """
+    return Computed(func, distinct)
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """
+    Defers recomputation of Computeds until the outermost `batch()` exits, so a Computed which depends on several Observables changed within the batch is recomputed (and notified) once.
+
+    ---
+    Only recomputation is deferred, the Observers of the Observables changed within the batch are notified as usual (and a Computed read within the batch is computed on demand.) Batches are per-thread.
+    """
+    transaction = _transaction
+    transaction.depth += 1
+    try:
+        yield
+    finally:
+        transaction.depth -= 1
+        if transaction.depth == 0:
+            _flush()
+
+
+__all__ = ['Computed', 'batch', 'computed']
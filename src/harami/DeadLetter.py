@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class DeadLetter:
+    """
+    A dispatch which failed, notified to the dead-letter Observable of an Event Source or Observable created with `errors=` an Observable.
+    """
+
+    __slots__ = ('source', 'subscriber', 'args', 'exception')
+
+    source: Any
+    subscriber: Any
+    args: tuple[Any, ...]
+    exception: Exception
+
+    def __init__(self, source: Any, subscriber: Any, args: tuple[Any, ...], exception: Exception):
+        """
+        Create a DeadLetter.
+
+        :param source: The Event Source or Observable which called the subscriber.
+        :param subscriber: The subscriber (Event Handler or Observer) which raised, or `None` if it was a weak subscriber that has since been collected.
+        :param tuple args: The args the subscriber was called with, `(sender, e)` for an Event Handler and `(state,)` for an Observer.
+        :param Exception exception: The exception raised.
+        """
+        self.source = source
+        self.subscriber = subscriber
+        self.args = args
+        self.exception = exception
+
+    def __repr__(self) -> str:
+        return f'DeadLetter({self.source!r}, {self.subscriber!r}, {self.exception!r})'
+
+
+__all__ = ['DeadLetter']
@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Mapping, Optional, TypeVar
+
+from .Observable import Observable
+from .Observer import Observer
+from .Operators import Join, Stage, compose
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+T = TypeVar('T')
+
+
+class DerivedObservable(Observable[T]):
+    """
+    An Observable whose state is derived from one or more upstream Observables through a pipeline of stages.
+
+    ---
+    A stage is a factory which accepts a downstream callable (`emit`) and returns an upstream callable (`on_next`), `on_next` is called for each upstream state change and calls `emit` zero or more times (possibly later, such as from a timer.)
+
+    A DerivedObservable only attaches to its upstream Observables while it has Observers of its own. When it does, all of its stages are composed into a single Observer of each upstream Observable, and consecutive fusable stages (see `Operators.Fragment`) are compiled into a single function.
+    """
+
+    __upstreams: tuple[Observable, ...]
+    __join: Optional[Join]
+    __stages: tuple[Stage, ...]
+    __sinks: Optional[tuple[Callable[[Any], Any], ...]]
+
+    def __init__(self, upstream: Observable | tuple[Observable, ...], stages: tuple[Stage, ...], join: Optional[Join] = None):
+        """
+        Create a DerivedObservable[T].
+
+        :param Observable upstream: The Observable (or tuple of Observables) which state is derived from.
+        :param tuple stages: The stages which derive state, in order.
+        :param Join join: Combines the states of multiple upstream Observables, required when more than one upstream Observable is specified.
+        """
+        super().__init__()
+        self.__upstreams = upstream if isinstance(upstream, tuple) else (upstream,)
+        if join is None and len(self.__upstreams) != 1:
+            raise ValueError('A join is required when deriving from multiple Observables')
+        self.__join = join
+        self.__stages = stages
+        self.__sinks = None
+
+    def attach(self, observer: Observer, weak: bool = False, priority: int = 0, executor: Optional[Executor] = None, where: Optional[Mapping[Hashable, Hashable] | Callable[[Any], Any]] = None) -> Observable:
+        super().attach(observer, weak, priority, executor, where)
+        if self.__sinks is None and self.has_observers:
+            sink = compose(self.__stages, self.notify)
+            sinks = (sink,) if self.__join is None else self.__join(sink, len(self.__upstreams))
+            self.__sinks = sinks
+            for upstream, sink in zip(self.__upstreams, sinks):
+                upstream.attach(sink)
+        return self
+
+    def detach(self, observer: Observer) -> Observable:
+        super().detach(observer)
+        if self.__sinks is not None and not self.has_observers:
+            for upstream, sink in zip(self.__upstreams, self.__sinks):
+                upstream.detach(sink)
+            self.__sinks = None
+        return self
+
+    def pipe(self, *stages: Stage) -> DerivedObservable:
+        # rather than observing this Observable, the new Observable extends
+        # the stages of this Observable and observes the same upstream, so
+        # a chain of stages costs a single upstream dispatch.
+        return DerivedObservable(self.__upstreams, self.__stages + stages, self.__join)
+
+
+__all__ = ['DerivedObservable']
@@ -0,0 +1,217 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Any, Callable, Optional
+
+from .Histogram import Histogram
+from .Instrument import Instrument
+
+
+class DispatchStats:
+    """
+    Counters and a latency histogram for a single Event Source, Observable, or subscriber.
+    """
+
+    __slots__ = ('name', 'count', 'invoked', 'exceptions', 'pending', 'latency')
+
+    name: str
+    count: int
+    invoked: int
+    exceptions: int
+    pending: int
+    latency: Histogram
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.invoked = 0
+        self.exceptions = 0
+        self.pending = 0
+        self.latency = Histogram()
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        The stats as a `dict`, latencies are in seconds.
+        """
+        latency = self.latency
+        return {
+            'name': self.name,
+            'count': self.count,
+            'invoked': self.invoked,
+            'exceptions': self.exceptions,
+            'pending': self.pending,
+            'mean': latency.mean,
+            'p50': latency.percentile(50),
+            'p99': latency.percentile(99),
+            'max': latency.max
+        }
+
+
+class DispatchCollector(Instrument):
+    """
+    An Instrument which counts dispatches, subscriber calls and exceptions, and records latency histograms per Event Source (or Observable) and per subscriber.
+
+    ---
+    .. code:: python
+
+        collector = DispatchCollector()
+        set_instrument(collector)
+        ...
+        print(collector.report())
+
+    Event Sources, Observables and subscribers are held weakly, their stats are discarded once they are garbage collected.
+    """
+
+    __lock: threading.Lock
+    __sources: dict[int, tuple[Optional[weakref.ref], Any, DispatchStats]]
+    __subscribers: dict[int, tuple[Optional[weakref.ref], Any, DispatchStats]]
+    __collected: list[tuple[dict[int, tuple[Optional[weakref.ref], Any, DispatchStats]], int, weakref.ref]]
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__sources = {}
+        self.__subscribers = {}
+        self.__collected = []
+
+    def on_subscriber(self, source: Any, subscriber: Any, elapsed: float, exception: Optional[BaseException]) -> None:
+        if isinstance(subscriber, weakref.ref):
+            # held until measured, see `__get_stats`
+            target = subscriber()
+            if target is None:
+                # a weak subscriber collected since the dispatch began (its call was a no-op)
+                return
+        with self.__lock:
+            try:
+                stats = self.__get_stats(self.__subscribers, subscriber)
+                stats.count += 1
+                stats.latency.record(elapsed)
+                if exception is not None:
+                    stats.exceptions += 1
+                    self.__get_stats(self.__sources, source).exceptions += 1
+            finally:
+                self.__prune()
+
+    def on_dispatch(self, source: Any, invoked: int, elapsed: float, pending: int) -> None:
+        with self.__lock:
+            try:
+                stats = self.__get_stats(self.__sources, source)
+                stats.count += 1
+                stats.invoked += invoked
+                stats.pending = pending
+                stats.latency.record(elapsed)
+            finally:
+                self.__prune()
+
+    @property
+    def sources(self) -> list[DispatchStats]:
+        """
+        The stats of each Event Source (and Observable) measured.
+        """
+        with self.__lock:
+            return [stats for ref, obj, stats in self.__sources.values()]
+
+    @property
+    def subscribers(self) -> list[DispatchStats]:
+        """
+        The stats of each subscriber (Event Handler or Observer) measured.
+        """
+        with self.__lock:
+            return [stats for ref, obj, stats in self.__subscribers.values()]
+
+    def slowest(self, count: int = 10, percentile: float = 99) -> list[DispatchStats]:
+        """
+        The slowest subscribers, ordered by the latency at `percentile` (slowest first.)
+
+        :param int count: The maximum number of subscribers returned.
+        :param float percentile: The latency percentile subscribers are ordered by.
+        """
+        return sorted(self.subscribers, key=lambda stats: stats.latency.percentile(percentile), reverse=True)[:count]
+
+    def reset(self) -> None:
+        """
+        Discard all stats.
+        """
+        with self.__lock:
+            self.__sources = {}
+            self.__subscribers = {}
+
+    def report(self, count: int = 10) -> str:
+        """
+        A human-readable report of all sources, and the `count` slowest subscribers.
+        """
+        lines = [f'{"source":<48} {"count":>10} {"invoked":>10} {"errors":>8} {"pending":>8} {"p50 usec":>10} {"p99 usec":>10}']
+        for stats in sorted(self.sources, key=lambda stats: stats.latency.total, reverse=True):
+            lines.append(DispatchCollector.__format(stats, f'{stats.invoked:>10} {stats.exceptions:>8} {stats.pending:>8}'))
+        lines.append('')
+        lines.append(f'{"subscriber":<48} {"count":>10} {"errors":>10} {"p50 usec":>10} {"p99 usec":>10}')
+        for stats in self.slowest(count):
+            lines.append(DispatchCollector.__format(stats, f'{stats.exceptions:>10}'))
+        return '\n'.join(lines)
+
+    @staticmethod
+    def __format(stats: DispatchStats, columns: str) -> str:
+        p50 = stats.latency.percentile(50) * 1_000_000
+        p99 = stats.latency.percentile(99) * 1_000_000
+        return f'{stats.name[-48:]:<48} {stats.count:>10} {columns} {p50:>10.2f} {p99:>10.2f}'
+
+    def __get_stats(self, table: dict[int, tuple[Optional[weakref.ref], Any, DispatchStats]], obj: Any) -> DispatchStats:
+        # NOTE: caller must hold `__lock`
+        #
+        # stats are keyed by identity. each object measured is held weakly,
+        # and its stats are removed once it is collected, before its identity
+        # can be reused. a weak subscriber is identified by the weak
+        # reference its SubscriberList holds (see `Instrument.on_subscriber`),
+        # which is held strongly (it does not keep the subscriber alive), and
+        # its stats are removed once the subscriber is collected. objects
+        # which do not support weak references are held strongly.
+        key = id(obj)
+        entry = table.get(key)
+        if entry is None:
+            ref: Optional[weakref.ref]
+            if isinstance(obj, weakref.ref):
+                # the referent of a `WeakMethod` is the object the method is bound to
+                ref, held = weakref.ref(weakref.ref.__call__(obj), self.__create_callback(table, key)), obj
+            else:
+                try:
+                    ref, held = weakref.ref(obj, self.__create_callback(table, key)), None
+                except TypeError:
+                    ref, held = None, obj
+            entry = table[key] = (ref, held, DispatchStats(DispatchCollector.__describe(obj() if isinstance(obj, weakref.ref) else obj)))
+        return entry[2]
+
+    def __create_callback(self, table: dict[int, tuple[Optional[weakref.ref], Any, DispatchStats]], key: int) -> Callable[[weakref.ref], None]:
+        # finalizers can run on any thread, and at any point (including
+        # while this thread holds `__lock`), so they never block: if the
+        # lock is held the current holder prunes before releasing it.
+        def collected(ref: weakref.ref) -> None:
+            self.__collected.append((table, key, ref))
+            if self.__lock.acquire(blocking=False):
+                try:
+                    self.__prune()
+                finally:
+                    self.__lock.release()
+        return collected
+
+    def __prune(self) -> None:
+        # NOTE: caller must hold `__lock`
+        while len(self.__collected) > 0:
+            table, key, ref = self.__collected.pop()
+            entry = table.get(key)
+            if entry is not None and entry[0] is ref:
+                del table[key]
+
+    @staticmethod
+    def __describe(obj: Any) -> str:
+        func = getattr(obj, '__func__', obj)
+        name = getattr(func, '__qualname__', None)
+        if name is None:
+            return repr(obj)
+        module = getattr(func, '__module__', None)
+        return name if module is None else f'{module}.{name}'
+
+
+__all__ = ['DispatchCollector', 'DispatchStats']
@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from .Awaitables import iscoroutine, isfuture
+from .DeadLetter import DeadLetter
+
+if TYPE_CHECKING:
+    from .AsyncDispatcher import AsyncDispatcher
+    from .FilterIndex import Plan
+    from .Observable import Observable
+
+
+class ErrorPolicy:
+    """
+    Handles the exceptions raised by the subscribers (Event Handlers or Observers) of a single Event Source or Observable.
+
+    ---
+    `errors` is one of:
+
+    - `'propagate'`, the first exception raised is propagated to the caller and later subscribers are not called (the default behavior of Event Sources and Observables, which do not create an ErrorPolicy unless `max_failures` is specified.)
+    - `'isolate'`, every subscriber is called, and once all of them have been the exceptions raised are propagated to the caller as an `ExceptionGroup`.
+    - an Observable (the "dead-letter" Observable), every subscriber is called, and each exception raised is notified to the dead-letter Observable as a `DeadLetter` rather than being propagated.
+
+    When `max_failures` is specified a subscriber which raises in that many consecutive dispatches is detached (a circuit breaker.)
+
+    Subscribers are called from within a single `try` which is only re-entered after a failure, and successful calls are not counted (a failure count is reset by a dispatch in which the subscriber did not fail). Without an Instrument subscribers are called directly with `args`, so in a dispatch in which nothing fails the cost per subscriber differs from a dispatch without an ErrorPolicy only by unpacking `args`.
+    """
+
+    __mode: str
+    __dead_letter: Optional[Observable]
+    __max_failures: Optional[int]
+    __dispatches: int
+    __failures: dict[int, tuple[int, int, Any]]
+
+    def __init__(self, errors: str | Observable = 'propagate', max_failures: Optional[int] = None):
+        """
+        Create an ErrorPolicy.
+
+        :param errors: `'propagate'`, `'isolate'`, or a dead-letter Observable.
+        :param int max_failures: The number of consecutive dispatches in which a subscriber raises before it is detached, or `None` to never detach subscribers.
+        """
+        if isinstance(errors, str):
+            if errors not in ('propagate', 'isolate'):
+                raise ValueError(f'Unsupported error policy {errors!r}')
+            self.__mode = errors
+            self.__dead_letter = None
+        elif callable(getattr(errors, 'notify', None)):
+            self.__mode = 'dead-letter'
+            self.__dead_letter = errors
+        else:
+            raise TypeError(f'Unsupported error policy {errors!r}, expected a str or an Observable')
+        if max_failures is not None and max_failures < 1:
+            raise ValueError('max_failures must be a positive integer')
+        self.__max_failures = max_failures
+        self.__dispatches = 0
+        self.__failures = {}
+
+    def copy(self) -> ErrorPolicy:
+        """
+        Create an ErrorPolicy with the same configuration, and no recorded failures.
+        """
+        return ErrorPolicy(self.__mode if self.__dead_letter is None else self.__dead_letter, self.__max_failures)
+
+    @property
+    def mode(self) -> str:
+        """
+        `'propagate'`, `'isolate'` or `'dead-letter'`.
+        """
+        return self.__mode
+
+    def signal(self, source: Any, plan: Plan, subscribers: tuple[Any, ...], args: tuple[Any, ...], invoke: Optional[Callable[[Callable[..., Any], Any], Any]], detach: Callable[[Any], Any]) -> tuple[int, list[tuple[Any, Any]], list[Exception]]:
+        """
+        Call each subscriber of a dispatch, handling the exceptions they raise.
+
+        :param source: The Event Source or Observable.
+        :param Plan plan: The dispatch plan, and `subscribers` the subscribers of the plan (see `SubscriberList.snapshot`.)
+        :param tuple args: The args subscribers are called with.
+        :param Callable invoke: Calls the target of a plan entry (and its subscriber) with `args`, returns the result, or `None` to call the target directly.
+        :param Callable detach: Detaches a subscriber from `source`.
+        ---
+        Returns the dispatch number, the `(awaitable, subscriber)` pairs of the coroutines and futures returned by subscribers, and the exceptions isolated so far, to be passed to `wait()` (or, once the awaitables are scheduled, to `check()`.)
+        """
+        dispatch = self.__dispatches = self.__dispatches + 1
+        pending: list[tuple[Any, Any]] = []
+        errors: list[Exception] = []
+        # the loop resumes the same iterator after a failure, so the `try` is
+        # only re-entered for the subscribers which follow a failed one.
+        entries = enumerate(plan)
+        i = 0
+        while True:
+            try:
+                for i, (target, is_async) in entries:
+                    x = target(*args) if invoke is None else invoke(target, subscribers[i])
+                    if x is not None:
+                        if x is True:
+                            # a subscriber returning `True` stops propagation
+                            break
+                        elif is_async or iscoroutine(x) or isfuture(x):
+                            pending.append((x, subscribers[i]))
+                break
+            except Exception as ex:
+                if self.__fail(source, subscribers[i], args, ex, detach, dispatch, errors):
+                    raise
+        return dispatch, pending, errors
+
+    async def wait(self, source: Any, dispatcher: AsyncDispatcher, dispatch: int, pending: list[tuple[Any, Any]], errors: list[Exception], args: tuple[Any, ...], detach: Callable[[Any], Any]) -> None:
+        """
+        Wait for the coroutines and futures returned by `signal()`, handling the exceptions they raise, then `check()` for isolated exceptions.
+        """
+        results = await dispatcher.wait([x for x, subscriber in pending], True) if len(pending) > 0 else []
+        for (x, subscriber), result in zip(pending, results):
+            if isinstance(result, Exception):
+                if self.__fail(source, subscriber, args, result, detach, dispatch, errors):
+                    raise result
+            elif isinstance(result, BaseException):
+                raise result
+        ErrorPolicy.check(source, errors)
+
+    @staticmethod
+    def check(source: Any, errors: list[Exception]) -> None:
+        """
+        Raise the exceptions isolated during a dispatch (if any) as an `ExceptionGroup`.
+        """
+        if len(errors) > 0:
+            raise ExceptionGroup(f'{len(errors)} subscriber(s) of {source!r} raised', errors)
+
+    def __fail(self, source: Any, entry: Any, args: tuple[Any, ...], ex: Exception, detach: Callable[[Any], Any], dispatch: int, errors: list[Exception]) -> bool:
+        # records a failure, returns `True` if the exception should propagate.
+        #
+        # failures are counted per snapshot entry (the subscriber, or the
+        # weak reference held for a weak subscriber), which is stable for the
+        # lifetime of the subscription, and is held by the count so that its
+        # identity is never reused while it is a key.
+        subscriber = entry() if isinstance(entry, weakref.ref) else entry
+        if self.__max_failures is not None and subscriber is not None:
+            failures = self.__failures
+            count, last, held = failures.get(id(entry), (0, 0, entry))
+            # consecutive failures, a dispatch without a failure resets the count
+            count = count + 1 if last >= dispatch - 1 else 1
+            if count >= self.__max_failures:
+                failures.pop(id(entry), None)
+                detach(subscriber)
+            else:
+                if len(failures) >= 1024:
+                    # discard the counts which have since been reset
+                    self.__failures = failures = {key: value for key, value in failures.items() if value[1] >= dispatch - 1}
+                failures[id(entry)] = (count, dispatch, entry)
+        mode = self.__mode
+        if mode == 'propagate':
+            return True
+        elif mode == 'isolate':
+            errors.append(ex)
+        else:
+            self.__dead_letter.notify(DeadLetter(source, subscriber, args, ex))  # type: ignore[union-attr]
+        return False
+
+
+__all__ = ['ErrorPolicy']
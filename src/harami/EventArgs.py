@@ -3,25 +3,89 @@
 
 from __future__ import annotations
 
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar, Mapping, Optional
+
+
+_MISSING = object()
+
+# `kwargs` is always a read-only mapping, the empty mapping is shared by
+# every EventArgs raised without kwargs.
+_EMPTY_KWARGS: Mapping[str, Any] = MappingProxyType({})
 
 
 class EventArgs:
 
-    empty: EventArgs
+    __slots__ = ('args', 'kwargs')
+
+    empty: ClassVar[EventArgs]
     args: tuple[Any, ...]
-    kwargs: dict[str, Any]
+    kwargs: Mapping[str, Any]
 
     def __init__(self, *args, **kwargs):
         self.args = args
-        self.kwargs = kwargs
+        self.kwargs = MappingProxyType(kwargs) if kwargs else _EMPTY_KWARGS
+
+    def __getstate__(self) -> tuple[tuple[Any, ...], dict[str, Any], Optional[dict[str, Any]]]:
+        # `kwargs` is a read-only mapping proxy, which cannot be pickled
+        # (event args are pickled when handlers are submitted to a process pool.)
+        return self.args, dict(self.kwargs), getattr(self, '__dict__', None)
+
+    def __setstate__(self, state: tuple[tuple[Any, ...], dict[str, Any], Optional[dict[str, Any]]]) -> None:
+        args, kwargs, attributes = state
+        self.args = args
+        self.kwargs = MappingProxyType(kwargs) if kwargs else _EMPTY_KWARGS
+        if attributes:
+            self.__dict__.update(attributes)
 
     def get_by_name_or_index(self, name: str, index: int) -> Any:
-        d = self.kwargs.get(name, None)
-        return d if d is not None else self.args[index]
+        kwargs = self.kwargs
+        if len(kwargs) > 0:
+            d = kwargs.get(name, _MISSING)
+            if d is not _MISSING:
+                return d
+        return self.args[index]
+
+
+class EventArgsField:
+    """
+    A descriptor which exposes an `EventArgs` subclass field by name or by index.
+
+    ---
+    Reads the kwarg named `name` (defaults to the attribute name) when present, otherwise reads `args[index]`. Events raised without kwargs (the common case) resolve to a single tuple index.
+
+    .. code:: python
+
+        class WidgetEventArgs(EventArgs):
+            __slots__ = ()
+            widget = EventArgsField(0)
+    """
+
+    __slots__ = ('index', 'name')
+
+    index: int
+    name: str
+
+    def __init__(self, index: int, name: Optional[str] = None):
+        self.index = index
+        self.name = '' if name is None else name
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        if len(self.name) == 0:
+            self.name = name
+
+    def __get__(self, instance: Optional[EventArgs], owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        kwargs = instance.kwargs
+        if len(kwargs) > 0:
+            d = kwargs.get(self.name, _MISSING)
+            if d is not _MISSING:
+                return d
+        return instance.args[self.index]
 
 
 EventArgs.empty = EventArgs()
 
 
-__all__ = ['EventArgs']
+__all__ = ['EventArgs', 'EventArgsField']
@@ -1,12 +1,12 @@
 # SPDX-FileCopyrightText: © 2025 Shaun Wilson
 # SPDX-License-Identifier: MIT
 
-from typing import Callable, TypeAlias
+from typing import Any, Callable, Coroutine, TypeAlias, Union
 
 from .EventArgs import EventArgs
 
 
-EventHandler: TypeAlias = Callable[[object, 'EventArgs'], None]   # noqa: N801
+EventHandler: TypeAlias = Callable[[object, 'EventArgs'], Union[None, bool, Coroutine[Any, Any, None]]]   # noqa: N801
 
 
 __all__ = ['EventHandler']
@@ -3,50 +3,420 @@
 
 from __future__ import annotations
 
-import asyncio
+import threading
+import time
 from types import FunctionType, MethodType
-from typing import Any, Callable, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Hashable, Mapping, Optional, cast
 
-from .EventArgs import EventArgs
+from .Awaitables import iscoroutine, iscoroutinefunction, isfuture
+from .EventArgs import EventArgs, EventArgsField
+from .ErrorPolicy import ErrorPolicy
 from .EventHandler import EventHandler
-from .Observable import Observable
+from .FilterIndex import FilterIndex, Plan
+from .SubscriberList import SubscriberList
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from .AsyncDispatcher import AsyncDispatcher
+    from .EventStream import EventStream
+    from .Instrument import Instrument
+    from .Observable import Observable
+    from .TimerWheel import TimerHandle
 
 
 class EventSource:
 
     __eventargs: type
     __func: Callable[..., Any] | None
-    __handlers: set[EventHandler]
+    __handlers: SubscriberList
+    __name: str | None
+    __shared: bool
+    __bound: bool
+    __sender: Any
+    __max_concurrency: Optional[int]
+    __fanout: str
+    __dispatcher: Optional[AsyncDispatcher]
+    # the default Instrument is a class attribute, and an Instrument installed
+    # for a single Event Source is an instance attribute which shadows it, so
+    # either way dispatch pays for a single attribute read.
+    __instrument: Optional[Instrument] = None
+    # filtered Event Handlers (`where=`), an instance attribute only while
+    # there are any, so Event Sources without them stay on the fast path.
+    __filters: Optional[FilterIndex] = None
+    # an instance attribute only when created with an error policy other
+    # than 'propagate' (or with `max_failures`.)
+    __errors: Optional[ErrorPolicy] = None
+
+    def __init__(self, func: Optional[Callable[..., Any]], eventargs: type = EventArgs, shared: bool = False, max_concurrency: Optional[int] = None, fanout: str = 'task', errors: str | Observable = 'propagate', max_failures: Optional[int] = None):
+        """
+        Create an Event Source.
 
-    def __init__(self, func: Optional[Callable[..., Any]], eventargs: type = EventArgs):
+        :param Callable func: The function or method being decorated, may be `None`.
+        :param type eventargs: The `EventArgs` type constructed when the event is raised.
+        :param bool shared: When `True`, an Event Source declared in a class body shares a single set of handlers across all instances of that class, otherwise each instance has its own handlers. A shared Event Source read through an instance raises the event (including `raise_async()`, `raise_later()` and `raise_at()`) with the instance as `sender`.
+        :param int max_concurrency: The maximum number of async Event Handler tasks in-flight at once, or `None` for no limit.
+        :param str fanout: How the coroutines returned by async Event Handlers are run, `'task'` (the default) creates a task per coroutine, `'driver'` runs them one at a time in a single task, and `'eager'` starts each task eagerly (Python 3.12 or later), see `AsyncDispatcher`.
+        :param errors: How exceptions raised by Event Handlers are handled, `'propagate'` (the default) propagates the first exception and later Event Handlers are not signaled, `'isolate'` signals every Event Handler and then propagates the exceptions raised as an `ExceptionGroup`, and an Observable (a dead-letter Observable) signals every Event Handler and notifies the Observable of each exception as a `DeadLetter`.
+        :param int max_failures: When specified, an Event Handler which raises during that many consecutive raises is removed (a circuit breaker.)
+        ---
+        Error policies apply to exceptions raised by Event Handlers when signaled, and to exceptions raised by the coroutines (and futures) awaited by `raise_async()`. The coroutines scheduled by a raise which does not await them report exceptions as usual (see `AsyncDispatcher`.)
+        """
+        if fanout not in ('task', 'driver', 'eager'):
+            raise ValueError(f'Unsupported fanout {fanout!r}')
+        if errors != 'propagate' or max_failures is not None:
+            self.__errors = ErrorPolicy(errors, max_failures)
         self.__eventargs = eventargs
         self.__func = func
-        self.__handlers = set()
+        self.__handlers = SubscriberList()
+        self.__name = None
+        self.__shared = shared
+        self.__bound = False
+        self.__sender = None
+        self.__max_concurrency = max_concurrency
+        self.__fanout = fanout
+        self.__dispatcher = None
 
     def __call__(self, *args, **kwargs) -> Any:
+        if self.__instrument is not None or self.__filters is not None or self.__errors is not None:
+            return self.__call_extended(args, kwargs)
         result = None if self.__func is None else self.__func(*args, **kwargs)
-        for handler in self.__handlers:
-            eventargs = self.__eventargs
-            sender = args[0] if len(args) > 0 else None
-            # event args passing allows for some flexibility to developers:
-            # if no args provided to Event Source, send `EventArgs.empty` (useful for generic state change events)
-            # otherwise..
-            # if the first arg provided is an `EventArgs` subclass, passthrough as-is (and ignore all other args)
-            # otherwise..
-            # if non-EventArgs args are provided pass them to constructor for the `@event(x)` specified `EventArgs` type `x`
-            # except when..
-            # no EventArgs type was defined via @event(), pass `EventArgs.empty`
-            e: EventArgs = EventArgs.empty if len(args) <= 1 else cast(EventArgs, args[1]) if len(args) > 1 and args[1] is object and issubclass(args[1], EventArgs) else eventargs(*args[1:], **kwargs) if eventargs is not None else EventArgs.empty
+        # the plan is an immutable snapshot, it is only rebuilt when handlers are added/removed
+        plan = self.__handlers.plan
+        if len(plan) == 0:
+            # an event nobody listens to does not construct `EventArgs`
+            return result
+        sender, e = self.__prepare(args, kwargs)
+        for handler, is_async in plan:
             x = handler(sender, e)
-            if x is not None and asyncio.coroutines.iscoroutine(x):
-                asyncio.create_task(x)
+            if x is not None:
+                if x is True:
+                    # an Event Handler returning `True` stops propagation
+                    break
+                elif is_async or iscoroutine(x):
+                    self.__get_dispatcher().schedule(cast(Coroutine[Any, Any, Any], x))
+                elif isfuture(x):
+                    self.__get_dispatcher().track(x)
+        return result
+
+    async def raise_async(self, *args, **kwargs) -> Any:
+        """
+        Raise the event, and wait for all Event Handlers to complete.
+
+        ---
+        The wrapped function is awaited (if it is async), Event Handlers are then signaled and all coroutines they return are awaited (respecting `max_concurrency`), as are the futures of Event Handlers added with an `executor`. The first exception raised by an async or executor Event Handler is propagated to the caller.
+
+        Returns the result of the wrapped function.
+        """
+        result = None if self.__func is None else self.__func(*args, **kwargs)
+        if iscoroutine(result):
+            result = await result
+        if self.__instrument is not None or self.__filters is not None or self.__errors is not None:
+            dispatch = self.__prepare_extended(args, kwargs)
+            if dispatch is None:
+                return result
+            plan, subscribers, sender, e = dispatch
+            errors = self.__errors
+            if errors is not None:
+                number, pending, failures = self.__signal_guarded(errors, plan, subscribers, sender, e, False)
+                await errors.wait(self, self.__get_dispatcher(), number, pending, failures, (sender, e), self.remove_handler)
+                return result
+            elif self.__instrument is not None:
+                awaitables = self.__signal_instrumented(plan, subscribers, sender, e, False)
+            else:
+                awaitables = EventSource.__signal(plan, sender, e)
+        else:
+            plan = self.__handlers.plan
+            if len(plan) == 0:
+                return result
+            sender, e = self.__prepare(args, kwargs)
+            awaitables = EventSource.__signal(plan, sender, e)
+        if len(awaitables) > 0:
+            await self.__get_dispatcher().wait(awaitables)
+        return result
+
+    def __call_extended(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        # raises the event as `__call__` does, for Event Sources which are
+        # instrumented, have filtered Event Handlers, or have an error policy
+        # (off the fast path.)
+        result = None if self.__func is None else self.__func(*args, **kwargs)
+        dispatch = self.__prepare_extended(args, kwargs)
+        if dispatch is not None:
+            plan, subscribers, sender, e = dispatch
+            if self.__errors is not None:
+                self.__signal_guarded(self.__errors, plan, subscribers, sender, e, True)
+            elif self.__instrument is not None:
+                self.__signal_instrumented(plan, subscribers, sender, e, True)
+            else:
+                for x in EventSource.__signal(plan, sender, e):
+                    if isfuture(x):
+                        self.__get_dispatcher().track(x)
+                    else:
+                        self.__get_dispatcher().schedule(x)
         return result
 
+    def __prepare_extended(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Optional[tuple[Plan, tuple[Any, ...], Any, EventArgs]]:
+        # returns the plan (and subscribers) of the Event Handlers to signal,
+        # including matching filtered Event Handlers, and the `sender` and
+        # `EventArgs` to signal them with. returns `None` when there is no
+        # Event Handler to signal, the `EventArgs` are then never constructed.
+        plan, subscribers = self.__handlers.snapshot
+        filters = self.__filters
+        if filters is None:
+            if len(plan) == 0:
+                return None
+            sender, e = self.__prepare(args, kwargs)
+            return plan, subscribers, sender, e
+        sender, args = self.__get_sender(args)
+        matched_plan, matched_subscribers = filters.match(args, kwargs)
+        plan += matched_plan
+        subscribers += matched_subscribers
+        if len(filters.predicates) > 0:
+            e = self.__create_eventargs(args, kwargs)
+            matched_plan, matched_subscribers = filters.evaluate(e)
+            plan += matched_plan
+            subscribers += matched_subscribers
+        elif len(plan) == 0:
+            return None
+        else:
+            e = self.__create_eventargs(args, kwargs)
+        return (plan, subscribers, sender, e) if len(plan) > 0 else None
+
+    @staticmethod
+    def __signal(plan: Plan, sender: Any, e: EventArgs) -> list[Any]:
+        # signals handlers as `__call__` does, returning the coroutines and
+        # futures returned by handlers (rather than scheduling them.)
+        awaitables = []
+        for handler, is_async in plan:
+            x = handler(sender, e)
+            if x is not None:
+                if x is True:
+                    # an Event Handler returning `True` stops propagation
+                    break
+                elif is_async or iscoroutine(x) or isfuture(x):
+                    awaitables.append(x)
+        return awaitables
+
+    def __signal_instrumented(self, plan: tuple[tuple[Callable[..., Any], bool], ...], subscribers: tuple[Any, ...], sender: Any, e: EventArgs, schedule: bool) -> list[Any]:
+        # signals handlers as `__call__` does, measuring each handler. when
+        # `schedule` is `False` the coroutines and futures returned by
+        # handlers are returned to the caller instead of being scheduled.
+        instrument = cast('Instrument', self.__instrument)
+        awaitables: list[Any] = []
+        invoked = 0
+        perf_counter = time.perf_counter
+        start = perf_counter()
+        try:
+            for (handler, is_async), subscriber in zip(plan, subscribers):
+                invoked += 1
+                t = perf_counter()
+                try:
+                    x = handler(sender, e)
+                except BaseException as ex:
+                    instrument.on_subscriber(self, subscriber, perf_counter() - t, ex)
+                    raise
+                instrument.on_subscriber(self, subscriber, perf_counter() - t, None)
+                if x is not None:
+                    if x is True:
+                        # an Event Handler returning `True` stops propagation
+                        break
+                    elif is_async or iscoroutine(x):
+                        if schedule:
+                            self.__get_dispatcher().schedule(cast(Coroutine[Any, Any, Any], x))
+                        else:
+                            awaitables.append(x)
+                    elif isfuture(x):
+                        if schedule:
+                            self.__get_dispatcher().track(x)
+                        else:
+                            awaitables.append(x)
+        finally:
+            dispatcher = self.__dispatcher
+            instrument.on_dispatch(self, invoked, perf_counter() - start, 0 if dispatcher is None else len(dispatcher))
+        return awaitables
+
+    def __signal_guarded(self, errors: ErrorPolicy, plan: Plan, subscribers: tuple[Any, ...], sender: Any, e: EventArgs, schedule: bool) -> tuple[int, list[tuple[Any, Any]], list[Exception]]:
+        # signals handlers as `__call__` does, subject to an error policy
+        # (and measuring each handler, when instrumented.) when `schedule` is
+        # `False` the coroutines and futures returned by handlers are
+        # returned to the caller instead of being scheduled.
+        instrument = self.__instrument
+        if instrument is None:
+            number, pending, failures = errors.signal(self, plan, subscribers, (sender, e), None, self.remove_handler)
+        else:
+            invoked = 0
+            perf_counter = time.perf_counter
+
+            def invoke(handler: Callable[..., Any], subscriber: Any) -> Any:
+                nonlocal invoked
+                invoked += 1
+                t = perf_counter()
+                try:
+                    x = handler(sender, e)
+                except BaseException as ex:
+                    instrument.on_subscriber(self, subscriber, perf_counter() - t, ex)
+                    raise
+                instrument.on_subscriber(self, subscriber, perf_counter() - t, None)
+                return x
+            start = perf_counter()
+            try:
+                number, pending, failures = errors.signal(self, plan, subscribers, (sender, e), invoke, self.remove_handler)
+            finally:
+                dispatcher = self.__dispatcher
+                instrument.on_dispatch(self, invoked, perf_counter() - start, 0 if dispatcher is None else len(dispatcher))
+        if schedule:
+            for x, subscriber in pending:
+                if isfuture(x):
+                    self.__get_dispatcher().track(x)
+                else:
+                    self.__get_dispatcher().schedule(x)
+            pending = []
+            ErrorPolicy.check(self, failures)
+        return number, pending, failures
+
+    def __get_dispatcher(self) -> AsyncDispatcher:
+        # created on first use, most Event Sources never see an async handler
+        # (and `asyncio` is not imported until one does.)
+        dispatcher = self.__dispatcher
+        if dispatcher is None:
+            from .AsyncDispatcher import AsyncDispatcher
+            dispatcher = self.__dispatcher = AsyncDispatcher(self.__max_concurrency, self.__fanout)
+        return dispatcher
+
+    def __prepare(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[Any, EventArgs]:
+        sender, args = self.__get_sender(args)
+        # event args are built once per raise, and shared by all handlers
+        return sender, self.__create_eventargs(args, kwargs)
+
+    def __get_sender(self, args: tuple[Any, ...]) -> tuple[Any, tuple[Any, ...]]:
+        # returns the sender, and the args which follow it
+        if self.__bound:
+            return self.__sender, args
+        else:
+            return (args[0] if len(args) > 0 else None), args[1:]
+
+    def __create_key_getter(self, fields: tuple[Hashable, ...]) -> Callable[[tuple[Any, ...], Mapping[str, Any]], tuple]:
+        # reads the values of key-equality filter fields from the raw args of
+        # a raise: a field name is read from `kwargs`, or (when the `EventArgs`
+        # type declares an `EventArgsField` of that name) from the positional
+        # arg at its index. an int field is a positional index.
+        accessors: list[tuple[Optional[str], Optional[int]]] = []
+        for field in fields:
+            if isinstance(field, int):
+                accessors.append((None, field))
+            else:
+                descriptor = getattr(self.__eventargs, str(field), None)
+                if isinstance(descriptor, EventArgsField):
+                    accessors.append((descriptor.name, descriptor.index))
+                else:
+                    accessors.append((str(field), None))
+
+        def get_value(args: tuple[Any, ...], kwargs: Mapping[str, Any], name: Optional[str], index: Optional[int]) -> Any:
+            if name is not None and name in kwargs:
+                return kwargs[name]
+            elif index is None:
+                raise KeyError(name)
+            return args[index]
+
+        def get_key(args: tuple[Any, ...], kwargs: Mapping[str, Any]) -> tuple:
+            if len(args) > 0 and isinstance(args[0], EventArgs):
+                # passthrough `EventArgs`, see `__create_eventargs`
+                args, kwargs = args[0].args, args[0].kwargs
+            return tuple(get_value(args, kwargs, name, index) for name, index in accessors)
+        return get_key
+
+    def __create_eventargs(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> EventArgs:
+        # event args passing allows for some flexibility to developers:
+        # if no args provided to Event Source, send `EventArgs.empty` (useful for generic state change events)
+        # otherwise..
+        # if the first arg provided is an `EventArgs` instance, passthrough as-is (and ignore all other args)
+        # otherwise..
+        # if non-EventArgs args are provided pass them to constructor for the `@event(x)` specified `EventArgs` type `x`
+        # except when..
+        # no EventArgs type was defined via @event(), pass `EventArgs.empty`
+        if len(args) == 0:
+            return EventArgs.empty
+        elif isinstance(args[0], EventArgs):
+            return args[0]
+        elif self.__eventargs is not None:
+            return cast(EventArgs, self.__eventargs(*args, **kwargs))
+        else:
+            return EventArgs.empty
+
+    def __repr__(self) -> str:
+        func = self.__func
+        if func is not None:
+            return f'<EventSource {func.__module__}.{func.__qualname__}>'
+        elif self.__name is not None:
+            return f'<EventSource {self.__name}>'
+        else:
+            return super().__repr__()
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.__name = name
+
     def __get__(self, instance: Any, owner: Any = None):
         if instance is None:
-            return owner
-        else:
-            return MethodType(self, instance)
+            return self
+        elif self.__shared:
+            return _SharedEventSource(self, instance)
+        name = self.__name
+        state = getattr(instance, '__dict__', None)
+        if name is not None and state is not None:
+            source = state.get(name)
+            if source is not None and source.__sender is instance:
+                return source
+        return self.__bind(instance)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        # `instance.event += handler` assigns the Event Source it read, an
+        # Event Source cannot otherwise be assigned.
+        if self.__shared:
+            if getattr(value, '__func__', None) is self and getattr(value, '__self__', None) is instance:
+                return
+        elif value is self.__get__(instance):
+            return
+        raise AttributeError(f'Cannot assign to {self!r}')
+
+    def __bind(self, instance: Any) -> EventSource:
+        # instance-scoped Event Sources are created on first access and stored
+        # in the instance `__dict__` under the same name as the descriptor
+        # (which, as a data descriptor, takes precedence over it.) a shallow
+        # copy of the instance (`copy.copy()`) shares the `__dict__` entries
+        # of the original, so a stored Event Source bound to another instance
+        # is replaced.
+        name = self.__name
+        if name is None:
+            name = next((k for t in type(instance).__mro__ for k, v in vars(t).items() if v is self), None)
+        state = getattr(instance, '__dict__', None)
+        if name is None or state is None:
+            raise TypeError(f'Cannot bind an instance-scoped Event Source to {type(instance).__name__!r}, use `shared=True` for classes without `__dict__`.')
+        source = EventSource(None if self.__func is None else MethodType(self.__func, instance), self.__eventargs, max_concurrency=self.__max_concurrency, fanout=self.__fanout)
+        if self.__errors is not None:
+            # each instance counts its own failures
+            source.__errors = self.__errors.copy()
+        source.__name = name
+        source.__bound = True
+        source.__sender = instance
+        if '_EventSource__instrument' in vars(self):
+            source.__instrument = self.__instrument
+        # serialized so that concurrent first-access from multiple threads resolves to a single Event Source
+        with _bind_lock:
+            stored = state.get(name)
+            if stored is not None and stored.__sender is instance:
+                return stored
+            state[name] = source
+            return source
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # a bound Event Source is stored in the instance `__dict__` (see
+        # `__bind`), so it is pickled (and deep-copied) along with the
+        # instance. its Event Handlers are not, it is rebuilt as an empty
+        # Event Source bound to the unpickled instance (and `getattr` binds
+        # it before the instance state is restored, which then stores the
+        # same Event Source.)
+        if not self.__bound:
+            raise TypeError(f'cannot pickle {self!r}')
+        return getattr, (self.__sender, self.__name)
 
     def __iadd__(self, handler: EventHandler | Observable) -> EventSource:
         return self.add_handler(handler)
@@ -56,29 +426,183 @@ class EventSource:
 
     @property
     def has_handlers(self) -> bool:
-        return len(self.__handlers) > 0
+        return len(self.__handlers) > 0 or self.__filters is not None
+
+    @property
+    def instrument(self) -> Optional[Instrument]:
+        """
+        The Instrument which measures dispatches of this Event Source, or `None`.
+
+        ---
+        Assigning `None` removes an Instrument installed for this Event Source, after which the default Instrument (see `set_instrument()`) applies.
+        """
+        return self.__instrument
+
+    @instrument.setter
+    def instrument(self, instrument: Optional[Instrument]) -> None:
+        if instrument is None:
+            vars(self).pop('_EventSource__instrument', None)
+        else:
+            self.__instrument = instrument
+
+    @staticmethod
+    def set_default_instrument(instrument: Optional[Instrument]) -> None:
+        """
+        Install an Instrument for all Event Sources which do not have an Instrument of their own, see `set_instrument()`.
+        """
+        EventSource.__instrument = instrument
 
-    def add_handler(self, handler: EventHandler | Observable) -> EventSource:
-        self.__handlers.add(handler)
+    def add_handler(self, handler: EventHandler | Observable, weak: bool = False, priority: int = 0, executor: Optional[Executor] = None, where: Optional[Mapping[Hashable, Hashable] | Callable[[EventArgs], Any]] = None) -> EventSource:
+        """
+        Add an Event Handler.
+
+        :param EventHandler handler: A callable that accepts two parameters, `sender` and `EventArgs`.
+        :param bool weak: When `True` only a weak reference to the handler is held, and the handler is removed automatically once it is garbage collected.
+        :param int priority: Event Handlers with a higher priority are signaled first, Event Handlers of equal priority are signaled in the order they were added.
+        :param Executor executor: When specified, the Event Handler is submitted to the executor (such as a `ThreadPoolExecutor` or `ProcessPoolExecutor`) instead of being called inline.
+        :param where: When specified, the Event Handler is only signaled for events which match this filter, either a mapping of field names to values (such as `{'color': 'red'}`) or a predicate which accepts the `EventArgs`.
+        ---
+        An Event Handler which returns `True` stops propagation, Event Handlers after it are not signaled. An Event Handler submitted to an executor cannot stop propagation.
+
+        A mapping filter is matched against the raw args of each raise, before `EventArgs` are constructed: each field is read from the kwarg of that name, or from the positional arg of the `EventArgsField` of that name (an int field is a positional index.) Event Handlers filtering on the same fields share a hash index, so a raise only visits the Event Handlers whose values match, and a raise which matches no Event Handler does not construct `EventArgs`. Filtered Event Handlers are signaled after unfiltered Event Handlers.
+
+        The future of an Event Handler submitted to an executor is awaited by `raise_async()`, otherwise exceptions it raises are reported (see `AsyncDispatcher`.) When using a `ProcessPoolExecutor` the Event Handler, `sender` and `EventArgs` must be picklable.
+        """
+        shape: Optional[Callable[..., Any]] = None
+        if executor is not None:
+            if iscoroutinefunction(handler):
+                raise ValueError('Async Event Handlers cannot be submitted to an executor')
+            submit = executor.submit
+            shape = lambda handler, sender, e: submit(handler, sender, e)
+        if where is None:
+            if self.__filters is None or handler not in self.__filters:
+                self.__handlers.add(handler, shape, weak, priority)
+        elif handler not in self.__handlers:
+            filters = self.__filters
+            if filters is None:
+                filters = self.__filters = FilterIndex(self.__create_key_getter)
+            filters.add(handler, where, shape, weak, priority)
         return self
 
     def remove_handler(self, handler: EventHandler | Observable) -> EventSource:
-        self.__handlers.remove(handler)
+        """
+        Remove an Event Handler.
+
+        :param EventHandler handler: An Event Handler that was previously added to this Event Source.
+        """
+        if not self.__handlers.remove(handler):
+            filters = self.__filters
+            if filters is None or not filters.remove(handler):
+                raise KeyError(handler)
+            if len(filters) == 0:
+                # return to the fast path
+                vars(self).pop('_EventSource__filters', None)
         return self
 
+    def raise_later(self, delay: float, *args, **kwargs) -> TimerHandle:
+        """
+        Raise the event after `delay` seconds, returns a TimerHandle which can cancel it.
+
+        ---
+        The event is raised by the TimerWheel of the event loop running on the calling thread, or otherwise by the thread of a TimerWheel shared by callers without an event loop (see `TimerWheel.current()`.)
+        """
+        from .TimerWheel import TimerWheel
+        wheel = TimerWheel.current()
+        return wheel.schedule_at(wheel.time() + delay, lambda: self(*args, **kwargs))
+
+    def raise_at(self, when: float, *args, **kwargs) -> TimerHandle:
+        """
+        Raise the event at `when`, on the clock of `TimerWheel.current()` (`time.monotonic()`, or the `loop.time()` of the running event loop), returns a TimerHandle which can cancel it.
+        """
+        from .TimerWheel import TimerWheel
+        return TimerWheel.current().schedule_at(when, lambda: self(*args, **kwargs))
+
+    def stream(self, maxsize: int = 1024, overflow: str = 'block') -> EventStream[EventArgs]:
+        """
+        Create an EventStream which yields the `EventArgs` of each event raised, for use with `async for`.
+
+        :param int maxsize: The maximum number of buffered events.
+        :param str overflow: The policy applied when the buffer is full, one of `'block'`, `'drop-oldest'`, `'drop-newest'` or `'error'`.
+        ---
+        Must be called on a running event loop, the stream is added as an Event Handler until it is closed.
+        """
+        from .EventStream import EventStream
+
+        def attach(push: Callable[[EventArgs], Any]) -> Callable[[], Any]:
+            handler = lambda sender, e: push(e)
+            self.add_handler(handler)
+            return lambda: self.remove_handler(handler)
+        return EventStream(attach, maxsize, overflow)
+
     def wrap(self, func: MethodType | FunctionType) -> Callable[[Any], Any]:
         self.__func = func
         return self
 
 
-def event(eventargs=None) -> Callable:
+class _SharedEventSource:
+    """
+    A shared Event Source read through an instance, which raises the event with the instance as `sender`.
+
+    ---
+    Handlers added through it are added to the shared Event Source, `stream()` only yields the events raised with the instance as `sender`.
+    """
+
+    __slots__ = ('__func__', '__self__')
+
+    __func__: EventSource
+    __self__: Any
+
+    def __init__(self, source: EventSource, instance: Any):
+        self.__func__ = source
+        self.__self__ = instance
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.__func__(self.__self__, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # `add_handler()`, `has_handlers`, `instrument` and the like are those of the shared Event Source
+        return getattr(self.__func__, name)
+
+    def __iadd__(self, handler: EventHandler | Observable) -> _SharedEventSource:
+        self.__func__.add_handler(handler)
+        return self
+
+    def __isub__(self, handler: EventHandler | Observable) -> _SharedEventSource:
+        self.__func__.remove_handler(handler)
+        return self
+
+    def __repr__(self) -> str:
+        return f'<bound {self.__func__!r} of {self.__self__!r}>'
+
+    async def raise_async(self, *args, **kwargs) -> Any:
+        return await self.__func__.raise_async(self.__self__, *args, **kwargs)
+
+    def raise_later(self, delay: float, *args, **kwargs) -> TimerHandle:
+        return self.__func__.raise_later(delay, self.__self__, *args, **kwargs)
+
+    def raise_at(self, when: float, *args, **kwargs) -> TimerHandle:
+        return self.__func__.raise_at(when, self.__self__, *args, **kwargs)
+
+    def stream(self, maxsize: int = 1024, overflow: str = 'block') -> EventStream[EventArgs]:
+        from .EventStream import EventStream
+        source, instance = self.__func__, self.__self__
+
+        def attach(push: Callable[[EventArgs], Any]) -> Callable[[], Any]:
+            handler = lambda sender, e: push(e) if sender is instance else None
+            source.add_handler(handler)
+            return lambda: source.remove_handler(handler)
+        return EventStream(attach, maxsize, overflow)
+
+
+_bind_lock = threading.Lock()
+
+
+def event(eventargs=None, *, shared: bool = False, max_concurrency: Optional[int] = None, fanout: str = 'task', errors: str | Observable = 'propagate', max_failures: Optional[int] = None) -> Callable:
     global EventSource
-    if eventargs is None:
-        return EventSource
-    elif isinstance(eventargs, MethodType) or isinstance(eventargs, FunctionType):
-        return EventSource(eventargs, EventArgs)
+    if isinstance(eventargs, MethodType) or isinstance(eventargs, FunctionType):
+        return EventSource(eventargs, EventArgs, shared, max_concurrency, fanout, errors, max_failures)
     else:
-        return (EventSource(None, eventargs)).wrap
+        return (EventSource(None, EventArgs if eventargs is None else eventargs, shared, max_concurrency, fanout, errors, max_failures)).wrap
 
 
 __all__ = [
@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Callable, Coroutine, Generic, Optional, TypeVar
+
+
+T = TypeVar('T')
+
+_OVERFLOW_POLICIES = ('block', 'drop-oldest', 'drop-newest', 'error')
+
+
+class EventStream(Generic[T]):
+    """
+    An async iterator over the events raised by an Event Source (or the states of an Observable), buffered in a bounded ring.
+
+    ---
+    A stream is bound to the event loop it was created on, items can be pushed from any thread. When the buffer is full the `overflow` policy applies:
+
+    * `'block'` applies backpressure: `raise_async()`/`notify_async()` (and producers on other threads) wait until the consumer makes room. A synchronous raise on the event loop thread cannot wait, it schedules the wait as a task, and at most `maxsize` such waits may be pending, beyond which the stream ends as it does for `'error'`. Items waiting for room are delivered in the order they were pushed, ahead of any item pushed after them.
+    * `'drop-oldest'` discards the oldest buffered item to make room.
+    * `'drop-newest'` discards the item being pushed.
+    * `'error'` ends the stream, once the buffered items are consumed iteration raises `OverflowError`.
+
+    Discarded items are counted by `dropped`. Closing the stream (`aclose()`, or leaving an `async with` block) detaches it from its source and ends iteration once buffered items are consumed, items waiting for room are discarded.
+    """
+
+    __loop: asyncio.AbstractEventLoop
+    __thread: int
+    __buffer: deque[T]
+    __maxsize: int
+    __overflow: str
+    __getter: Optional[asyncio.Future]
+    __putters: deque[tuple[T, asyncio.Future]]
+    __error: Optional[BaseException]
+    __closed: bool
+    __detach: Optional[Callable[[], Any]]
+    dropped: int
+
+    def __init__(self, attach: Callable[[Callable[[T], Any]], Callable[[], Any]], maxsize: int = 1024, overflow: str = 'block'):
+        """
+        Create an EventStream[T], must be called on a running event loop.
+
+        :param Callable attach: Subscribes a push function to the source of the stream, returns a function which unsubscribes it.
+        :param int maxsize: The maximum number of buffered items.
+        :param str overflow: The policy applied when the buffer is full, one of `'block'`, `'drop-oldest'`, `'drop-newest'` or `'error'`.
+        """
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(f'Unsupported overflow policy {overflow!r}')
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+        self.__loop = asyncio.get_running_loop()
+        self.__thread = threading.get_ident()
+        self.__buffer = deque()
+        self.__maxsize = maxsize
+        self.__overflow = overflow
+        self.__getter = None
+        self.__putters = deque()
+        self.__error = None
+        self.__closed = False
+        self.dropped = 0
+        self.__detach = attach(self.push)
+
+    def __aiter__(self) -> EventStream[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        buffer = self.__buffer
+        while True:
+            if len(buffer) > 0:
+                item = buffer.popleft()
+                self.__wake_putter()
+                return item
+            elif self.__error is not None:
+                raise self.__error
+            elif self.__closed:
+                raise StopAsyncIteration
+            getter = self.__getter = self.__loop.create_future()
+            try:
+                await getter
+            finally:
+                self.__getter = None
+
+    async def __aenter__(self) -> EventStream[T]:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    def __len__(self) -> int:
+        """
+        The number of buffered items.
+        """
+        return len(self.__buffer)
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    def push(self, item: T) -> Optional[Coroutine[Any, Any, None]]:
+        """
+        Push an item into the stream, returns a coroutine when the producer must wait for room (see `'block'`.)
+
+        ---
+        Called by the source of the stream, from any thread.
+        """
+        if threading.get_ident() == self.__thread:
+            return self.__put(item)
+        elif self.__overflow == 'block':
+            # producers on other threads are blocked until the consumer makes room
+            asyncio.run_coroutine_threadsafe(self.__put_async(item), self.__loop).result()
+        else:
+            self.__loop.call_soon_threadsafe(self.__put, item)
+        return None
+
+    async def aclose(self) -> None:
+        """
+        Detach the stream from its source, iteration ends once buffered items are consumed.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Detach the stream from its source, iteration ends once buffered items are consumed.
+        """
+        if self.__closed:
+            return
+        self.__closed = True
+        detach = self.__detach
+        self.__detach = None
+        if detach is not None:
+            detach()
+        self.__wake_getter()
+        while len(self.__putters) > 0:
+            # closing the stream discards the items waiting for room
+            _, putter = self.__putters.popleft()
+            if not putter.done():
+                self.dropped += 1
+                putter.set_result(None)
+
+    def __put(self, item: T, bounded: bool = True) -> Optional[Coroutine[Any, Any, None]]:
+        if self.__closed or self.__error is not None:
+            return None
+        buffer = self.__buffer
+        putters = self.__putters
+        if len(buffer) < self.__maxsize and len(putters) == 0:
+            buffer.append(item)
+            self.__wake_getter()
+            return None
+        overflow = self.__overflow
+        if overflow == 'drop-oldest':
+            buffer.popleft()
+            buffer.append(item)
+            self.dropped += 1
+        elif overflow == 'drop-newest':
+            self.dropped += 1
+        elif overflow == 'error':
+            self.__overflow_error()
+        elif bounded and len(putters) >= self.__maxsize:
+            # a producer which does not wait for the put (a synchronous raise
+            # on the event loop thread) would otherwise park an unbounded
+            # number of items, so parked puts are bounded as the buffer is.
+            self.__overflow_error()
+        else:
+            # the item is queued behind any items already waiting for room,
+            # `__wake_putter` moves them into the buffer in the order pushed.
+            putter = self.__loop.create_future()
+            putters.append((item, putter))
+            return self.__wait_putter(putter)
+        return None
+
+    def __overflow_error(self) -> None:
+        self.dropped += 1
+        self.__error = OverflowError(f'EventStream buffer exceeded maxsize ({self.__maxsize})')
+        self.close()
+
+    async def __wait_putter(self, putter: asyncio.Future) -> None:
+        # cancelling the waiting producer cancels `putter`, which withdraws its item
+        await putter
+
+    async def __put_async(self, item: T) -> None:
+        wait = self.__put(item, bounded=False)
+        if wait is not None:
+            await wait
+
+    def __wake_getter(self) -> None:
+        getter = self.__getter
+        if getter is not None and not getter.done():
+            getter.set_result(None)
+
+    def __wake_putter(self) -> None:
+        buffer = self.__buffer
+        putters = self.__putters
+        while len(putters) > 0 and len(buffer) < self.__maxsize:
+            item, putter = putters.popleft()
+            if not putter.done():
+                buffer.append(item)
+                putter.set_result(None)
+
+
+__all__ = ['EventStream']
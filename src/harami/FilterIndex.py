@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Hashable, Mapping, Optional
+
+from .SubscriberList import SubscriberList
+
+
+Plan = tuple[tuple[Callable[..., Any], bool], ...]
+
+
+class FilterIndex:
+    """
+    The filtered subscribers (Event Handlers or Observers subscribed with `where=`) of a single Event Source or Observable, indexed so that dispatch only visits subscribers whose filter matches.
+
+    ---
+    A `where` mapping of field names (or positional indexes) to values is a key-equality filter. Subscribers filtering on the same fields form a group, a hash table of `SubscriberList` keyed by the values filtered on, so matching costs a single lookup per group no matter how many subscribers it holds. Keys are read from the raw dispatch args by a getter created (once per group) by `create_key_getter`.
+
+    Any other (callable) `where` is a predicate, called with the dispatched value (`EventArgs`, or a state) on every dispatch.
+
+    Like `SubscriberList`, mutations are serialized by a lock and publish new `groups` and `predicates` tuples, dispatchers read them without taking a lock.
+    """
+
+    groups: tuple[tuple[Callable[..., tuple], dict[tuple, SubscriberList]], ...]
+    predicates: tuple[tuple[Callable[[Any], Any], SubscriberList], ...]
+    __create_key_getter: Callable[[tuple[Hashable, ...]], Callable[..., tuple]]
+    __tables: dict[tuple[Hashable, ...], dict[tuple, SubscriberList]]
+    __lock: threading.Lock
+
+    def __init__(self, create_key_getter: Callable[[tuple[Hashable, ...]], Callable[..., tuple]]):
+        """
+        Create a FilterIndex.
+
+        :param Callable create_key_getter: Accepts a tuple of field names (or indexes), returns a function which reads the values of those fields from the raw dispatch args (raising `LookupError`, `AttributeError` or `TypeError` when they are not present.)
+        """
+        self.groups = ()
+        self.predicates = ()
+        self.__create_key_getter = create_key_getter
+        self.__tables = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(subscribers) for subscribers in self.__get_lists())
+
+    def __contains__(self, subscriber: Any) -> bool:
+        return any(subscriber in subscribers for subscribers in self.__get_lists())
+
+    def add(self, subscriber: Callable[..., Any], where: Mapping[Hashable, Hashable] | Callable[[Any], Any], shape: Optional[Callable[..., Any]] = None, weak: bool = False, priority: int = 0) -> bool:
+        """
+        Add a filtered subscriber, returns `False` if the subscriber was already present.
+
+        :param Callable subscriber: The subscriber to add.
+        :param where: A mapping of field names (or indexes) to the values they must equal, or a predicate.
+        ---
+        `shape`, `weak` and `priority` are as for `SubscriberList.add()`.
+        """
+        with self.__lock:
+            if subscriber in self:
+                return False
+            if isinstance(where, Mapping):
+                if len(where) == 0:
+                    raise ValueError('A key-equality filter requires at least one field')
+                # fields are ordered, so that `{'a':1,'b':2}` and `{'b':2,'a':1}` share a group
+                items = sorted(where.items(), key=lambda item: repr(item[0]))
+                fields = tuple(field for field, value in items)
+                key = tuple(value for field, value in items)
+                table = self.__tables.get(fields)
+                if table is None:
+                    table = self.__tables[fields] = {}
+                    self.groups = self.groups + ((self.__create_key_getter(fields), table),)
+                subscribers = table.get(key)
+                if subscribers is None:
+                    subscribers = table[key] = SubscriberList()
+            elif callable(where):
+                subscribers = next((s for predicate, s in self.predicates if predicate is where), None)
+                if subscribers is None:
+                    subscribers = SubscriberList()
+                    self.predicates = self.predicates + ((where, subscribers),)
+            else:
+                raise TypeError(f'Unsupported filter {where!r}, expected a mapping or a callable')
+            return subscribers.add(subscriber, shape, weak, priority)
+
+    def remove(self, subscriber: Any) -> bool:
+        """
+        Remove a filtered subscriber, returns `False` if the subscriber was not present.
+        """
+        with self.__lock:
+            for fields, table in list(self.__tables.items()):
+                for key, subscribers in list(table.items()):
+                    if subscribers.remove(subscriber):
+                        if len(subscribers) == 0:
+                            del table[key]
+                            if len(table) == 0:
+                                del self.__tables[fields]
+                                self.groups = tuple(group for group in self.groups if group[1] is not table)
+                        return True
+            for predicate, subscribers in self.predicates:
+                if subscribers.remove(subscriber):
+                    if len(subscribers) == 0:
+                        self.predicates = tuple(entry for entry in self.predicates if entry[1] is not subscribers)
+                    return True
+            return False
+
+    def match(self, *args: Any) -> tuple[Plan, tuple[Any, ...]]:
+        """
+        Returns the dispatch plan (and subscribers, see `SubscriberList.snapshot`) of the key-equality subscribers which match the raw dispatch args.
+        """
+        plan: Plan = ()
+        subscribers: tuple[Any, ...] = ()
+        for get_key, table in self.groups:
+            try:
+                matched = table.get(get_key(*args))
+            except (LookupError, AttributeError, TypeError):
+                # the fields filtered on are not present (or not hashable)
+                continue
+            if matched is not None:
+                p, s = matched.snapshot
+                plan += p
+                subscribers += s
+        return plan, subscribers
+
+    def evaluate(self, value: Any) -> tuple[Plan, tuple[Any, ...]]:
+        """
+        Returns the dispatch plan (and subscribers) of the predicate subscribers whose predicate is satisfied by `value`.
+        """
+        plan: Plan = ()
+        subscribers: tuple[Any, ...] = ()
+        for predicate, matched in self.predicates:
+            if predicate(value):
+                p, s = matched.snapshot
+                plan += p
+                subscribers += s
+        return plan, subscribers
+
+    def __get_lists(self) -> list[SubscriberList]:
+        return [subscribers for table in list(self.__tables.values()) for subscribers in list(table.values())] + [subscribers for predicate, subscribers in self.predicates]
+
+
+__all__ = ['FilterIndex']
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+
+# each power-of-two range of nanoseconds is divided into this many buckets,
+# bounding the relative error of a reported percentile to 1/16th (~6%.)
+_SUB_BUCKETS = 16
+_SUB_BUCKET_BITS = 4
+
+
+class Histogram:
+    """
+    A log-linear histogram of latencies, recorded with a bounded relative error.
+
+    ---
+    Latencies are recorded in seconds and stored as nanoseconds in sparse buckets, recording costs a few integer operations and a dict update regardless of how many latencies have been recorded.
+    """
+
+    __buckets: dict[int, int]
+    count: int
+    total: float
+    max: float
+
+    def __init__(self):
+        self.__buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed: float) -> None:
+        """
+        Record a latency.
+
+        :param float elapsed: The latency, in seconds.
+        """
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        index = Histogram.__index(int(elapsed * 1_000_000_000))
+        self.__buckets[index] = self.__buckets.get(index, 0) + 1
+
+    @property
+    def mean(self) -> float:
+        """
+        The mean latency (in seconds), or `0.0` if no latencies were recorded.
+        """
+        return 0.0 if self.count == 0 else self.total / self.count
+
+    def percentile(self, p: float) -> float:
+        """
+        The latency (in seconds) at or below which `p` percent of recorded latencies fall, or `0.0` if no latencies were recorded.
+
+        :param float p: The percentile, from 0 to 100.
+        """
+        if self.count == 0:
+            return 0.0
+        threshold = max(1, round(self.count * p / 100))
+        seen = 0
+        for index in sorted(self.__buckets):
+            seen += self.__buckets[index]
+            if seen >= threshold:
+                return min(Histogram.__upper_bound(index) / 1_000_000_000, self.max)
+        return self.max
+
+    @staticmethod
+    def __index(nanoseconds: int) -> int:
+        if nanoseconds < _SUB_BUCKETS:
+            return max(nanoseconds, 0)
+        shift = nanoseconds.bit_length() - _SUB_BUCKET_BITS - 1
+        return ((shift + 1) << _SUB_BUCKET_BITS) + ((nanoseconds >> shift) - _SUB_BUCKETS)
+
+    @staticmethod
+    def __upper_bound(index: int) -> int:
+        if index < _SUB_BUCKETS:
+            return index
+        shift = (index >> _SUB_BUCKET_BITS) - 1
+        return (((index & (_SUB_BUCKETS - 1)) + _SUB_BUCKETS + 1) << shift) - 1
+
+
+__all__ = ['Histogram']
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+
+class Instrument:
+    """
+    Receives measurements of dispatches performed by Event Sources and Observables.
+
+    ---
+    Subclasses override the methods they are interested in, the base implementations do nothing. An Instrument is installed for a single Event Source or Observable via its `instrument` property, or for all of them via `set_instrument()`.
+
+    Uninstrumented dispatch pays for a single attribute test, once an Instrument is installed every subscriber call is timed and reported.
+    """
+
+    def on_subscriber(self, source: Any, subscriber: Any, elapsed: float, exception: Optional[BaseException]) -> None:
+        """
+        Called after each subscriber (an Event Handler or Observer) is called.
+
+        :param source: The Event Source or Observable which called the subscriber.
+        :param subscriber: The subscriber, or for a weak subscriber the `weakref.ref` held for it (which returns `None` once the subscriber is collected.) The same object is passed for every call of a subscriber, so it can be used to identify the subscriber.
+        :param float elapsed: The time (in seconds) taken by the subscriber, async subscribers are measured until they return a coroutine.
+        :param BaseException exception: The exception raised by the subscriber, if any (the exception is propagated after the Instrument is called.)
+        """
+
+    def on_dispatch(self, source: Any, invoked: int, elapsed: float, pending: int) -> None:
+        """
+        Called after an Event Source or Observable has called its subscribers.
+
+        :param source: The Event Source or Observable.
+        :param int invoked: The number of subscribers called.
+        :param float elapsed: The time (in seconds) taken to call all subscribers.
+        :param int pending: The number of async tasks (and executor futures) of the source which are still in-flight or queued.
+        """
+
+
+def set_instrument(instrument: Optional[Instrument]) -> None:
+    """
+    Install an Instrument for all Event Sources and Observables, or uninstall it when `instrument` is `None`.
+
+    ---
+    An Instrument installed for a specific Event Source or Observable (via its `instrument` property) takes precedence.
+    """
+    from .EventSource import EventSource
+    from .Observable import Observable
+    EventSource.set_default_instrument(instrument)
+    Observable.set_default_instrument(instrument)
+
+
+__all__ = ['Instrument', 'set_instrument']
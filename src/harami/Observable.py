@@ -3,28 +3,97 @@
 
 from __future__ import annotations
 
-import asyncio
+import threading
+import time
 from types import MethodType
-from typing import Generic, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Generic, Hashable, Mapping, Optional, TypeVar, cast
 
+from .Awaitables import get_running_loop, iscoroutine, iscoroutinefunction, isfuture
+from .ErrorPolicy import ErrorPolicy
 from .EventArgs import EventArgs
+from .FilterIndex import FilterIndex, Plan
 from .Observer import Observer
+from .SubscriberList import SubscriberList
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+    from .AsyncDispatcher import AsyncDispatcher
+    from .DerivedObservable import DerivedObservable
+    from .EventStream import EventStream
+    from .Instrument import Instrument
+    from .Operators import Stage
+    from .TimerWheel import TimerHandle
 
 
 T = TypeVar('T')
+U = TypeVar('U')
+
+_CO_VARARGS = 0x04
 
 
 class Observable(Generic[T]):
 
-    __observers: set[Observer]
+    __observers: SubscriberList
     __state: T | None
+    __max_concurrency: Optional[int]
+    __fanout: str
+    __dispatcher: Optional[AsyncDispatcher]
+    __coalesce: Optional[str]
+    __flush_interval: Optional[float]
+    __flush_handle: Optional[asyncio.Handle]
+    __pending: Optional[list[T | None]]
+    __pending_lock: Optional[threading.Lock]
+    __distinct: Optional[str]
+    # the default Instrument is a class attribute, and an Instrument installed
+    # for a single Observable is an instance attribute which shadows it, so
+    # either way dispatch pays for a single attribute read.
+    __instrument: Optional[Instrument] = None
+    # filtered Observers (`where=`), an instance attribute only while there
+    # are any, so Observables without them stay on the fast path.
+    __filters: Optional[FilterIndex] = None
+    # told of each state read through `__call__()` (see `Computed`), a class
+    # attribute which remains `None` until a Computed is first evaluated.
+    __tracker: Optional[Callable[[Observable, Any], None]] = None
+    # an instance attribute only when created with an error policy other
+    # than 'propagate' (or with `max_failures`.)
+    __errors: Optional[ErrorPolicy] = None
 
-    def __init__(self):
+    def __init__(self, max_concurrency: Optional[int] = None, coalesce: Optional[str] = None, flush_interval: Optional[float] = None, distinct: Optional[str] = None, fanout: str = 'task', errors: str | Observable = 'propagate', max_failures: Optional[int] = None):
         """
         Create an Observable[T].
+
+        :param int max_concurrency: The maximum number of async Observer tasks in-flight at once, or `None` for no limit.
+        :param str coalesce: `None` (the default) notifies Observers on every state change, `'latest'` defers notification until `flush()` and then notifies Observers of the most-recent state only, `'batch'` defers notification until `flush()` and then notifies Observers with a tuple of all states since the prior flush.
+        :param float flush_interval: When coalescing, the number of seconds after the first deferred state change that `flush()` is called automatically (requires a running event loop, otherwise `flush()` must be called explicitly.)
+        :param str distinct: `None` (the default) notifies Observers of every state assigned, `'identity'` ignores a state which is the current state (`is`), `'equality'` ignores a state which is, or is equal to (`==`), the current state.
+        :param str fanout: How the coroutines returned by async Observers are run, `'task'` (the default) creates a task per coroutine, `'driver'` runs them one at a time in a single task, and `'eager'` starts each task eagerly (Python 3.12 or later), see `AsyncDispatcher`.
+        :param errors: How exceptions raised by Observers are handled, `'propagate'` (the default) propagates the first exception and later Observers are not notified, `'isolate'` notifies every Observer and then propagates the exceptions raised as an `ExceptionGroup`, and an Observable (a dead-letter Observable) notifies every Observer and notifies the Observable of each exception as a `DeadLetter`.
+        :param int max_failures: When specified, an Observer which raises during that many consecutive notifications is detached (a circuit breaker.)
+        ---
+        The initial state is `None`, so with `distinct` assigning `None` before any other state is ignored.
+
+        Error policies apply to exceptions raised by Observers when notified, and to exceptions raised by the coroutines (and futures) awaited by `notify_async()`.
         """
-        self.__observers = set()
+        if coalesce not in (None, 'latest', 'batch'):
+            raise ValueError(f'Unsupported coalesce mode {coalesce!r}')
+        if distinct not in (None, 'identity', 'equality'):
+            raise ValueError(f'Unsupported distinct mode {distinct!r}')
+        if fanout not in ('task', 'driver', 'eager'):
+            raise ValueError(f'Unsupported fanout {fanout!r}')
+        if errors != 'propagate' or max_failures is not None:
+            self.__errors = ErrorPolicy(errors, max_failures)
+        self.__observers = SubscriberList()
         self.__state = None
+        self.__max_concurrency = max_concurrency
+        self.__fanout = fanout
+        self.__dispatcher = None
+        self.__coalesce = coalesce
+        self.__flush_interval = flush_interval
+        self.__flush_handle = None
+        self.__pending = None if coalesce is None else []
+        self.__pending_lock = None if coalesce is None else threading.Lock()
+        self.__distinct = distinct
 
     def __call__(self, *state: Optional[T]) -> T | None:
         if len(state) > 1 and isinstance(state[1], EventArgs):
@@ -34,7 +103,11 @@ class Observable(Generic[T]):
             self.state = state[0]
             return None
         else:
-            return self.state
+            current = self.state
+            tracker = Observable.__tracker
+            if tracker is not None:
+                tracker(self, current)
+            return current
 
     def __iadd__(self, observer: Observer) -> Observable:
         return self.attach(observer)
@@ -53,15 +126,70 @@ class Observable(Generic[T]):
     def state(self, state: T | None) -> None:
         self.notify(state)
 
-    def attach(self, observer: Observer) -> Observable:
+    @property
+    def has_observers(self) -> bool:
+        return len(self.__observers) > 0 or self.__filters is not None
+
+    @property
+    def instrument(self) -> Optional[Instrument]:
+        """
+        The Instrument which measures notifications of this Observable, or `None`.
+
+        ---
+        Assigning `None` removes an Instrument installed for this Observable, after which the default Instrument (see `set_instrument()`) applies.
+        """
+        return self.__instrument
+
+    @instrument.setter
+    def instrument(self, instrument: Optional[Instrument]) -> None:
+        if instrument is None:
+            vars(self).pop('_Observable__instrument', None)
+        else:
+            self.__instrument = instrument
+
+    @staticmethod
+    def set_default_instrument(instrument: Optional[Instrument]) -> None:
+        """
+        Install an Instrument for all Observables which do not have an Instrument of their own, see `set_instrument()`.
+        """
+        Observable.__instrument = instrument
+
+    @staticmethod
+    def _set_tracker(tracker: Optional[Callable[[Observable, Any], None]]) -> None:
+        # NOTE: internal, see `Computed`
+        Observable.__tracker = tracker
+
+    def attach(self, observer: Observer, weak: bool = False, priority: int = 0, executor: Optional[Executor] = None, where: Optional[Mapping[Hashable, Hashable] | Callable[[Any], Any]] = None) -> Observable:
         """
         Attach an Observer.
 
-        :param Observer observer: A callable that accepts two parameters, the first parameter is the value being observed and the second parameter is the prior value.
+        :param Observer observer: A callable that accepts a single parameter, the value being observed.
+        :param bool weak: When `True` only a weak reference to the Observer is held, and the Observer is detached automatically once it is garbage collected.
+        :param int priority: Observers with a higher priority are notified first, Observers of equal priority are notified in the order they were attached.
+        :param Executor executor: When specified, the Observer is submitted to the executor (such as a `ThreadPoolExecutor` or `ProcessPoolExecutor`) instead of being called inline.
+        :param where: When specified, the Observer is only notified of values which match this filter, either a mapping of field names to values (such as `{'color': 'red'}`) or a predicate which accepts the value.
         ---
         If the same Observer is attached multiple times only one subscription is created, and the Observer is only activated once per value change.
+
+        An Observer which returns `True` stops propagation, Observers after it are not notified.
+
+        Observers which accept no parameters are called without the value, and Observers which accept more than one parameter receive `None` for each additional parameter.
+
+        The future of an Observer submitted to an executor is awaited by `notify_async()`, otherwise exceptions it raises are reported (see `AsyncDispatcher`.) An Observer submitted to an executor cannot stop propagation.
+
+        A mapping filter reads each field from the value as a key (when the value is a mapping) or an attribute (an int field is an index.) Observers filtering on the same fields share a hash index, so a notification only visits the Observers whose values match. Filtered Observers are notified after unfiltered Observers.
         """
-        self.__observers.add(observer)
+        if executor is not None and iscoroutinefunction(observer):
+            raise ValueError('Async Observers cannot be submitted to an executor')
+        shape = Observable.__resolve_shape(observer, executor)
+        if where is None:
+            if self.__filters is None or observer not in self.__filters:
+                self.__observers.add(observer, shape, weak, priority)
+        elif observer not in self.__observers:
+            filters = self.__filters
+            if filters is None:
+                filters = self.__filters = FilterIndex(Observable.__create_key_getter)
+            filters.add(observer, where, shape, weak, priority)
         return self
 
     def detach(self, observer: Observer) -> Observable:
@@ -70,41 +198,433 @@ class Observable(Generic[T]):
 
         :param Observer observer: An Observer that was previously attached to this Observable.
         """
-        try:
-            self.__observers.remove(observer)
-        except KeyError:
-            pass
+        if not self.__observers.remove(observer):
+            filters = self.__filters
+            if filters is not None and filters.remove(observer) and len(filters) == 0:
+                # return to the fast path
+                vars(self).pop('_Observable__filters', None)
         return self
 
     def notify(self, state: T | None) -> None:
         """
         Notifies attached Observers of a state change.
+
+        ---
+        When coalescing, the state change is recorded and Observers are not notified until `flush()`.
+
+        When the Observable was created with `distinct`, a state which is unchanged is ignored.
+        """
+        if self.__distinct is not None and self.__is_unchanged(state):
+            return
+        if self.__pending is not None:
+            self.__enqueue(state)
+        else:
+            self.__state = state
+            self.__dispatch(state)
+
+    async def notify_async(self, state: T | None) -> None:
+        """
+        Notifies attached Observers of a state change, and waits for all Observers to complete.
+
+        ---
+        When coalescing, the state change is recorded and all pending state is flushed immediately.
+
+        The first exception raised by an async Observer (or by an Observer submitted to an executor) is propagated to the caller.
+        """
+        if self.__distinct is not None and self.__is_unchanged(state):
+            return
+        if self.__pending is not None:
+            self.__enqueue(state)
+            pending = self.__take_pending()
+            if pending is None:
+                return
+            value = pending[0]
+        else:
+            self.__state = state
+            value = state
+        errors = self.__errors
+        if errors is not None:
+            number, awaiting, failures = self.__dispatch_guarded(errors, value, False)
+            await errors.wait(self, self.__get_dispatcher(), number, awaiting, failures, (value,), self.detach)
+            return
+        elif self.__instrument is not None:
+            awaitables = self.__dispatch_instrumented(value, False)
+        elif self.__filters is not None:
+            awaitables = Observable.__signal(self.__match(value)[0], value)
+        else:
+            awaitables = Observable.__signal(self.__observers.plan, value)
+        if len(awaitables) > 0:
+            await self.__get_dispatcher().wait(awaitables)
+
+    def notify_later(self, delay: float, state: T | None) -> TimerHandle:
+        """
+        Notifies attached Observers of a state change after `delay` seconds, returns a TimerHandle which can cancel it.
+
+        ---
+        Observers are notified by the TimerWheel of the event loop running on the calling thread, or otherwise by the thread of a TimerWheel shared by callers without an event loop (see `TimerWheel.current()`.)
+        """
+        from .TimerWheel import TimerWheel
+        wheel = TimerWheel.current()
+        return wheel.schedule_at(wheel.time() + delay, self.notify, state)
+
+    def notify_at(self, when: float, state: T | None) -> TimerHandle:
+        """
+        Notifies attached Observers of a state change at `when`, on the clock of `TimerWheel.current()` (`time.monotonic()`, or the `loop.time()` of the running event loop), returns a TimerHandle which can cancel it.
+        """
+        from .TimerWheel import TimerWheel
+        return TimerWheel.current().schedule_at(when, self.notify, state)
+
+    def flush(self) -> None:
+        """
+        Notifies attached Observers of pending (coalesced) state changes, if any.
+
+        ---
+        Has no effect unless the Observable was created with `coalesce`.
+        """
+        pending = self.__take_pending()
+        if pending is not None:
+            self.__dispatch(pending[0])
+
+    def pipe(self, *stages: Stage) -> DerivedObservable:
+        """
+        Create a DerivedObservable which derives state from this Observable through a pipeline of stages.
+        """
+        from .DerivedObservable import DerivedObservable
+        return DerivedObservable(self, stages)
+
+    def map(self, transform: Callable[[T], U]) -> DerivedObservable[U]:
+        """
+        Create a DerivedObservable which emits `transform(state)` for each state change.
+        """
+        from . import Operators
+        return self.pipe(Operators.map(transform))
+
+    def filter(self, predicate: Callable[[T], bool]) -> DerivedObservable[T]:
+        """
+        Create a DerivedObservable which emits only the state changes for which `predicate(state)` is truthy.
         """
-        self.__state = state
-        for observer in self.__observers:
-            x = None
-            if hasattr(observer, '__code__'):
-                # best attempt to support non-standard observers:
-                #
-                # 1) observers which accept no args
-                # 2) observers which have more than one arg
-                #
-                # "officially" harami only "supports" single-arg observers.
-                arg_count = observer.__code__.co_argcount
-                if type(observer) is MethodType:
-                    arg_count -= 1
-                args = []
-                if arg_count > 0:
-                    args.append(state)
-                    arg_count -= 1
-                while arg_count > 0:
-                    args.append(None)
-                x = observer(*args)
+        from . import Operators
+        return self.pipe(Operators.filter(predicate))
+
+    def scan(self, accumulator: Callable[[U, T], U], seed: U) -> DerivedObservable[U]:
+        """
+        Create a DerivedObservable which emits `accumulator(acc, state)` for each state change, where `acc` is the prior result (initially `seed`.)
+        """
+        from . import Operators
+        return self.pipe(Operators.scan(accumulator, seed))
+
+    def distinct_until_changed(self) -> DerivedObservable[T]:
+        """
+        Create a DerivedObservable which emits a state change only if the state is not equal to the prior state emitted.
+        """
+        from . import Operators
+        return self.pipe(Operators.distinct_until_changed())
+
+    def take(self, count: int) -> DerivedObservable[T]:
+        """
+        Create a DerivedObservable which emits only the first `count` state changes.
+        """
+        from . import Operators
+        return self.pipe(Operators.take(count))
+
+    def skip(self, count: int) -> DerivedObservable[T]:
+        """
+        Create a DerivedObservable which ignores the first `count` state changes, and emits all state changes thereafter.
+        """
+        from . import Operators
+        return self.pipe(Operators.skip(count))
+
+    def merge(self, *others: Observable) -> DerivedObservable:
+        """
+        Create a DerivedObservable which emits the state changes of this Observable and all `others`.
+        """
+        from . import Operators
+        from .DerivedObservable import DerivedObservable
+        return DerivedObservable((self,) + others, (), Operators.merge())
+
+    def combine_latest(self, *others: Observable) -> DerivedObservable[tuple]:
+        """
+        Create a DerivedObservable which emits a tuple of the most-recent states of this Observable and all `others` whenever any of them change (once each of them has changed at least once.)
+        """
+        from . import Operators
+        from .DerivedObservable import DerivedObservable
+        return DerivedObservable((self,) + others, (), Operators.combine_latest())
+
+    def throttle(self, interval: float) -> DerivedObservable:
+        """
+        Create a DerivedObservable which emits the first state change, and then ignores state changes until `interval` seconds have elapsed.
+
+        :param float interval: The number of seconds to ignore state changes for.
+        ---
+        When an event loop is running, the most-recent ignored state change is emitted once the interval elapses.
+        """
+        from .Operators import throttle
+        return self.pipe(throttle(interval))
+
+    def debounce(self, interval: float) -> DerivedObservable:
+        """
+        Create a DerivedObservable which emits a state change only once `interval` seconds have elapsed without another state change.
+
+        :param float interval: The number of seconds state must remain unchanged.
+        ---
+        Without a running event loop a settled state change is emitted when the next state change occurs.
+        """
+        from .Operators import debounce
+        return self.pipe(debounce(interval))
+
+    def sample(self, interval: float) -> DerivedObservable:
+        """
+        Create a DerivedObservable which emits the most-recent state once every `interval` seconds, if the state changed since the prior sample.
+
+        :param float interval: The number of seconds between samples.
+        """
+        from .Operators import sample
+        return self.pipe(sample(interval))
+
+    def stream(self, maxsize: int = 1024, overflow: str = 'block') -> EventStream[T | None]:
+        """
+        Create an EventStream which yields each state change, for use with `async for`.
+
+        :param int maxsize: The maximum number of buffered state changes.
+        :param str overflow: The policy applied when the buffer is full, one of `'block'`, `'drop-oldest'`, `'drop-newest'` or `'error'`.
+        ---
+        Must be called on a running event loop, the stream is attached until it is closed.
+        """
+        from .EventStream import EventStream
+
+        def attach(push: Callable[[T | None], Any]) -> Callable[[], Any]:
+            self.attach(push)
+            return lambda: self.detach(push)
+        return EventStream(attach, maxsize, overflow)
+
+    def __dispatch(self, value: Any) -> None:
+        if self.__errors is not None:
+            self.__dispatch_guarded(self.__errors, value, True)
+            return
+        elif self.__instrument is not None:
+            self.__dispatch_instrumented(value, True)
+            return
+        elif self.__filters is not None:
+            for x in Observable.__signal(self.__match(value)[0], value):
+                if isfuture(x):
+                    self.__get_dispatcher().track(x)
+                else:
+                    self.__get_dispatcher().schedule(x)
+            return
+        for target, is_async in self.__observers.plan:
+            x = target(value)
+            if x is not None:
+                if x is True:
+                    # an Observer returning `True` stops propagation
+                    break
+                elif is_async or iscoroutine(x):
+                    self.__get_dispatcher().schedule(cast(Coroutine[Any, Any, Any], x))
+                elif isfuture(x):
+                    self.__get_dispatcher().track(x)
+
+    def __dispatch_instrumented(self, value: Any, schedule: bool) -> list[Any]:
+        # notifies observers as `__dispatch` does, measuring each observer.
+        # when `schedule` is `False` the coroutines and futures returned by
+        # observers are returned to the caller instead of being scheduled.
+        instrument = cast('Instrument', self.__instrument)
+        plan, subscribers = self.__observers.snapshot if self.__filters is None else self.__match(value)
+        awaitables: list[Any] = []
+        invoked = 0
+        perf_counter = time.perf_counter
+        start = perf_counter()
+        try:
+            for (target, is_async), subscriber in zip(plan, subscribers):
+                invoked += 1
+                t = perf_counter()
+                try:
+                    x = target(value)
+                except BaseException as ex:
+                    instrument.on_subscriber(self, subscriber, perf_counter() - t, ex)
+                    raise
+                instrument.on_subscriber(self, subscriber, perf_counter() - t, None)
+                if x is not None:
+                    if x is True:
+                        # an Observer returning `True` stops propagation
+                        break
+                    elif is_async or iscoroutine(x):
+                        if schedule:
+                            self.__get_dispatcher().schedule(cast(Coroutine[Any, Any, Any], x))
+                        else:
+                            awaitables.append(x)
+                    elif isfuture(x):
+                        if schedule:
+                            self.__get_dispatcher().track(x)
+                        else:
+                            awaitables.append(x)
+        finally:
+            dispatcher = self.__dispatcher
+            instrument.on_dispatch(self, invoked, perf_counter() - start, 0 if dispatcher is None else len(dispatcher))
+        return awaitables
+
+    def __dispatch_guarded(self, errors: ErrorPolicy, value: Any, schedule: bool) -> tuple[int, list[tuple[Any, Any]], list[Exception]]:
+        # notifies observers as `__dispatch` does, subject to an error policy
+        # (and measuring each observer, when instrumented.) when `schedule` is
+        # `False` the coroutines and futures returned by observers are
+        # returned to the caller instead of being scheduled.
+        plan, subscribers = self.__observers.snapshot if self.__filters is None else self.__match(value)
+        instrument = self.__instrument
+        if instrument is None:
+            number, pending, failures = errors.signal(self, plan, subscribers, (value,), None, self.detach)
+        else:
+            invoked = 0
+            perf_counter = time.perf_counter
+
+            def invoke(target: Callable[..., Any], subscriber: Any) -> Any:
+                nonlocal invoked
+                invoked += 1
+                t = perf_counter()
+                try:
+                    x = target(value)
+                except BaseException as ex:
+                    instrument.on_subscriber(self, subscriber, perf_counter() - t, ex)
+                    raise
+                instrument.on_subscriber(self, subscriber, perf_counter() - t, None)
+                return x
+            start = perf_counter()
+            try:
+                number, pending, failures = errors.signal(self, plan, subscribers, (value,), invoke, self.detach)
+            finally:
+                dispatcher = self.__dispatcher
+                instrument.on_dispatch(self, invoked, perf_counter() - start, 0 if dispatcher is None else len(dispatcher))
+        if schedule:
+            for x, subscriber in pending:
+                if isfuture(x):
+                    self.__get_dispatcher().track(x)
+                else:
+                    self.__get_dispatcher().schedule(x)
+            pending = []
+            ErrorPolicy.check(self, failures)
+        return number, pending, failures
+
+    def __match(self, value: Any) -> tuple[Plan, tuple[Any, ...]]:
+        # the plan (and subscribers) of unfiltered Observers, followed by the filtered Observers matching `value`
+        filters = cast(FilterIndex, self.__filters)
+        plan, subscribers = self.__observers.snapshot
+        matched_plan, matched_subscribers = filters.match(value)
+        plan += matched_plan
+        subscribers += matched_subscribers
+        if len(filters.predicates) > 0:
+            matched_plan, matched_subscribers = filters.evaluate(value)
+            plan += matched_plan
+            subscribers += matched_subscribers
+        return plan, subscribers
+
+    @staticmethod
+    def __signal(plan: Plan, value: Any) -> list[Any]:
+        # notifies observers as `__dispatch` does, returning the coroutines
+        # and futures returned by observers (rather than scheduling them.)
+        awaitables = []
+        for target, is_async in plan:
+            x = target(value)
+            if x is not None:
+                if x is True:
+                    # an Observer returning `True` stops propagation
+                    break
+                elif is_async or iscoroutine(x) or isfuture(x):
+                    awaitables.append(x)
+        return awaitables
+
+    @staticmethod
+    def __create_key_getter(fields: tuple[Hashable, ...]) -> Callable[[Any], tuple]:
+        # reads the values of key-equality filter fields from a value, as keys
+        # of a mapping or as attributes (an int field is an index.)
+        def get_value(value: Any, field: Hashable) -> Any:
+            if isinstance(field, int) or isinstance(value, Mapping):
+                return value[field]
+            return getattr(value, cast(str, field))
+
+        def get_key(value: Any) -> tuple:
+            return tuple(get_value(value, field) for field in fields)
+        return get_key
+
+    def __is_unchanged(self, state: T | None) -> bool:
+        current = self.__state
+        return state is current or (self.__distinct == 'equality' and bool(state == current))
+
+    def __enqueue(self, state: T | None) -> None:
+        with cast(threading.Lock, self.__pending_lock):
+            self.__state = state
+            pending = cast(list[T | None], self.__pending)
+            if self.__coalesce == 'batch' or len(pending) == 0:
+                pending.append(state)
+            else:
+                pending[0] = state
+            if len(pending) > 1 or self.__flush_interval is None or self.__flush_handle is not None:
+                return
+            loop = get_running_loop()
+            if loop is None:
+                # no running loop, `flush()` must be called explicitly
+                return
+            self.__flush_handle = loop.call_later(self.__flush_interval, self.flush)
+
+    def __take_pending(self) -> Optional[tuple[Any]]:
+        # returns a 1-tuple holding the value to deliver, or `None` if there is nothing pending
+        if self.__pending is None:
+            return None
+        with cast(threading.Lock, self.__pending_lock):
+            pending = self.__pending
+            if len(pending) == 0:
+                return None
+            self.__pending = []
+            if self.__flush_handle is not None:
+                self.__flush_handle.cancel()
+                self.__flush_handle = None
+        return (pending[-1],) if self.__coalesce == 'latest' else (tuple(pending),)
+
+    def __get_dispatcher(self) -> AsyncDispatcher:
+        # created on first use, most Observables never see an async observer
+        # (and `asyncio` is not imported until one does.)
+        dispatcher = self.__dispatcher
+        if dispatcher is None:
+            from .AsyncDispatcher import AsyncDispatcher
+            dispatcher = self.__dispatcher = AsyncDispatcher(self.__max_concurrency, self.__fanout)
+        return dispatcher
+
+    @staticmethod
+    def __resolve_shape(observer: Observer, executor: Optional[Executor] = None) -> Optional[Callable[..., Any]]:
+        # best attempt to support non-standard observers:
+        #
+        # 1) observers which accept no args
+        # 2) observers which have more than one arg
+        #
+        # "officially" harami only "supports" single-arg observers, the
+        # calling convention is resolved once here so that `notify()`
+        # only ever calls a pre-bound adapter (`None` when the observer
+        # can be called as-is.)
+        #
+        # observers submitted to an executor are submitted directly (rather
+        # than submitting an adapter), as a `ProcessPoolExecutor` can only
+        # submit callables which can be pickled.
+        code = getattr(observer, '__code__', None)
+        if code is None or (code.co_flags & _CO_VARARGS) != 0:
+            arg_count = 1
+        else:
+            arg_count = code.co_argcount
+            if type(observer) is MethodType:
+                arg_count -= 1
+        if executor is None:
+            if arg_count <= 0:
+                return lambda observer, state: observer()
+            elif arg_count == 1:
+                # plain callables (and varargs functions) are dispatched as-is
+                return None
+            else:
+                padding = (None,) * (arg_count - 1)
+                return lambda observer, state: observer(state, *padding)
+        else:
+            submit = executor.submit
+            if arg_count <= 0:
+                return lambda observer, state: submit(observer)
+            elif arg_count == 1:
+                return lambda observer, state: submit(observer, state)
             else:
-                # brute attempt to dispatch
-                x = observer(state)
-            if x is not None and asyncio.coroutines.iscoroutine(x):
-                asyncio.create_task(x)
+                padding = (None,) * (arg_count - 1)
+                return lambda observer, state: submit(observer, state, *padding)
 
 
 __all__ = ['Observable']
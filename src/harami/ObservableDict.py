@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import itertools
+from typing import Any, Generic, Iterable, Iterator, Mapping, Optional, TypeVar, overload
+
+from .Observable import Observable
+
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+_MISSING: Any = object()
+
+
+class DictDelta(Generic[K, V]):
+    """
+    The changes made to an `ObservableDict` by a single mutation.
+    """
+
+    __slots__ = ('added', 'changed', 'removed')
+
+    added: dict[K, V]
+    changed: dict[K, V]
+    removed: tuple[K, ...]
+
+    def __init__(self, added: dict[K, V], changed: dict[K, V], removed: tuple[K, ...]):
+        """
+        Create a DictDelta.
+
+        :param dict added: The keys added, and their values.
+        :param dict changed: The keys whose values changed, and their new values.
+        :param tuple removed: The keys removed.
+        """
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.removed)
+
+    def __repr__(self) -> str:
+        return f'DictDelta(added={self.added!r}, changed={self.changed!r}, removed={self.removed!r})'
+
+    def apply(self, target: dict[K, V]) -> dict[K, V]:
+        """
+        Apply the changes to `target` (such as a replica of the `ObservableDict`), returns `target`.
+        """
+        target.update(self.added)
+        target.update(self.changed)
+        for key in self.removed:
+            del target[key]
+        return target
+
+
+class ObservableDict(Observable[DictDelta[K, V]], Generic[K, V]):
+    """
+    A mutable mapping which notifies Observers of each change as a `DictDelta`, rather than re-publishing the whole mapping.
+
+    ---
+    Observers can maintain a replica (or an index derived from the mapping) in O(changes) by applying each delta, a late Observer starts from `copy()`. Assigning a value which is, or is equal to, the current value of a key is not a change, and a mutation which changes nothing is not notified.
+
+    The `state` of an ObservableDict is the most-recent delta. An ObservableDict is deliberately not a `collections.abc.Mapping` (which would make it unhashable, and an Observable must be hashable to be used as an Observer.)
+    """
+
+    __data: dict[K, V]
+
+    def __init__(self, initial: Optional[Mapping[K, V] | Iterable[tuple[K, V]]] = None, max_concurrency: Optional[int] = None):
+        """
+        Create an ObservableDict[K, V].
+
+        :param initial: The initial contents (a mapping, or an iterable of key-value pairs), which are not notified.
+        :param int max_concurrency: The maximum number of async Observer tasks in-flight at once, or `None` for no limit.
+        """
+        super().__init__(max_concurrency)
+        self.__data = {} if initial is None else dict(initial)
+
+    def __getitem__(self, key: K) -> V:
+        return self.__data[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        data = self.__data
+        prior = data.get(key, _MISSING)
+        if prior is _MISSING:
+            data[key] = value
+            self.__publish({key: value}, {}, ())
+        elif not ObservableDict.__same(prior, value):
+            data[key] = value
+            self.__publish({}, {key: value}, ())
+
+    def __delitem__(self, key: K) -> None:
+        del self.__data[key]
+        self.__publish({}, {}, (key,))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__data
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self.__data)
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def __repr__(self) -> str:
+        return f'ObservableDict({self.__data!r})'
+
+    @overload
+    def get(self, key: K) -> Optional[V]: ...
+    @overload
+    def get(self, key: K, default: V) -> V: ...
+
+    def get(self, key: K, default: Any = None) -> Any:
+        return self.__data.get(key, default)
+
+    def keys(self) -> Iterable[K]:
+        return self.__data.keys()
+
+    def values(self) -> Iterable[V]:
+        return self.__data.values()
+
+    def items(self) -> Iterable[tuple[K, V]]:
+        return self.__data.items()
+
+    def copy(self) -> dict[K, V]:
+        """
+        A shallow copy of the contents, as a `dict`.
+        """
+        return self.__data.copy()
+
+    def pop(self, key: K, default: Any = _MISSING) -> Any:
+        data = self.__data
+        if key not in data:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = data.pop(key)
+        self.__publish({}, {}, (key,))
+        return value
+
+    def setdefault(self, key: K, default: V) -> V:
+        data = self.__data
+        if key in data:
+            return data[key]
+        data[key] = default
+        self.__publish({key: default}, {}, ())
+        return default
+
+    def update(self, other: Mapping[K, V] | Iterable[tuple[K, V]] = (), **kwargs: V) -> None:
+        """
+        Update the contents from a mapping (or an iterable of key-value pairs), notifying a single delta.
+        """
+        data = self.__data
+        added: dict[K, V] = {}
+        changed: dict[K, V] = {}
+        items = other.items() if isinstance(other, Mapping) else other
+        for key, value in itertools.chain(items, kwargs.items()):
+            prior = data.get(key, _MISSING)
+            if prior is _MISSING or key in added:
+                added[key] = value
+            elif not ObservableDict.__same(prior, value):
+                changed[key] = value
+            data[key] = value
+        self.__publish(added, changed, ())
+
+    def clear(self) -> None:
+        removed = tuple(self.__data)
+        self.__data.clear()
+        self.__publish({}, {}, removed)
+
+    def replace(self, other: Mapping[K, V]) -> DictDelta[K, V]:
+        """
+        Replace the contents with those of `other`, notifying the difference between them as a single delta, returns the delta.
+
+        ---
+        Computing the difference visits every key of both mappings, but Observers only visit the keys which changed.
+        """
+        data = self.__data
+        added: dict[K, V] = {}
+        changed: dict[K, V] = {}
+        for key, value in other.items():
+            prior = data.get(key, _MISSING)
+            if prior is _MISSING:
+                added[key] = value
+            elif not ObservableDict.__same(prior, value):
+                changed[key] = value
+        removed = tuple(key for key in data if key not in other)
+        for key in removed:
+            del data[key]
+        data.update(added)
+        data.update(changed)
+        return self.__publish(added, changed, removed)
+
+    def __publish(self, added: dict[K, V], changed: dict[K, V], removed: tuple[K, ...]) -> DictDelta[K, V]:
+        delta = DictDelta(added, changed, removed)
+        if len(delta) > 0:
+            self.notify(delta)
+        return delta
+
+    @staticmethod
+    def __same(prior: Any, value: Any) -> bool:
+        return prior is value or bool(prior == value)
+
+
+__all__ = ['DictDelta', 'ObservableDict']
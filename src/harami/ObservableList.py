@@ -0,0 +1,248 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from typing import Any, Generic, Iterable, Iterator, Optional, TypeVar, overload
+
+from .Observable import Observable
+
+
+V = TypeVar('V')
+
+Splice = tuple[int, int, tuple[Any, ...]]
+
+
+class ListDelta(Generic[V]):
+    """
+    The changes made to an `ObservableList` by a single mutation, as a sequence of splices.
+
+    ---
+    Each splice is a `(start, stop, items)` tuple, meaning the items in the index range `[start:stop]` were replaced by `items`, so an insertion is a splice where `start == stop`, a removal is a splice without `items`, and a change is a splice where `stop - start == len(items)`. Splices are applied in order, the indexes of each splice are those of the list after the prior splices were applied.
+    """
+
+    __slots__ = ('splices',)
+
+    splices: tuple[Splice, ...]
+
+    def __init__(self, splices: tuple[Splice, ...]):
+        """
+        Create a ListDelta.
+
+        :param tuple splices: The `(start, stop, items)` splices, in order.
+        """
+        self.splices = splices
+
+    def __len__(self) -> int:
+        return len(self.splices)
+
+    def __repr__(self) -> str:
+        return f'ListDelta({self.splices!r})'
+
+    def apply(self, target: list[V]) -> list[V]:
+        """
+        Apply the changes to `target` (such as a replica of the `ObservableList`), returns `target`.
+        """
+        for start, stop, items in self.splices:
+            target[start:stop] = items
+        return target
+
+
+class ObservableList(Observable[ListDelta[V]], Generic[V]):
+    """
+    A mutable sequence which notifies Observers of each change as a `ListDelta`, rather than re-publishing the whole list.
+
+    ---
+    Observers can maintain a replica in O(changes) by applying each delta, a late Observer starts from `copy()`. Assigning an item which is, or is equal to, the item already at that index is not a change, and a mutation which changes nothing is not notified.
+
+    The `state` of an ObservableList is the most-recent delta. An ObservableList is deliberately not a `collections.abc.MutableSequence`, whose `+=` would conflict with attaching an Observer.
+    """
+
+    __data: list[V]
+
+    def __init__(self, initial: Optional[Iterable[V]] = None, max_concurrency: Optional[int] = None):
+        """
+        Create an ObservableList[V].
+
+        :param Iterable initial: The initial contents, which are not notified.
+        :param int max_concurrency: The maximum number of async Observer tasks in-flight at once, or `None` for no limit.
+        """
+        super().__init__(max_concurrency)
+        self.__data = [] if initial is None else list(initial)
+
+    @overload
+    def __getitem__(self, index: int) -> V: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[V]: ...
+
+    def __getitem__(self, index: int | slice) -> V | list[V]:
+        return self.__data[index]
+
+    @overload
+    def __setitem__(self, index: int, value: V) -> None: ...
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[V]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        data = self.__data
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(data))
+            items = tuple(value)
+            if step == 1:
+                stop = max(start, stop)
+                data[start:stop] = items
+                self.__publish(((start, stop, items),))
+            else:
+                # an extended slice is the same length as `items` (or raises)
+                prior = data[index]
+                data[index] = items
+                self.__publish(tuple((i, i + 1, (item,)) for i, old, item in zip(range(start, stop, step), prior, items) if not ObservableList.__same(old, item)))
+        else:
+            i = ObservableList.__index(index, len(data))
+            if not ObservableList.__same(data[i], value):
+                data[i] = value
+                self.__publish(((i, i + 1, (value,)),))
+
+    def __delitem__(self, index: int | slice) -> None:
+        data = self.__data
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(data))
+            indexes = range(start, stop, step)
+            if len(indexes) == 0:
+                return
+            del data[index]
+            if step == 1:
+                self.__publish(((start, stop, ()),))
+            else:
+                # removed from the highest index down, so the indexes of later splices are unaffected
+                self.__publish(tuple((i, i + 1, ()) for i in sorted(indexes, reverse=True)))
+        else:
+            i = ObservableList.__index(index, len(data))
+            del data[i]
+            self.__publish(((i, i + 1, ()),))
+
+    def __contains__(self, value: object) -> bool:
+        return value in self.__data
+
+    def __iter__(self) -> Iterator[V]:
+        return iter(self.__data)
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def __repr__(self) -> str:
+        return f'ObservableList({self.__data!r})'
+
+    def index(self, value: V, *args: int) -> int:
+        return self.__data.index(value, *args)
+
+    def count(self, value: V) -> int:
+        return self.__data.count(value)
+
+    def copy(self) -> list[V]:
+        """
+        A shallow copy of the contents, as a `list`.
+        """
+        return self.__data.copy()
+
+    def append(self, value: V) -> None:
+        n = len(self.__data)
+        self.__data.append(value)
+        self.__publish(((n, n, (value,)),))
+
+    def extend(self, values: Iterable[V]) -> None:
+        items = tuple(values)
+        if len(items) > 0:
+            n = len(self.__data)
+            self.__data.extend(items)
+            self.__publish(((n, n, items),))
+
+    def insert(self, index: int, value: V) -> None:
+        n = len(self.__data)
+        # clamped, as for `list.insert()`
+        i = max(0, min(n, index + n if index < 0 else index))
+        self.__data.insert(i, value)
+        self.__publish(((i, i, (value,)),))
+
+    def pop(self, index: int = -1) -> V:
+        data = self.__data
+        if len(data) == 0:
+            raise IndexError('pop from empty list')
+        i = ObservableList.__index(index, len(data))
+        value = data.pop(i)
+        self.__publish(((i, i + 1, ()),))
+        return value
+
+    def remove(self, value: V) -> None:
+        del self[self.__data.index(value)]
+
+    def clear(self) -> None:
+        n = len(self.__data)
+        if n > 0:
+            self.__data.clear()
+            self.__publish(((0, n, ()),))
+
+    def sort(self, *, key: Any = None, reverse: bool = False) -> ListDelta[V]:
+        """
+        Sort the contents in place, notifying the items moved (see `replace()`.)
+        """
+        return self.replace(sorted(self.__data, key=key, reverse=reverse))
+
+    def reverse(self) -> ListDelta[V]:
+        """
+        Reverse the contents in place, notifying the items moved (see `replace()`.)
+        """
+        return self.replace(self.__data[::-1])
+
+    def replace(self, other: Iterable[V]) -> ListDelta[V]:
+        """
+        Replace the contents with those of `other`, notifying the difference between them as a single delta, returns the delta.
+
+        ---
+        The common prefix and suffix of the old and new contents are not changes. When the remainder is the same length in both, each run of changed items is a splice, otherwise the remainder is a single splice.
+        """
+        old = self.__data
+        new = list(other)
+        end = min(len(old), len(new))
+        start = 0
+        while start < end and ObservableList.__same(old[start], new[start]):
+            start += 1
+        old_stop = len(old)
+        new_stop = len(new)
+        while old_stop > start and new_stop > start and ObservableList.__same(old[old_stop - 1], new[new_stop - 1]):
+            old_stop -= 1
+            new_stop -= 1
+        splices: list[Splice] = []
+        if old_stop - start == new_stop - start:
+            run = -1
+            for i in range(start, old_stop + 1):
+                if i < old_stop and not ObservableList.__same(old[i], new[i]):
+                    if run < 0:
+                        run = i
+                elif run >= 0:
+                    splices.append((run, i, tuple(new[run:i])))
+                    run = -1
+        else:
+            splices.append((start, old_stop, tuple(new[start:new_stop])))
+        self.__data = new
+        return self.__publish(tuple(splices))
+
+    def __publish(self, splices: tuple[Splice, ...]) -> ListDelta[V]:
+        delta: ListDelta[V] = ListDelta(splices)
+        if len(splices) > 0:
+            self.notify(delta)
+        return delta
+
+    @staticmethod
+    def __index(index: int, length: int) -> int:
+        i = index + length if index < 0 else index
+        if i < 0 or i >= length:
+            raise IndexError('list index out of range')
+        return i
+
+    @staticmethod
+    def __same(prior: Any, value: Any) -> bool:
+        return prior is value or bool(prior == value)
+
+
+__all__ = ['ListDelta', 'ObservableList']
@@ -4,7 +4,7 @@
 from typing import Any, Callable, Coroutine, TypeAlias, Union
 
 
-Observer: TypeAlias = Callable[[Any], Union[None, Coroutine[Any, Any, None]]]   # noqa: N801
+Observer: TypeAlias = Callable[[Any], Union[None, bool, Coroutine[Any, Any, None]]]   # noqa: N801
 
 
 __all__ = ['Observer']
@@ -0,0 +1,316 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# Stage factories for `DerivedObservable`, see `Observable.pipe()`.
+#
+# A stage is a factory which accepts a downstream callable (`emit`) and
+# returns an upstream callable (`on_next`.) Stages which are instances of
+# `Fragment` are "fusable": when a DerivedObservable connects, each run of
+# consecutive fragments is compiled into a single function (rather than
+# one nested call per stage.)
+#
+# Rate-limiting stages use `loop.call_later()` when an event loop is
+# running on the calling thread, otherwise they fall back to decisions
+# made against a monotonic clock as each upstream value arrives.
+#
+
+from __future__ import annotations
+
+import functools
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, TypeAlias
+
+from .Awaitables import get_running_loop
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+Stage: TypeAlias = Callable[[Callable[[Any], Any]], Callable[[Any], Any]]
+
+Join: TypeAlias = Callable[[Callable[[Any], Any], int], tuple[Callable[[Any], Any], ...]]
+
+_UNSET = object()
+_STATELESS = object()
+
+
+class Fragment:
+    """
+    A fusable stage, described by a snippet of Python source.
+
+    ---
+    Within `template` the name `value` refers to the current value, `{a}` refers to `arg` and `{s}` refers to a variable holding the state of the stage (initialized from `state`.) A fragment drops a value by executing `return None`.
+    """
+
+    template: tuple[str, ...]
+    arg: Any
+    state: Any
+
+    def __init__(self, template: tuple[str, ...], arg: Any, state: Any = _STATELESS):
+        self.template = template
+        self.arg = arg
+        self.state = state
+
+    def __call__(self, emit: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        return _fuse((self,), emit)
+
+
+def compose(stages: Sequence[Stage], emit: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Compose stages into a single callable which calls `emit`.
+    """
+    sink = emit
+    run: list[Fragment] = []
+    for stage in reversed(stages):
+        if isinstance(stage, Fragment):
+            run.insert(0, stage)
+            continue
+        if len(run) > 0:
+            sink = _fuse(tuple(run), sink)
+            run.clear()
+        sink = stage(sink)
+    if len(run) > 0:
+        sink = _fuse(tuple(run), sink)
+    return sink
+
+
+def _fuse(fragments: tuple[Fragment, ...], emit: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    factory = _compile(tuple(f.template for f in fragments), tuple(f.state is not _STATELESS for f in fragments))
+    args: list[Any] = [emit]
+    for f in fragments:
+        args.append(f.arg)
+        if f.state is not _STATELESS:
+            args.append(f.state)
+    return factory(*args)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(templates: tuple[tuple[str, ...], ...], stateful: tuple[bool, ...]) -> Callable[..., Callable[[Any], Any]]:
+    # generates (and caches) a factory of the form:
+    #
+    #   def factory(emit, a0, a1, i1, ...):
+    #       s1 = i1
+    #       def on_next(value):
+    #           nonlocal s1
+    #           ...fragment 0...
+    #           ...fragment 1...
+    #           return emit(value)
+    #       return on_next
+    #
+    params = ['emit']
+    states: list[str] = []
+    body: list[str] = []
+    for i, template in enumerate(templates):
+        params.append(f'a{i}')
+        if stateful[i]:
+            params.append(f'i{i}')
+            states.append(f's{i}')
+        body.extend('        ' + line.format(a=f'a{i}', s=f's{i}') for line in template)
+    source = [f'def factory({", ".join(params)}):']
+    source.extend(f'    s{n[1:]} = i{n[1:]}' for n in states)
+    source.append('    def on_next(value):')
+    if len(states) > 0:
+        source.append(f'        nonlocal {", ".join(states)}')
+    source.extend(body)
+    source.append('        return emit(value)')
+    source.append('    return on_next')
+    namespace: dict[str, Any] = {}
+    exec(compile('\n'.join(source), '<harami-fused-stages>', 'exec'), namespace)
+    return namespace['factory']
+
+
+def map(transform: Callable[[Any], Any]) -> Stage:
+    """
+    Emit `transform(value)` for each value.
+    """
+    return Fragment(('value = {a}(value)',), transform)
+
+
+def filter(predicate: Callable[[Any], bool]) -> Stage:
+    """
+    Emit only the values for which `predicate(value)` is truthy.
+    """
+    return Fragment(('if not {a}(value):', '    return None'), predicate)
+
+
+def scan(accumulator: Callable[[Any, Any], Any], seed: Any) -> Stage:
+    """
+    Emit `accumulator(acc, value)` for each value, where `acc` is the prior result (initially `seed`.)
+    """
+    return Fragment(('{s} = {a}({s}, value)', 'value = {s}'), accumulator, seed)
+
+
+def distinct_until_changed() -> Stage:
+    """
+    Emit a value only if it is not equal to the prior value emitted.
+    """
+    return Fragment(('if {s} is not {a} and {s} == value:', '    return None', '{s} = value'), _UNSET, _UNSET)
+
+
+def take(count: int) -> Stage:
+    """
+    Emit only the first `count` values.
+    """
+    return Fragment(('if {s} >= {a}:', '    return None', '{s} += 1'), count, 0)
+
+
+def skip(count: int) -> Stage:
+    """
+    Ignore the first `count` values, emit all values thereafter.
+    """
+    return Fragment(('if {s} < {a}:', '    {s} += 1', '    return None'), count, 0)
+
+
+def merge() -> Join:
+    """
+    Join upstream Observables, emitting each value from any upstream Observable.
+    """
+    def join(emit: Callable[[Any], Any], count: int) -> tuple[Callable[[Any], Any], ...]:
+        return (emit,) * count
+    return join
+
+
+def combine_latest() -> Join:
+    """
+    Join upstream Observables, emitting a tuple of the most-recent value of each upstream Observable (once every upstream Observable has emitted at least one value.)
+    """
+    def join(emit: Callable[[Any], Any], count: int) -> tuple[Callable[[Any], Any], ...]:
+        latest: list[Any] = [_UNSET] * count
+        missing = count
+
+        def create_on_next(index: int) -> Callable[[Any], Any]:
+            def on_next(value: Any) -> Any:
+                nonlocal missing
+                if latest[index] is _UNSET:
+                    missing -= 1
+                latest[index] = value
+                return None if missing > 0 else emit(tuple(latest))
+            return on_next
+        return tuple(create_on_next(i) for i in range(count))
+    return join
+
+
+def throttle(interval: float) -> Stage:
+    """
+    Emit the first value, then ignore values until `interval` seconds have elapsed.
+
+    ---
+    When an event loop is running the most-recent ignored value (if any) is emitted once the interval elapses, without an event loop ignored values are dropped.
+    """
+    def stage(emit: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        last = float('-inf')
+        handle: Optional[asyncio.TimerHandle] = None
+        trailing: list[Any] = []
+
+        def on_trailing() -> None:
+            nonlocal last, handle
+            handle = None
+            last = time.monotonic()
+            emit(trailing.pop())
+
+        def on_next(value: Any) -> None:
+            nonlocal last, handle
+            now = time.monotonic()
+            if handle is None and now - last >= interval:
+                last = now
+                emit(value)
+                return
+            trailing[:] = [value]
+            if handle is None:
+                loop = get_running_loop()
+                if loop is not None:
+                    handle = loop.call_later(last + interval - now, on_trailing)
+                else:
+                    trailing.clear()
+        return on_next
+    return stage
+
+
+def debounce(interval: float) -> Stage:
+    """
+    Emit a value only once `interval` seconds have elapsed without another value arriving.
+
+    ---
+    Without an event loop a settled value is emitted when the next value arrives (or never, if no further value arrives.)
+    """
+    def stage(emit: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        last = float('-inf')
+        handle: Optional[asyncio.TimerHandle] = None
+        pending: list[Any] = []
+
+        def on_settled() -> None:
+            nonlocal handle
+            handle = None
+            emit(pending.pop())
+
+        def on_next(value: Any) -> None:
+            nonlocal last, handle
+            now = time.monotonic()
+            if handle is not None:
+                handle.cancel()
+                handle = None
+            loop = get_running_loop()
+            if loop is not None:
+                pending[:] = [value]
+                handle = loop.call_later(interval, on_settled)
+            else:
+                if len(pending) > 0 and now - last >= interval:
+                    emit(pending.pop())
+                pending[:] = [value]
+            last = now
+        return on_next
+    return stage
+
+
+def sample(interval: float) -> Stage:
+    """
+    Emit the most-recent value once every `interval` seconds, but only if a value arrived since the prior sample.
+
+    ---
+    Without an event loop a sample is taken when a value arrives after the current sample period has elapsed.
+    """
+    def stage(emit: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        deadline = float('-inf')
+        handle: Optional[asyncio.TimerHandle] = None
+        pending: list[Any] = []
+
+        def on_tick() -> None:
+            nonlocal handle
+            handle = None
+            if len(pending) > 0:
+                emit(pending.pop())
+
+        def on_next(value: Any) -> None:
+            nonlocal deadline, handle
+            pending[:] = [value]
+            if handle is not None:
+                return
+            loop = get_running_loop()
+            if loop is not None:
+                handle = loop.call_later(interval, on_tick)
+                return
+            now = time.monotonic()
+            if now >= deadline:
+                deadline = now + interval
+                emit(pending.pop())
+        return on_next
+    return stage
+
+
+__all__ = [
+    'Fragment',
+    'Join',
+    'Stage',
+    'combine_latest',
+    'compose',
+    'debounce',
+    'distinct_until_changed',
+    'filter',
+    'map',
+    'merge',
+    'sample',
+    'scan',
+    'skip',
+    'take',
+    'throttle'
+]
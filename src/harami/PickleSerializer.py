@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import pickle
+from typing import Any, Sequence
+
+
+class PickleSerializer:
+    """
+    Serializes objects using pickle protocol 5, large contiguous buffers (such as `bytearray` or numpy arrays) are emitted out-of-band instead of being copied into the pickle stream.
+
+    ---
+    Any object exposing conforming `dumps()` and `loads()` methods can be used in place of a `PickleSerializer`.
+    """
+
+    __min_buffer_size: int
+
+    def __init__(self, min_buffer_size: int = 4096):
+        """
+        Create a PickleSerializer.
+
+        :param int min_buffer_size: Buffers smaller than this (in bytes) are serialized in-band.
+        """
+        self.__min_buffer_size = min_buffer_size
+
+    def dumps(self, obj: Any) -> tuple[bytes, list[memoryview]]:
+        """
+        Serialize `obj`, returns the pickle stream and a list of out-of-band buffers.
+        """
+        buffers: list[memoryview] = []
+
+        def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+            view = buffer.raw()
+            if view.nbytes < self.__min_buffer_size:
+                # returning a truthy value serializes the buffer in-band
+                return True
+            buffers.append(view)
+            return False
+        return pickle.dumps(obj, protocol=5, buffer_callback=buffer_callback), buffers
+
+    def loads(self, data: bytes | memoryview, buffers: Sequence[bytearray | memoryview]) -> Any:
+        """
+        Deserialize an object from a pickle stream and its out-of-band buffers.
+        """
+        return pickle.loads(data, buffers=buffers)
+
+
+__all__ = ['PickleSerializer']
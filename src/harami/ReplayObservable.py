@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterator, Mapping, Optional, TypeVar
+
+from .Observable import Observable
+from .Observer import Observer
+from .SegmentLog import SegmentLog
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+T = TypeVar('T')
+
+
+class ReplayObservable(Observable[T]):
+    """
+    An Observable which records its most-recent state changes, and replays them to Observers as they are attached.
+
+    ---
+    State changes are recorded in a ring of the last `capacity` states, each assigned an offset (its sequence number.) When a `SegmentLog` is specified every state change is also appended to the log, so history older than the ring (including history recorded by a prior process) can be replayed from any offset the log retains. A ReplayObservable created with an existing log resumes from it, its ring and `state` are restored from the most-recent records.
+
+    To record the events raised by an Event Source add the ReplayObservable as an Event Handler (`source += replay`), the `EventArgs` of each event is then recorded as a state change.
+    """
+
+    __history: deque[T | None]
+    __offset: int
+    __log: Optional[SegmentLog]
+
+    def __init__(self, capacity: int = 1024, log: Optional[SegmentLog] = None, max_concurrency: Optional[int] = None):
+        """
+        Create a ReplayObservable[T].
+
+        :param int capacity: The number of most-recent state changes recorded in memory.
+        :param SegmentLog log: When specified, every state change is also appended to this log.
+        :param int max_concurrency: The maximum number of async Observer tasks in-flight at once, or `None` for no limit.
+        """
+        super().__init__(max_concurrency)
+        self.__history = deque(maxlen=capacity)
+        self.__log = log
+        if log is None:
+            self.__offset = 0
+        else:
+            self.__offset = log.next_offset
+            self.__history.extend(state for offset, state in log.read(self.__offset - capacity))
+            if len(self.__history) > 0:
+                # restores `state`, nothing is attached yet so nothing is notified
+                super().notify(self.__history[-1])
+
+    @property
+    def log(self) -> Optional[SegmentLog]:
+        return self.__log
+
+    @property
+    def first_offset(self) -> int:
+        """
+        The offset of the oldest state change which can be replayed.
+        """
+        return self.__offset - len(self.__history) if self.__log is None else self.__log.first_offset
+
+    @property
+    def next_offset(self) -> int:
+        """
+        The offset which will be assigned to the next state change.
+        """
+        return self.__offset
+
+    def attach(self, observer: Observer, weak: bool = False, priority: int = 0, executor: Optional[Executor] = None, where: Optional[Mapping[Hashable, Hashable] | Callable[[Any], Any]] = None, replay: bool = True) -> Observable:
+        """
+        Attach an Observer, see `Observable.attach()`.
+
+        :param bool replay: When `True` (the default) the Observer is first notified of the state changes recorded in memory, oldest first.
+        """
+        if replay:
+            self.replay(observer, None, executor, where)
+        return super().attach(observer, weak, priority, executor, where)
+
+    def history(self, offset: Optional[int] = None) -> Iterator[tuple[int, T | None]]:
+        """
+        Iterate `(offset, state)` for each recorded state change from `offset`, oldest first.
+
+        :param int offset: The offset of the first state change, `None` for the oldest state change recorded in memory. State changes older than the ring are read from the log (when there is one.)
+        """
+        end_offset = self.__offset
+        history = tuple(self.__history)
+        ring_offset = end_offset - len(history)
+        if offset is None:
+            offset = ring_offset
+        elif offset < ring_offset and self.__log is not None:
+            for entry in self.__log.read(offset):
+                if entry[0] >= ring_offset:
+                    break
+                yield entry
+            offset = ring_offset
+        for i in range(max(offset, ring_offset) - ring_offset, len(history)):
+            yield ring_offset + i, history[i]
+
+    def replay(self, observer: Observer, offset: Optional[int] = None, executor: Optional[Executor] = None, where: Optional[Mapping[Hashable, Hashable] | Callable[[Any], Any]] = None) -> None:
+        """
+        Notify an Observer of recorded state changes from `offset` (see `history()`), without attaching it.
+
+        ---
+        Async Observers are awaited one state change at a time, in order.
+        """
+        # a private Observable with a concurrency of one delivers the replay,
+        # so non-standard Observers, async Observers and executors are all
+        # handled exactly as they are when notified of a live state change.
+        replayer: Observable[T] = Observable(max_concurrency=1)
+        replayer.attach(observer, executor=executor, where=where)
+        for entry_offset, state in self.history(offset):
+            replayer.notify(state)
+
+    def notify(self, state: T | None) -> None:
+        self.__record(state)
+        super().notify(state)
+
+    async def notify_async(self, state: T | None) -> None:
+        self.__record(state)
+        await super().notify_async(state)
+
+    def __record(self, state: T | None) -> None:
+        log = self.__log
+        if log is not None:
+            log.append(state)
+        self.__history.append(state)
+        self.__offset += 1
+
+
+__all__ = ['ReplayObservable']
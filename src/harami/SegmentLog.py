@@ -0,0 +1,245 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from typing import Any, Iterator, Optional
+
+from .PickleSerializer import PickleSerializer
+
+
+# a log is a directory of fixed-size segment files, each named for the
+# offset of its first record (`00000000000000000000.seg`). segment files
+# are created at full size (zero-filled) and records are appended through
+# a memory map:
+#
+#   record: u32 record length (including this header, padded to 8 bytes), u32 payload length, u32 buffer count, u32 reserved,
+#           u32 buffer length (x buffer count), payload, buffers
+#
+# a record length of zero marks the end of the records in a segment, so
+# the write position of a segment is recovered by scanning its records.
+_RECORD = struct.Struct('<IIII')
+_LENGTH = struct.Struct('<I')
+_SUFFIX = '.seg'
+
+
+class SegmentLog:
+    """
+    An append-only log of values stored in fixed-size, memory-mapped segment files on local disk.
+
+    ---
+    Each value appended is assigned an offset (its sequence number, starting from zero), and `read()` iterates the values from any offset still retained. Records are written to and read from memory maps, so neither appending nor reading costs a file syscall per record. Written records are visible to readers immediately, and durable once `flush()` (or `close()`) writes them to disk.
+
+    Opening an existing log resumes appending after its last record.
+    """
+
+    __path: str
+    __segment_size: int
+    __serializer: Any
+    __max_segments: Optional[int]
+    __segments: list[int]
+    __mmap: Optional[mmap.mmap]
+    __position: int
+    __next_offset: int
+    __lock: threading.Lock
+
+    def __init__(self, path: str, segment_size: int = 1 << 24, serializer: Any = None, max_segments: Optional[int] = None):
+        """
+        Create (or open) a SegmentLog.
+
+        :param str path: The directory which holds the segment files, created if it does not exist.
+        :param int segment_size: The size (in bytes) of each segment file, a single record cannot exceed this.
+        :param serializer: The serializer used for values, defaults to a `PickleSerializer`.
+        :param int max_segments: The maximum number of segment files retained, the oldest segment is deleted when a new segment would exceed this. `None` (the default) retains all segments.
+        """
+        if max_segments is not None and max_segments < 1:
+            raise ValueError('max_segments must be a positive integer')
+        self.__path = path
+        self.__segment_size = segment_size
+        self.__serializer = PickleSerializer() if serializer is None else serializer
+        self.__max_segments = max_segments
+        self.__lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self.__segments = sorted(int(name[:-len(_SUFFIX)]) for name in os.listdir(path) if name.endswith(_SUFFIX))
+        if len(self.__segments) == 0:
+            self.__mmap = self.__create_segment(0)
+            self.__segments.append(0)
+            self.__position = 0
+            self.__next_offset = 0
+        else:
+            first_offset = self.__segments[-1]
+            self.__mmap = self.__open_segment(first_offset, mmap.ACCESS_WRITE)
+            count, self.__position = SegmentLog.__scan(self.__mmap)
+            self.__next_offset = first_offset + count
+
+    def __enter__(self) -> SegmentLog:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        The number of values retained.
+        """
+        return self.next_offset - self.first_offset
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def first_offset(self) -> int:
+        """
+        The offset of the oldest value retained.
+        """
+        return self.__segments[0]
+
+    @property
+    def next_offset(self) -> int:
+        """
+        The offset which will be assigned to the next value appended.
+        """
+        return self.__next_offset
+
+    def append(self, value: Any) -> int:
+        """
+        Append a value to the log, returns the offset assigned to it.
+        """
+        data, buffers = self.__serializer.dumps(value)
+        header_length = _RECORD.size + (_LENGTH.size * len(buffers))
+        length = (header_length + len(data) + sum(b.nbytes for b in buffers) + 7) & ~7
+        if length > self.__segment_size:
+            raise ValueError(f'A record of {length} bytes exceeds the segment size ({self.__segment_size} bytes.)')
+        with self.__lock:
+            buf = self.__mmap
+            if buf is None:
+                raise ValueError('The log is closed')
+            position = self.__position
+            if position + length > self.__segment_size:
+                buf = self.__roll()
+                position = 0
+            o = position + _RECORD.size
+            for b in buffers:
+                _LENGTH.pack_into(buf, o, b.nbytes)
+                o += _LENGTH.size
+            buf[o:o + len(data)] = data
+            o += len(data)
+            for b in buffers:
+                buf[o:o + b.nbytes] = b.cast('B')
+                o += b.nbytes
+            # the record length is written last, it is what makes the record visible to readers
+            _RECORD.pack_into(buf, position, length, len(data), len(buffers), 0)
+            self.__position = position + length
+            offset = self.__next_offset
+            self.__next_offset = offset + 1
+            return offset
+
+    def flush(self) -> None:
+        """
+        Write appended records to disk.
+        """
+        with self.__lock:
+            if self.__mmap is not None:
+                self.__mmap.flush()
+
+    def read(self, offset: int = 0) -> Iterator[tuple[int, Any]]:
+        """
+        Iterate `(offset, value)` for each value from `offset` until the most-recent value appended (as of calling `read()`.)
+
+        :param int offset: The offset of the first value, when older than `first_offset` iteration starts from `first_offset`.
+        """
+        with self.__lock:
+            segments = list(self.__segments)
+            end_offset = self.__next_offset
+        for i, first_offset in enumerate(segments):
+            last_offset = segments[i + 1] if i + 1 < len(segments) else end_offset
+            if last_offset <= offset:
+                continue
+            try:
+                buf = self.__open_segment(first_offset, mmap.ACCESS_READ)
+            except FileNotFoundError:
+                # deleted by retention since `read()` was called
+                continue
+            try:
+                yield from self.__read_segment(buf, first_offset, max(offset, first_offset), last_offset)
+            finally:
+                buf.close()
+
+    def close(self) -> None:
+        """
+        Flush appended records to disk, and close the log.
+        """
+        with self.__lock:
+            buf = self.__mmap
+            self.__mmap = None
+            if buf is not None:
+                buf.flush()
+                buf.close()
+
+    def __read_segment(self, buf: mmap.mmap, offset: int, start_offset: int, end_offset: int) -> Iterator[tuple[int, Any]]:
+        o = 0
+        while offset < end_offset:
+            length, data_length, buffer_count, reserved = _RECORD.unpack_from(buf, o)
+            if offset >= start_offset:
+                lengths = struct.unpack_from(f'<{buffer_count}I', buf, o + _RECORD.size)
+                p = o + _RECORD.size + (_LENGTH.size * buffer_count)
+                # out-of-band buffers are copied, they must outlive the memory map
+                with memoryview(buf) as view, view[p:p + data_length] as data:
+                    p += data_length
+                    buffers = []
+                    for n in lengths:
+                        buffers.append(bytearray(view[p:p + n]))
+                        p += n
+                    value = self.__serializer.loads(data, buffers)
+                yield offset, value
+            o += length
+            offset += 1
+
+    def __roll(self) -> mmap.mmap:
+        # NOTE: caller must hold `__lock`
+        buf = self.__mmap
+        if buf is not None:
+            buf.flush()
+            buf.close()
+        first_offset = self.__next_offset
+        buf = self.__mmap = self.__create_segment(first_offset)
+        self.__segments.append(first_offset)
+        self.__position = 0
+        max_segments = self.__max_segments
+        while max_segments is not None and len(self.__segments) > max_segments:
+            os.remove(self.__get_filename(self.__segments.pop(0)))
+        return buf
+
+    def __create_segment(self, first_offset: int) -> mmap.mmap:
+        with open(self.__get_filename(first_offset), 'w+b') as f:
+            f.truncate(self.__segment_size)
+            return mmap.mmap(f.fileno(), self.__segment_size, access=mmap.ACCESS_WRITE)
+
+    def __open_segment(self, first_offset: int, access: int) -> mmap.mmap:
+        with open(self.__get_filename(first_offset), 'r+b' if access == mmap.ACCESS_WRITE else 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=access)
+
+    def __get_filename(self, first_offset: int) -> str:
+        return os.path.join(self.__path, f'{first_offset:020d}{_SUFFIX}')
+
+    @staticmethod
+    def __scan(buf: mmap.mmap) -> tuple[int, int]:
+        # returns the number of records in a segment, and the position after the last record
+        count = 0
+        o = 0
+        size = len(buf)
+        while o + _RECORD.size <= size:
+            length = _RECORD.unpack_from(buf, o)[0]
+            if length == 0:
+                break
+            o += length
+            count += 1
+        return count, o
+
+
+__all__ = ['SegmentLog']
@@ -0,0 +1,339 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import struct
+import threading
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional, cast
+
+from .EventArgs import EventArgs
+from .EventSource import EventSource
+from .PickleSerializer import PickleSerializer
+
+
+# shared memory layout:
+#
+#   [0..8)       write position (u64, total bytes ever written to the ring)
+#   [8..16)      reserve position (u64, the write position once the frame being written is complete)
+#   [16..24)     last position (u64, the position of the most-recently written frame)
+#   [64..64+n)   ring of `n` bytes (`capacity`)
+#
+# the ring holds frames, each frame is one flushed batch of messages:
+#
+#   frame:   u32 frame length (including this header, padded to 8 bytes), u32 message count, u32 origin pid, u32 reserved
+#   message: u32 payload length, u32 buffer count, u32 buffer length (x buffer count), payload, buffers
+#
+# when a frame does not fit before the end of the ring a wrap marker (a
+# frame length of `_WRAP`) is written and the frame starts at offset 0.
+_HEADER_SIZE = 64
+_POSITION = struct.Struct('<Q')
+_RESERVE_OFFSET = 8
+_LAST_OFFSET = 16
+_FRAME = struct.Struct('<IIII')
+_MESSAGE = struct.Struct('<II')
+_LENGTH = struct.Struct('<I')
+_WRAP = 0xFFFFFFFF
+
+
+class SharedMemoryBus:
+    """
+    Delivers events between processes on a single host through a shared-memory ring buffer.
+
+    ---
+    Messages published by any process are delivered to every process (a broadcast.) Publishing is batched, messages are buffered locally until `flush()` is called, each flush writes a single frame to the ring. Receiving processes call `poll()` to raise the Event Sources returned by `channel()` for each received message.
+
+    The bus is shared with other processes by passing it to them when they are created (for example as an arg to `multiprocessing.Process` or a pool initializer), the child process attaches to the same shared memory and lock.
+
+    Readers never block writers, a reader which falls behind by more than `capacity` bytes skips ahead to the most-recent frame (and counts the skipped frames in `overruns`.)
+    """
+
+    __shm: SharedMemory
+    __buf: memoryview
+    __owner: bool
+    __capacity: int
+    __lock: Any
+    __serializer: Any
+    __echo: bool
+    __pid: int
+    __read_position: int
+    __pending: list[tuple[bytes, list[memoryview]]]
+    __pending_size: int
+    __flush_threshold: int
+    __channels: dict[str, EventSource]
+    __exports: dict[tuple[int, str], Any]
+    __local_lock: threading.Lock
+    overruns: int
+
+    def __init__(self, capacity: int = 1 << 22, serializer: Any = None, flush_threshold: int = 1 << 16, echo: bool = False, name: Optional[str] = None, context: Any = None):
+        """
+        Create a SharedMemoryBus.
+
+        :param int capacity: The size of the ring (in bytes), rounded up to a multiple of 8.
+        :param serializer: The serializer used for event args, defaults to a `PickleSerializer`.
+        :param int flush_threshold: Pending messages are flushed automatically before their combined size (in bytes) would exceed this threshold, at most half of `capacity`.
+        :param bool echo: When `True`, messages published by this process are also delivered to this process.
+        :param str name: The name of the shared memory block, a unique name is generated by default.
+        :param context: The `multiprocessing` context used to create the lock shared by writers, it must match the context used to start processes.
+        """
+        capacity = (capacity + 7) & ~7
+        self.__shm = SharedMemory(name=name, create=True, size=_HEADER_SIZE + capacity)
+        self.__buf = cast(memoryview, self.__shm.buf)
+        self.__owner = True
+        self.__capacity = capacity
+        self.__lock = (multiprocessing if context is None else context).Lock()
+        self.__serializer = PickleSerializer() if serializer is None else serializer
+        self.__flush_threshold = min(flush_threshold, capacity // 2)
+        self.__echo = echo
+        _POSITION.pack_into(self.__buf, 0, 0)
+        _POSITION.pack_into(self.__buf, _RESERVE_OFFSET, 0)
+        _POSITION.pack_into(self.__buf, _LAST_OFFSET, 0)
+        self.__init_local()
+
+    def __init_local(self) -> None:
+        self.__pid = os.getpid()
+        self.__read_position = self.__get_write_position()
+        self.__pending = []
+        self.__pending_size = 0
+        self.__channels = {}
+        self.__exports = {}
+        self.__local_lock = threading.Lock()
+        self.overruns = 0
+        if hasattr(os, 'register_at_fork'):
+            ref = weakref.ref(self)
+            os.register_at_fork(after_in_child=lambda: SharedMemoryBus.__after_fork(ref()))
+
+    def __after_fork(self: Optional[SharedMemoryBus]) -> None:
+        # a forked child inherits the read position and channels of its
+        # parent, but neither its pending messages nor ownership of the
+        # shared memory.
+        if self is not None:
+            self.__owner = False
+            self.__pid = os.getpid()
+            self.__pending = []
+            self.__pending_size = 0
+            self.__local_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # only reachable while spawning a process (the lock refuses to be pickled otherwise)
+        return {
+            'name': self.__shm.name,
+            'capacity': self.__capacity,
+            'lock': self.__lock,
+            'serializer': self.__serializer,
+            'flush_threshold': self.__flush_threshold,
+            'echo': self.__echo,
+            # the receiving process sees every message published after the bus was sent to it
+            'position': self.__get_write_position()
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__shm = SharedMemory(name=state['name'], create=False)
+        self.__buf = cast(memoryview, self.__shm.buf)
+        self.__owner = False
+        self.__capacity = state['capacity']
+        self.__lock = state['lock']
+        self.__serializer = state['serializer']
+        self.__flush_threshold = state['flush_threshold']
+        self.__echo = state['echo']
+        self.__init_local()
+        self.__read_position = state['position']
+
+    def __enter__(self) -> SharedMemoryBus:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the shared memory block.
+        """
+        return self.__shm.name
+
+    def channel(self, name: str, eventargs: type = EventArgs) -> EventSource:
+        """
+        Get the Event Source raised for messages received on a channel.
+
+        :param str name: The channel name.
+        :param type eventargs: The `EventArgs` type constructed when the Event Source is raised.
+        ---
+        The `sender` of received events is the SharedMemoryBus.
+        """
+        source = self.__channels.get(name)
+        if source is None:
+            source = self.__channels.setdefault(name, EventSource(None, eventargs))
+        return source
+
+    def export(self, source: EventSource, channel: str) -> SharedMemoryBus:
+        """
+        Publish every event raised by an Event Source to a channel.
+
+        :param EventSource source: The Event Source to export.
+        :param str channel: The channel name.
+        ---
+        Only `EventArgs.args` and `EventArgs.kwargs` are published, the `sender` is not.
+        """
+        def handler(sender: object, e: EventArgs) -> None:
+            self.publish(channel, *e.args, **e.kwargs)
+        self.__exports[(id(source), channel)] = handler
+        source.add_handler(handler)
+        return self
+
+    def unexport(self, source: EventSource, channel: str) -> SharedMemoryBus:
+        """
+        Stop publishing the events raised by an Event Source to a channel.
+        """
+        handler = self.__exports.pop((id(source), channel), None)
+        if handler is not None:
+            source.remove_handler(handler)
+        return self
+
+    def publish(self, channel: str, *args, **kwargs) -> None:
+        """
+        Publish a message, it is buffered until the next `flush()`.
+
+        ---
+        Raises `ValueError` if the message can never fit in the ring.
+        """
+        data, buffers = self.__serializer.dumps((channel, args, kwargs))
+        size = _MESSAGE.size + (_LENGTH.size * len(buffers)) + len(data) + sum(b.nbytes for b in buffers)
+        if (_FRAME.size + size + 7) & ~7 > self.__capacity:
+            raise ValueError(f'A message of {size} bytes exceeds the capacity of the ring ({self.__capacity} bytes.)')
+        if self.__pending_size + size > self.__flush_threshold:
+            self.flush()
+        with self.__local_lock:
+            self.__pending.append((data, buffers))
+            self.__pending_size += size
+
+    def flush(self) -> None:
+        """
+        Write all pending messages to the ring, as a single frame.
+        """
+        with self.__local_lock:
+            pending = self.__pending
+            size = self.__pending_size
+            if len(pending) == 0:
+                return
+            frame_length = (_FRAME.size + size + 7) & ~7
+            if frame_length > self.__capacity:
+                # the batch remains pending
+                raise ValueError(f'A batch of {frame_length} bytes exceeds the capacity of the ring ({self.__capacity} bytes.)')
+            self.__pending = []
+            self.__pending_size = 0
+        buf = self.__buf
+        with self.__lock:
+            position = _POSITION.unpack_from(buf, 0)[0]
+            offset = position % self.__capacity
+            if offset + frame_length > self.__capacity:
+                _LENGTH.pack_into(buf, _HEADER_SIZE + offset, _WRAP)
+                position += self.__capacity - offset
+                offset = 0
+            # readers validate what they read against the reserve position, as the frame may overwrite what they are reading
+            _POSITION.pack_into(buf, _RESERVE_OFFSET, position + frame_length)
+            o = _HEADER_SIZE + offset
+            _FRAME.pack_into(buf, o, frame_length, len(pending), self.__pid, 0)
+            o += _FRAME.size
+            for data, buffers in pending:
+                _MESSAGE.pack_into(buf, o, len(data), len(buffers))
+                o += _MESSAGE.size
+                for b in buffers:
+                    _LENGTH.pack_into(buf, o, b.nbytes)
+                    o += _LENGTH.size
+                buf[o:o + len(data)] = data
+                o += len(data)
+                for b in buffers:
+                    buf[o:o + b.nbytes] = b.cast('B')
+                    o += b.nbytes
+            # publishing the new write position makes the frame visible to readers
+            _POSITION.pack_into(buf, _LAST_OFFSET, position)
+            _POSITION.pack_into(buf, 0, position + frame_length)
+
+    def poll(self) -> int:
+        """
+        Receive all messages written since the prior `poll()`, raising the corresponding channel Event Sources.
+
+        ---
+        Returns the number of messages received.
+        """
+        received = 0
+        buf = self.__buf
+        capacity = self.__capacity
+        while True:
+            write_position = self.__get_write_position()
+            position = self.__read_position
+            if position == write_position:
+                return received
+            if write_position - position > capacity:
+                # lapped by a writer, skip ahead to the most-recent frame
+                self.overruns += 1
+                self.__read_position = _POSITION.unpack_from(buf, _LAST_OFFSET)[0]
+                continue
+            offset = position % capacity
+            length = _LENGTH.unpack_from(buf, _HEADER_SIZE + offset)[0]
+            if length == _WRAP:
+                self.__read_position = position + capacity - offset
+                continue
+            frame = bytearray(buf[_HEADER_SIZE + offset:_HEADER_SIZE + offset + length]) if length <= capacity - offset else None
+            if frame is None or _POSITION.unpack_from(buf, _RESERVE_OFFSET)[0] - position > capacity:
+                # the frame was overwritten while it was being copied
+                self.overruns += 1
+                self.__read_position = _POSITION.unpack_from(buf, _LAST_OFFSET)[0]
+                continue
+            self.__read_position = position + length
+            for channel, args, kwargs in self.__read_frame(frame):
+                received += 1
+                source = self.__channels.get(channel)
+                if source is not None:
+                    source(self, *args, **kwargs)
+
+    def close(self) -> None:
+        """
+        Flush pending messages, and detach from the shared memory (the process which created the bus also destroys the shared memory.)
+        """
+        self.flush()
+        self.__shm.close()
+        if self.__owner:
+            self.__shm.unlink()
+
+    def __get_write_position(self) -> int:
+        # re-read until two consecutive reads agree, guarding against a torn read
+        buf = self.__buf
+        position = _POSITION.unpack_from(buf, 0)[0]
+        while True:
+            confirmed = _POSITION.unpack_from(buf, 0)[0]
+            if confirmed == position:
+                return position
+            position = confirmed
+
+    def __read_frame(self, frame: bytearray) -> list[Any]:
+        frame_length, count, pid, reserved = _FRAME.unpack_from(frame, 0)
+        if pid == self.__pid and not self.__echo:
+            return []
+        # the frame was copied out of shared memory (the ring is eventually
+        # overwritten), payloads and out-of-band buffers are views of that
+        # copy rather than being copied again.
+        view = memoryview(frame)
+        o = _FRAME.size
+        messages = []
+        for i in range(count):
+            data_length, buffer_count = _MESSAGE.unpack_from(frame, o)
+            o += _MESSAGE.size
+            lengths = struct.unpack_from(f'<{buffer_count}I', frame, o)
+            o += _LENGTH.size * buffer_count
+            data = view[o:o + data_length]
+            o += data_length
+            buffers = []
+            for length in lengths:
+                buffers.append(view[o:o + length])
+                o += length
+            messages.append(self.__serializer.loads(data, buffers))
+        return messages
+
+
+__all__ = ['SharedMemoryBus']
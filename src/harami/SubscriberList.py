@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import threading
+import weakref
+from types import MethodType
+from typing import Any, Callable, Hashable, Optional
+
+from .Awaitables import iscoroutinefunction
+
+
+class SubscriberList:
+    """
+    An insertion-ordered collection of subscribers (Event Handlers or Observers), published to dispatchers as an immutable dispatch plan.
+
+    ---
+    The dispatch plan is a tuple of `(target, is_async)` pairs, where `target` is the callable to invoke and `is_async` indicates the subscriber is a coroutine function. The plan is only rebuilt when subscribers are added or removed. Subscribers are ordered by priority (highest first), and subscribers of equal priority are ordered by insertion.
+
+    `snapshot` pairs the plan with a parallel tuple of the subscribers themselves (a weak reference, for weak subscribers), it is only read by instrumented dispatch.
+
+    Mutations are serialized by a lock and publish a new plan (copy-on-write), dispatchers read `plan` without taking a lock. It is safe to add or remove subscribers from any thread, including from within a subscriber while a dispatch is in progress (the in-progress dispatch completes using the plan it started with.)
+    """
+
+    plan: tuple[tuple[Callable[..., Any], bool], ...]
+    snapshot: tuple[tuple[tuple[Callable[..., Any], bool], ...], tuple[Any, ...]]
+    __entries: dict[Hashable, tuple[Callable[..., Any], bool, Optional[weakref.ref], int]]
+    __dead: int
+    __collected: list[tuple[Hashable, weakref.ref]]
+    __lock: threading.Lock
+
+    def __init__(self):
+        self.plan = ()
+        self.snapshot = ((), ())
+        self.__entries = {}
+        self.__dead = 0
+        self.__collected = []
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, subscriber: Any) -> bool:
+        return subscriber in self.__entries or SubscriberList.__weak_key(subscriber) in self.__entries
+
+    def add(self, subscriber: Callable[..., Any], shape: Optional[Callable[..., Any]] = None, weak: bool = False, priority: int = 0) -> bool:
+        """
+        Add a subscriber, returns `False` if the subscriber was already present.
+
+        :param Callable subscriber: The subscriber to add.
+        :param Callable shape: An optional adapter, called as `shape(subscriber, *args)`, which adapts dispatch args to the calling convention of the subscriber.
+        :param bool weak: When `True` only a weak reference to the subscriber is held, and the subscription is removed automatically once the subscriber is garbage collected.
+        :param int priority: Subscribers with a higher priority are dispatched first.
+        """
+        is_async = iscoroutinefunction(subscriber)
+        with self.__lock:
+            try:
+                if subscriber in self:
+                    return False
+                if weak:
+                    key = SubscriberList.__weak_key(subscriber)
+                    ref = self.__create_weakref(key, subscriber)
+                    self.__entries[key] = (SubscriberList.__create_weak_target(ref, shape), is_async, ref, priority)
+                else:
+                    target = subscriber if shape is None else MethodType(shape, subscriber)
+                    self.__entries[subscriber] = (target, is_async, None, priority)
+                self.__rebuild()
+                return True
+            finally:
+                self.__prune()
+
+    def remove(self, subscriber: Any) -> bool:
+        """
+        Remove a subscriber, returns `False` if the subscriber was not present.
+        """
+        with self.__lock:
+            try:
+                entry = self.__entries.pop(subscriber, None)
+                if entry is None:
+                    entry = self.__entries.pop(SubscriberList.__weak_key(subscriber), None)
+                    if entry is None:
+                        return False
+                self.__rebuild()
+                return True
+            finally:
+                self.__prune()
+
+    def __rebuild(self) -> None:
+        self.__dead = 0
+        entries = list(self.__entries.items())
+        if any(entry[3] != 0 for key, entry in entries):
+            # sorting is stable, insertion order is preserved for equal priorities
+            entries.sort(key=lambda item: -item[1][3])
+        plan = tuple((target, is_async) for key, (target, is_async, ref, priority) in entries)
+        self.snapshot = (plan, tuple(key if ref is None else ref for key, (target, is_async, ref, priority) in entries))
+        self.plan = plan
+
+    def __prune(self) -> None:
+        # NOTE: caller must hold `__lock`
+        rebuild = False
+        while len(self.__collected) > 0:
+            key, ref = self.__collected.pop()
+            entry = self.__entries.get(key)
+            if entry is not None and entry[2] is ref:
+                del self.__entries[key]
+                self.__dead += 1
+                rebuild = True
+        if rebuild and self.__dead * 2 >= len(self.plan):
+            self.__rebuild()
+
+    def __create_weakref(self, key: Hashable, subscriber: Callable[..., Any]) -> weakref.ref:
+        # dead subscribers are removed from `__entries` by the finalizer
+        # callback, but the plan is only rebuilt once enough of it is dead
+        # (amortizing the rebuild across many collections.) until then a
+        # dead target is a no-op, dispatch never has to check liveness.
+        #
+        # finalizers can run on any thread, and at any point (including
+        # while this thread holds `__lock`), so they never block: if the
+        # lock is held the current holder prunes before releasing it.
+        def collected(ref: weakref.ref) -> None:
+            self.__collected.append((key, ref))
+            if self.__lock.acquire(blocking=False):
+                try:
+                    self.__prune()
+                finally:
+                    self.__lock.release()
+        if type(subscriber) is MethodType:
+            return weakref.WeakMethod(subscriber, collected)
+        else:
+            return weakref.ref(subscriber, collected)
+
+    @staticmethod
+    def __create_weak_target(ref: weakref.ref, shape: Optional[Callable[..., Any]]) -> Callable[..., Any]:
+        if shape is None:
+            def call(*args: Any) -> Any:
+                subscriber = ref()
+                return None if subscriber is None else subscriber(*args)
+        else:
+            def call(*args: Any) -> Any:
+                subscriber = ref()
+                return None if subscriber is None else shape(subscriber, *args)
+        return call
+
+    @staticmethod
+    def __weak_key(subscriber: Any) -> Hashable:
+        # weak subscriptions are keyed by identity, a key which holds no
+        # reference to the subscriber (and remains stable for its lifetime.)
+        if type(subscriber) is MethodType:
+            return (id(subscriber.__self__), id(subscriber.__func__))
+        else:
+            return (id(subscriber),)
+
+
+__all__ = ['SubscriberList']
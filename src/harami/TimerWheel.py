@@ -0,0 +1,381 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# A hierarchical timer wheel, which backs `EventSource.raise_later()` and
+# `Observable.notify_later()` (and their `_at` variants.)
+#
+# Time is divided into ticks of `resolution` seconds, the wheel has
+# `_LEVELS` levels of `_SLOTS` slots, and a slot of level `L` spans
+# `_SLOTS ** L` ticks. A timer is placed in the lowest level at which its
+# expiry shares a slot of the level above with the current tick, so that
+# its slot is always ahead of the current slot of its level. Reaching the
+# first tick of a slot of level `L > 0` "cascades" its timers into lower
+# levels. Inserting and cancelling a timer touches a single slot (a dict),
+# and a timer is cascaded at most `_LEVELS - 1` times.
+#
+
+from __future__ import annotations
+
+import math
+import sys
+import threading
+import time
+import traceback
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from .Awaitables import get_running_loop
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+_BITS = 8
+_SLOTS = 1 << _BITS
+_MASK = _SLOTS - 1
+_LEVELS = 4
+
+
+class TimerHandle:
+    """
+    A callback scheduled on a `TimerWheel`, which can be cancelled until it runs.
+    """
+
+    __slots__ = ('_wheel', '_when', '_tick', '_level', '_slot', '_callback', '_args')
+
+    _wheel: TimerWheel
+    _when: float
+    _tick: int
+    _level: int
+    _slot: Optional[dict[TimerHandle, None]]
+    _callback: Callable[..., Any]
+    _args: tuple[Any, ...]
+
+    def __init__(self, wheel: TimerWheel, when: float, callback: Callable[..., Any], args: tuple[Any, ...]):
+        self._wheel = wheel
+        self._when = when
+        self._tick = 0
+        self._level = 0
+        self._slot = None
+        self._callback = callback
+        self._args = args
+
+    def __repr__(self) -> str:
+        return f'<TimerHandle when={self._when} {"pending" if self.pending else "done"}>'
+
+    @property
+    def when(self) -> float:
+        """
+        The time the callback was scheduled to run at, on the clock of the TimerWheel (see `TimerWheel.time()`.)
+        """
+        return self._when
+
+    @property
+    def pending(self) -> bool:
+        """
+        `True` until the callback runs or is cancelled.
+        """
+        return self._slot is not None
+
+    def cancel(self) -> bool:
+        """
+        Cancel the callback, returns `False` if it already ran (or was already cancelled.)
+        """
+        return self._wheel.cancel(self)
+
+
+class TimerWheel:
+    """
+    Schedules callbacks to run at a given time, backed by a hierarchical timer wheel.
+
+    ---
+    Scheduling and cancelling a callback are O(1), no matter how many callbacks are pending, and callbacks which expire together run as a batch. Callbacks never run early, and run up to one `resolution` late (plus the latency of whatever advances the wheel.) Callbacks expiring in earlier ticks run first.
+
+    A TimerWheel created with `loop` is advanced by a single `loop.call_at()` wakeup (rather than one per callback) and runs callbacks on the loop, it must only be used from the thread running the loop. A TimerWheel created with `thread=True` is advanced by a dedicated daemon thread (started when the first callback is scheduled), which runs callbacks. Otherwise the wheel is only advanced by calling `advance()`.
+
+    `TimerWheel.current()` returns the TimerWheel of the event loop running on the calling thread, or a TimerWheel (with a thread) shared by callers without an event loop.
+    """
+
+    __resolution: float
+    __clock: Callable[[], float]
+    __origin: float
+    __tick: int
+    __wheel: list[list[dict[TimerHandle, None]]]
+    __counts: list[int]
+    __lock: threading.Lock
+    __loop: Optional[weakref.ref[asyncio.AbstractEventLoop]]
+    __wakeup: Optional[weakref.ref[asyncio.TimerHandle]]
+    __wakeup_tick: Optional[int]
+    __condition: Optional[threading.Condition]
+    __thread: Optional[threading.Thread]
+    __closed: bool
+    __default: Optional[TimerWheel] = None
+    __loop_wheels: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, TimerWheel] = weakref.WeakKeyDictionary()
+    __current_lock = threading.Lock()
+
+    def __init__(self, resolution: float = 0.001, loop: Optional[asyncio.AbstractEventLoop] = None, thread: bool = False):
+        """
+        Create a TimerWheel.
+
+        :param float resolution: The length of a tick, in seconds.
+        :param loop: When specified, the event loop which advances the wheel and runs callbacks.
+        :param bool thread: When `True`, the wheel is advanced by a dedicated thread which runs callbacks.
+        """
+        if resolution <= 0:
+            raise ValueError('resolution must be positive')
+        if loop is not None and thread:
+            raise ValueError('A TimerWheel cannot be advanced by both an event loop and a thread')
+        self.__resolution = resolution
+        # the wheel holds a weak reference to the loop, so that the wheel
+        # (held by `current()` for as long as the loop lives) never keeps it
+        # alive. this includes the clock (rather than the bound `loop.time`)
+        # and the loop wakeup (see `__arm`.)
+        self.__loop = None if loop is None else weakref.ref(loop)
+        self.__clock = time.monotonic if self.__loop is None else self.__loop_time
+        self.__origin = self.__clock()
+        self.__tick = 0
+        self.__wheel = [[{} for i in range(_SLOTS)] for level in range(_LEVELS)]
+        self.__counts = [0] * _LEVELS
+        self.__lock = threading.Lock()
+        self.__wakeup = None
+        self.__wakeup_tick = None
+        self.__condition = threading.Condition(self.__lock) if thread else None
+        self.__thread = None
+        self.__closed = False
+
+    def __len__(self) -> int:
+        return sum(self.__counts)
+
+    @property
+    def resolution(self) -> float:
+        return self.__resolution
+
+    @staticmethod
+    def current() -> TimerWheel:
+        """
+        Returns the TimerWheel of the event loop running on the calling thread, or the TimerWheel shared by callers without an event loop.
+        """
+        loop = get_running_loop()
+        if loop is None:
+            wheel = TimerWheel.__default
+            if wheel is None:
+                with TimerWheel.__current_lock:
+                    wheel = TimerWheel.__default
+                    if wheel is None:
+                        wheel = TimerWheel.__default = TimerWheel(thread=True)
+            return wheel
+        wheel = TimerWheel.__loop_wheels.get(loop)
+        if wheel is None:
+            wheel = TimerWheel.__loop_wheels[loop] = TimerWheel(loop=loop)
+        return wheel
+
+    def time(self) -> float:
+        """
+        The current time, on the clock used by the wheel (`loop.time()`, or `time.monotonic()`.)
+        """
+        return self.__clock()
+
+    def schedule_at(self, when: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """
+        Schedule `callback(*args)` to run at `when`, on the clock of the wheel (see `time()`), returns a TimerHandle which can cancel it.
+        """
+        handle = TimerHandle(self, when, callback, args)
+        tick = math.ceil((when - self.__origin) / self.__resolution)
+        with self.__lock:
+            if self.__closed:
+                raise RuntimeError('TimerWheel is closed')
+            base = self.__tick
+            if tick <= base:
+                # a callback scheduled for a tick already advanced past runs on the next
+                tick = base + 1
+            self.__place(handle, tick, base)
+            wakeup = self.__wakeup_tick
+            if wakeup is None or tick < wakeup:
+                self.__arm(tick)
+        return handle
+
+    def schedule_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """
+        Schedule `callback(*args)` to run after `delay` seconds, returns a TimerHandle which can cancel it.
+        """
+        return self.schedule_at(self.__clock() + delay, callback, *args)
+
+    def cancel(self, handle: TimerHandle) -> bool:
+        """
+        Cancel a scheduled callback, returns `False` if it already ran (or was already cancelled.)
+        """
+        with self.__lock:
+            slot = handle._slot
+            if slot is None:
+                return False
+            del slot[handle]
+            handle._slot = None
+            self.__counts[handle._level] -= 1
+            return True
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """
+        Advance the wheel to `now` (by default the current time), running the callbacks which expired, returns the number of callbacks run.
+        """
+        target = math.floor(((self.__clock() if now is None else now) - self.__origin) / self.__resolution)
+        expired: list[TimerHandle] = []
+        with self.__lock:
+            wheel = self.__wheel
+            counts = self.__counts
+            while self.__tick < target:
+                tick = self.__next_tick()
+                if tick is None or tick > target:
+                    # nothing expires (or cascades) before the target
+                    self.__tick = target
+                    break
+                self.__tick = tick
+                if tick & _MASK == 0:
+                    # cascade from the highest level starting a slot at this tick,
+                    # as it may cascade into the (then starting) slot of the level below
+                    for level in range(_LEVELS - 1, 0, -1):
+                        if tick & ((1 << (_BITS * level)) - 1) == 0:
+                            self.__cascade(level, (tick >> (_BITS * level)) & _MASK, tick)
+                slot = wheel[0][tick & _MASK]
+                if len(slot) > 0:
+                    wheel[0][tick & _MASK] = {}
+                    counts[0] -= len(slot)
+                    for handle in slot:
+                        handle._slot = None
+                    expired.extend(slot)
+            self.__wakeup_tick = None
+            if not self.__closed and sum(counts) > 0:
+                tick = self.__next_tick()
+                if tick is not None:
+                    self.__arm(tick)
+        for handle in expired:
+            try:
+                handle._callback(*handle._args)
+            except Exception as ex:
+                self.__report(handle, ex)
+        return len(expired)
+
+    def close(self) -> None:
+        """
+        Cancel all scheduled callbacks, and stop the thread (or the event loop wakeup) advancing the wheel.
+        """
+        with self.__lock:
+            self.__closed = True
+            for level, slots in enumerate(self.__wheel):
+                for slot in slots:
+                    for handle in slot:
+                        handle._slot = None
+                    slot.clear()
+                self.__counts[level] = 0
+            self.__cancel_wakeup()
+            self.__wakeup_tick = None
+            if self.__condition is not None:
+                self.__condition.notify()
+
+    def __place(self, handle: TimerHandle, tick: int, base: int) -> None:
+        # NOTE: caller must hold `__lock`, `tick` must not be earlier than `base`
+        # the lowest level above which `tick` and `base` agree, from the highest bit in which they differ
+        level = min((((tick ^ base).bit_length() - 1) // _BITS), _LEVELS - 1) if tick != base else 0
+        slot = self.__wheel[level][(tick >> (_BITS * level)) & _MASK]
+        slot[handle] = None
+        handle._tick = tick
+        handle._level = level
+        handle._slot = slot
+        self.__counts[level] += 1
+
+    def __cascade(self, level: int, index: int, base: int) -> None:
+        # NOTE: caller must hold `__lock`
+        slot = self.__wheel[level][index]
+        if len(slot) > 0:
+            self.__wheel[level][index] = {}
+            self.__counts[level] -= len(slot)
+            for handle in slot:
+                # the expiry of a callback beyond the span of the wheel may
+                # share the slot being cascaded, it is placed in a new slot.
+                self.__place(handle, handle._tick, base)
+
+    def __next_tick(self) -> Optional[int]:
+        # NOTE: caller must hold `__lock`
+        # the next tick at which a callback expires or a slot cascades, the
+        # occupied slots of a level are always ahead of its current slot
+        # (within the current slot of the level above.)
+        tick = self.__tick
+        for level in range(_LEVELS):
+            if self.__counts[level] == 0:
+                continue
+            shift = _BITS * level
+            slots = self.__wheel[level]
+            for index in range((tick >> shift & _MASK) + 1, _SLOTS):
+                if len(slots[index]) > 0:
+                    return ((tick >> (shift + _BITS)) << (shift + _BITS)) + (index << shift)
+            # only callbacks beyond the span of the wheel, at the top level
+            return ((tick >> shift) + 1) << shift
+        return None
+
+    def __arm(self, tick: int) -> None:
+        # NOTE: caller must hold `__lock`
+        self.__wakeup_tick = tick
+        if self.__loop is not None:
+            loop = self.__loop()
+            if loop is None or loop.is_closed():
+                return
+            self.__cancel_wakeup()
+            # a pending wakeup is held by the loop, the wheel only holds it
+            # weakly as an `asyncio.TimerHandle` refers to its loop (closing
+            # the loop discards its pending wakeups.)
+            self.__wakeup = weakref.ref(loop.call_at(self.__origin + tick * self.__resolution, self.__on_wakeup))
+        elif self.__condition is not None:
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name='harami.TimerWheel', daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+
+    def __cancel_wakeup(self) -> None:
+        # NOTE: caller must hold `__lock`
+        wakeup = None if self.__wakeup is None else self.__wakeup()
+        if wakeup is not None:
+            wakeup.cancel()
+        self.__wakeup = None
+
+    def __loop_time(self) -> float:
+        loop = None if self.__loop is None else self.__loop()
+        if loop is None:
+            raise RuntimeError('The event loop of the TimerWheel was garbage collected')
+        return loop.time()
+
+    def __on_wakeup(self) -> None:
+        self.__wakeup = None
+        self.advance()
+
+    def __run(self) -> None:
+        condition = self.__condition
+        assert condition is not None
+        while True:
+            with condition:
+                if self.__closed:
+                    self.__thread = None
+                    return
+                tick = self.__wakeup_tick
+                if tick is None:
+                    condition.wait()
+                    continue
+                delay = self.__origin + tick * self.__resolution - self.__clock()
+                if delay > 0:
+                    condition.wait(delay)
+                    continue
+            self.advance()
+
+    def __report(self, handle: TimerHandle, exception: Exception) -> None:
+        message = 'Unhandled exception in timer callback'
+        loop = None if self.__loop is None else self.__loop()
+        if loop is not None and not loop.is_closed():
+            loop.call_exception_handler({
+                'message': message,
+                'exception': exception,
+                'handle': handle
+            })
+        else:
+            print(f'{message}:', file=sys.stderr)
+            traceback.print_exception(exception, file=sys.stderr)
+
+
+__all__ = ['TimerHandle', 'TimerWheel']
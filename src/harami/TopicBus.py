@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, TypeAlias, Union, cast
+
+from .EventArgs import EventArgs
+from .EventHandler import EventHandler
+from .EventSource import EventSource
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+TopicHandler: TypeAlias = Callable[[str, EventArgs], Union[None, bool, Coroutine[Any, Any, None]]]   # noqa: N801
+
+
+class _TopicNode:
+    """
+    A node of the subscription trie, one per pattern segment.
+    """
+
+    __slots__ = ('children', 'source', 'order')
+
+    children: dict[str, _TopicNode]
+    source: Optional[EventSource]
+    order: int
+
+    def __init__(self) -> None:
+        self.children = {}
+        self.source = None
+        self.order = 0
+
+
+class TopicBus:
+    """
+    Delivers events published to hierarchical topics (such as `widget.created.red`) to the Event Handlers subscribed to matching patterns.
+
+    ---
+    Topics are `.` separated words. A pattern is either a topic, or includes wildcard words: `*` matches exactly one word, and `#` matches zero or more words (`widget.*` matches `widget.created` but not `widget.created.red`, `widget.#` matches both, as well as `widget`.)
+
+    Patterns are indexed by a trie, and the Event Sources which match each published topic are cached until a subscription changes, so the cost of publishing depends on the number of matching patterns rather than the number of subscriptions. The `sender` of published events is the topic they were published to.
+    """
+
+    __eventargs: type
+    __max_concurrency: Optional[int]
+    __root: _TopicNode
+    __order: int
+    __cache: dict[str, tuple[EventSource, ...]]
+    __cache_size: int
+    __exports: dict[tuple[int, Any], Callable[..., Any]]
+    __lock: threading.Lock
+
+    def __init__(self, eventargs: type = EventArgs, max_concurrency: Optional[int] = None, cache_size: int = 4096):
+        """
+        Create a TopicBus.
+
+        :param type eventargs: The `EventArgs` type constructed when an event is published.
+        :param int max_concurrency: The maximum number of async Event Handler tasks in-flight at once (per pattern), or `None` for no limit.
+        :param int cache_size: The maximum number of topics whose matches are cached, the cache is discarded when it would exceed this.
+        """
+        self.__eventargs = eventargs
+        self.__max_concurrency = max_concurrency
+        self.__root = _TopicNode()
+        self.__order = 0
+        self.__cache = {}
+        self.__cache_size = cache_size
+        self.__exports = {}
+        self.__lock = threading.Lock()
+
+    def subscribe(self, pattern: str, handler: TopicHandler, weak: bool = False, priority: int = 0, executor: Optional[Executor] = None) -> TopicBus:
+        """
+        Subscribe an Event Handler to the topics matching a pattern.
+
+        :param str pattern: A topic, or a pattern including `*` and `#` wildcard words.
+        :param TopicHandler handler: A callable that accepts two parameters, `sender` (the topic) and `EventArgs`.
+        ---
+        `weak`, `priority` and `executor` are as for `EventSource.add_handler()`, priority orders Event Handlers of the same pattern. Event Handlers of different patterns are signaled in the order the patterns were first subscribed.
+        """
+        words = TopicBus.__split(pattern, True)
+        with self.__lock:
+            node = self.__root
+            for word in words:
+                child = node.children.get(word)
+                if child is None:
+                    child = node.children[word] = _TopicNode()
+                node = child
+            if node.source is None:
+                self.__order += 1
+                node.order = self.__order
+                node.source = EventSource(None, self.__eventargs, max_concurrency=self.__max_concurrency)
+            node.source.add_handler(cast(EventHandler, handler), weak, priority, executor)
+            self.__cache = {}
+        return self
+
+    def unsubscribe(self, pattern: str, handler: TopicHandler) -> TopicBus:
+        """
+        Unsubscribe an Event Handler from a pattern it was previously subscribed to.
+        """
+        words = TopicBus.__split(pattern, True)
+        with self.__lock:
+            path = [self.__root]
+            for word in words:
+                child = path[-1].children.get(word)
+                if child is None:
+                    raise KeyError(handler)
+                path.append(child)
+            node = path[-1]
+            if node.source is None:
+                raise KeyError(handler)
+            node.source.remove_handler(cast(EventHandler, handler))
+            if not node.source.has_handlers:
+                node.source = None
+                # prune nodes which no longer lead to a subscription
+                for parent, word in zip(reversed(path[:-1]), reversed(words)):
+                    child = parent.children[word]
+                    if child.source is not None or len(child.children) > 0:
+                        break
+                    del parent.children[word]
+            self.__cache = {}
+        return self
+
+    def publish(self, topic: str, *args, **kwargs) -> None:
+        """
+        Publish an event to a topic, signaling the Event Handlers of every matching pattern.
+
+        ---
+        The `EventArgs` are constructed once and shared by all Event Handlers, if the first arg is an `EventArgs` instance it is passed through as-is.
+        """
+        sources = self.__cache.get(topic)
+        if sources is None:
+            sources = self.__resolve(topic)
+        if len(sources) > 0:
+            e = self.__create_eventargs(args, kwargs)
+            for source in sources:
+                source(topic, e)
+
+    async def publish_async(self, topic: str, *args, **kwargs) -> None:
+        """
+        Publish an event to a topic, and wait for all Event Handlers to complete (see `EventSource.raise_async()`.)
+        """
+        sources = self.__cache.get(topic)
+        if sources is None:
+            sources = self.__resolve(topic)
+        if len(sources) > 0:
+            import asyncio
+            e = self.__create_eventargs(args, kwargs)
+            await asyncio.gather(*[source.raise_async(topic, e) for source in sources])
+
+    def has_subscribers(self, topic: str) -> bool:
+        """
+        Returns `True` if any pattern matches `topic`.
+        """
+        sources = self.__cache.get(topic)
+        if sources is None:
+            sources = self.__resolve(topic)
+        return len(sources) > 0
+
+    def export(self, source: EventSource, topic: str | Callable[[Any, EventArgs], str]) -> TopicBus:
+        """
+        Publish every event raised by an Event Source to a topic.
+
+        :param EventSource source: The Event Source to export.
+        :param topic: The topic, or a callable which accepts `sender` and `EventArgs` and returns the topic (such as `lambda s,e: f'widget.created.{e.widget.color}'`.)
+        ---
+        The `EventArgs` are published as-is, the `sender` is not.
+        """
+        if callable(topic):
+            get_topic = topic
+
+            def handler(sender: object, e: EventArgs) -> None:
+                self.publish(get_topic(sender, e), e)
+        else:
+            TopicBus.__split(topic, False)
+
+            def handler(sender: object, e: EventArgs) -> None:
+                self.publish(topic, e)
+        self.__exports[(id(source), topic)] = handler
+        source.add_handler(handler)
+        return self
+
+    def unexport(self, source: EventSource, topic: str | Callable[[Any, EventArgs], str]) -> TopicBus:
+        """
+        Stop publishing the events raised by an Event Source to a topic.
+        """
+        handler = self.__exports.pop((id(source), topic), None)
+        if handler is not None:
+            source.remove_handler(handler)
+        return self
+
+    def __create_eventargs(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> EventArgs:
+        if len(args) == 0 and len(kwargs) == 0:
+            return EventArgs.empty
+        elif len(args) > 0 and isinstance(args[0], EventArgs):
+            return args[0]
+        else:
+            return self.__eventargs(*args, **kwargs)
+
+    def __resolve(self, topic: str) -> tuple[EventSource, ...]:
+        words = TopicBus.__split(topic, False)
+        with self.__lock:
+            matches: dict[int, tuple[int, EventSource]] = {}
+            TopicBus.__match(self.__root, words, 0, matches)
+            sources = tuple(source for order, source in sorted(matches.values(), key=lambda match: match[0]))
+            cache = self.__cache
+            if len(cache) >= self.__cache_size:
+                cache = self.__cache = {}
+            cache[topic] = sources
+        return sources
+
+    @staticmethod
+    def __match(node: _TopicNode, words: list[str], i: int, matches: dict[int, tuple[int, EventSource]]) -> None:
+        # matches are keyed by identity, a topic can match a single pattern more than once (`#.#`)
+        children = node.children
+        if i == len(words):
+            if node.source is not None:
+                matches[id(node)] = (node.order, node.source)
+        else:
+            child = children.get(words[i])
+            if child is not None:
+                TopicBus.__match(child, words, i + 1, matches)
+            child = children.get('*')
+            if child is not None:
+                TopicBus.__match(child, words, i + 1, matches)
+        child = children.get('#')
+        if child is not None:
+            for j in range(i, len(words) + 1):
+                TopicBus.__match(child, words, j, matches)
+
+    @staticmethod
+    def __split(topic: str, wildcards: bool) -> list[str]:
+        words = topic.split('.')
+        for word in words:
+            if len(word) == 0:
+                raise ValueError(f'Invalid topic {topic!r}, topics cannot contain empty words')
+            elif ('*' in word or '#' in word) and (not wildcards or len(word) > 1):
+                raise ValueError(f'Invalid topic {topic!r}, wildcards must be whole words of a pattern')
+        return words
+
+
+__all__ = ['TopicBus', 'TopicHandler']
@@ -1,21 +1,134 @@
 # SPDX-FileCopyrightText: © 2025 Shaun Wilson
 # SPDX-License-Identifier: MIT
+#
+# Submodules are imported on first access of the names they export (PEP 562),
+# so `import harami` only pays for what is actually used.
+#
 
-from .EventArgs import EventArgs
-from .EventHandler import EventHandler
-from .EventSource import EventSource, event
-from .Observable import Observable
-from .Observer import Observer
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from types import ModuleType
+
+# NOTE: not imported from `typing`, which is not free to import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+    from .Computed import Computed, batch, computed
+    from .DeadLetter import DeadLetter
+    from .DerivedObservable import DerivedObservable
+    from .DispatchCollector import DispatchCollector, DispatchStats
+    from .EventArgs import EventArgs, EventArgsField
+    from .EventHandler import EventHandler
+    from .EventSource import EventSource, event
+    from .EventStream import EventStream
+    from .Histogram import Histogram
+    from .Instrument import Instrument, set_instrument
+    from .Observable import Observable
+    from .ObservableDict import DictDelta, ObservableDict
+    from .ObservableList import ListDelta, ObservableList
+    from .Observer import Observer
+    from .PickleSerializer import PickleSerializer
+    from .ReplayObservable import ReplayObservable
+    from .SegmentLog import SegmentLog
+    from .SharedMemoryBus import SharedMemoryBus
+    from .TimerWheel import TimerHandle, TimerWheel
+    from .TopicBus import TopicBus, TopicHandler
 
 __version__ = '0.0.0'
 __commit__ = '0abc123'
 
+_EXPORTS = {
+    'batch': 'Computed',
+    'Computed': 'Computed',
+    'computed': 'Computed',
+    'DeadLetter': 'DeadLetter',
+    'DerivedObservable': 'DerivedObservable',
+    'DispatchCollector': 'DispatchCollector',
+    'DispatchStats': 'DispatchCollector',
+    'DictDelta': 'ObservableDict',
+    'EventArgs': 'EventArgs',
+    'EventArgsField': 'EventArgs',
+    'EventHandler': 'EventHandler',
+    'EventSource': 'EventSource',
+    'event': 'EventSource',
+    'EventStream': 'EventStream',
+    'Histogram': 'Histogram',
+    'Instrument': 'Instrument',
+    'ListDelta': 'ObservableList',
+    'Observable': 'Observable',
+    'ObservableDict': 'ObservableDict',
+    'ObservableList': 'ObservableList',
+    'Observer': 'Observer',
+    'PickleSerializer': 'PickleSerializer',
+    'ReplayObservable': 'ReplayObservable',
+    'SegmentLog': 'SegmentLog',
+    'set_instrument': 'Instrument',
+    'SharedMemoryBus': 'SharedMemoryBus',
+    'TimerHandle': 'TimerWheel',
+    'TimerWheel': 'TimerWheel',
+    'TopicBus': 'TopicBus',
+    'TopicHandler': 'TopicBus'
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+class _Package(ModuleType):
+    # importing a submodule binds it as an attribute of the package, and
+    # submodules are named for the class they export, so the binding would
+    # shadow the class (`harami.EventSource` would become a module.) rebind
+    # the name to the export instead.
+    def __setattr__(self, name: str, value: Any) -> None:
+        if isinstance(value, ModuleType) and _EXPORTS.get(name) == name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
 __all__ = [
     '__version__', '__commit__',
+    'batch',
+    'Computed',
+    'computed',
+    'DeadLetter',
+    'DerivedObservable',
+    'DispatchCollector',
+    'DispatchStats',
+    'DictDelta',
     'EventArgs',
+    'EventArgsField',
     'EventHandler',
     'EventSource',
     'event',
+    'EventStream',
+    'Histogram',
+    'Instrument',
+    'ListDelta',
     'Observable',
-    'Observer'
+    'ObservableDict',
+    'ObservableList',
+    'Observer',
+    'PickleSerializer',
+    'ReplayObservable',
+    'SegmentLog',
+    'set_instrument',
+    'SharedMemoryBus',
+    'TimerHandle',
+    'TimerWheel',
+    'TopicBus',
+    'TopicHandler'
 ]
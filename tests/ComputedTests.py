@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from harami import Computed, Observable, batch, computed
+from punit import fact
+
+
+class ComputedTests:
+
+    @fact
+    def computeds_are_lazy_and_track_dependencies(self) -> None:
+        a: Observable[int] = Observable(distinct='equality')
+        b: Observable[int] = Observable()
+        a(1)
+        b(2)
+        calls: list[int] = []
+
+        def total() -> int:
+            calls.append(1)
+            return (a() or 0) + (b() or 0)
+        c = computed(total)
+        assert len(calls) == 0
+        assert c() == 3 and c.state == 3
+        assert len(calls) == 1
+        assert c.dependencies == (a, b)
+        a(1)
+        assert c() == 3
+        assert len(calls) == 1, 'an unchanged dependency does not recompute'
+        a(10)
+        b(20)
+        assert len(calls) == 1, 'a Computed without Observers is not recomputed until read'
+        assert c() == 30
+        assert len(calls) == 2
+
+    @fact
+    def notifications_of_mutated_states_recompute(self) -> None:
+        items: list[int] = [1]
+        a: Observable[list[int]] = Observable()
+        a(items)
+        c = computed(lambda: sum(a() or []))
+        d = computed(lambda: sum(a() or []))
+        received: list[int] = []
+        c.attach(lambda state: received.append(state))
+        assert c() == 1 and d() == 1
+        items.append(2)
+        a(items)
+        assert received == [3]
+        assert c() == 3 and d() == 3
+
+    @fact
+    def diamonds_recompute_once_without_glitches(self) -> None:
+        a: Observable[int] = Observable()
+        a(1)
+        counts = {'double': 0, 'total': 0}
+
+        def double() -> int:
+            counts['double'] += 1
+            return (a() or 0) * 2
+
+        d = computed(double)
+
+        def total() -> int:
+            counts['total'] += 1
+            return (a() or 0) + (d() or 0)
+
+        t = computed(total)
+        received: list[tuple[str, int | None]] = []
+        # an Observer of the input reads the Computed, and never sees a stale state
+        a.attach(lambda state: received.append(('a', t())))
+        t.attach(lambda state: received.append(('t', state)))
+        assert counts == {'double': 1, 'total': 1}
+        a(2)
+        # Computeds are recomputed (and notified) before other Observers of the input
+        assert received == [('t', 6), ('a', 6)]
+        assert counts == {'double': 2, 'total': 2}
+
+    @fact
+    def unchanged_states_stop_propagation(self) -> None:
+        a: Observable[int] = Observable()
+        a(1)
+        parity = computed(lambda: (a() or 0) % 2)
+        calls: list[int] = []
+
+        def describe() -> str:
+            calls.append(1)
+            return 'odd' if parity() else 'even'
+
+        description = computed(describe)
+        received: list[str] = []
+        description.attach(received.append)
+        a(3)
+        assert len(calls) == 1 and received == []
+        a(4)
+        assert len(calls) == 2 and received == ['even']
+        try:
+            description.state = 'odd'
+            assert False, 'expected AttributeError'
+        except AttributeError:
+            pass
+
+    @fact
+    def batches_defer_recomputation(self) -> None:
+        a: Observable[int] = Observable()
+        b: Observable[int] = Observable()
+        a(1)
+        b(1)
+        total: Computed[int] = Computed(lambda: (a() or 0) + (b() or 0))
+        received: list[int] = []
+        total.attach(received.append)
+        with batch():
+            a(2)
+            b(3)
+            with batch():
+                a(4)
+            assert received == []
+            assert total() == 7, 'a Computed read within a batch is computed on demand'
+        assert received == [7]
+        a(5)
+        assert received == [7, 8]
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import threading
+from harami import EventArgs, EventSource, EventStream, Observable
+from punit import fact
+
+
+class EventStreamTests:
+
+    @fact
+    async def streams_yield_eventargs_in_order(self) -> None:
+        source = EventSource(None)
+        stream = source.stream(maxsize=8)
+        assert source.has_handlers
+        for i in range(3):
+            source(None, i)
+        received = []
+        async for e in stream:
+            received.append(e.args[0])
+            if len(received) == 3:
+                await stream.aclose()
+        assert received == [0, 1, 2]
+        assert not source.has_handlers
+
+    @fact
+    async def streams_yield_observable_states(self) -> None:
+        o: Observable[int] = Observable()
+        async with o.stream() as stream:
+            o(1)
+            o(2)
+            assert [await stream.__anext__(), await stream.__anext__()] == [1, 2]
+        assert not o.has_observers
+
+    @fact
+    async def drop_oldest_discards_the_oldest_items(self) -> None:
+        o: Observable[int] = Observable()
+        stream = o.stream(maxsize=2, overflow='drop-oldest')
+        for i in range(5):
+            o(i)
+        stream.close()
+        assert [state async for state in stream] == [3, 4]
+        assert stream.dropped == 3
+
+    @fact
+    async def drop_newest_discards_the_newest_items(self) -> None:
+        o: Observable[int] = Observable()
+        stream = o.stream(maxsize=2, overflow='drop-newest')
+        for i in range(5):
+            o(i)
+        stream.close()
+        assert [state async for state in stream] == [0, 1]
+        assert stream.dropped == 3
+
+    @fact
+    async def error_ends_the_stream_with_overflowerror(self) -> None:
+        source = EventSource(None)
+        stream = source.stream(maxsize=2, overflow='error')
+        for i in range(3):
+            source(None, i)
+        assert not source.has_handlers
+        received = []
+        try:
+            async for e in stream:
+                received.append(e.args[0])
+            assert False, 'expected OverflowError'
+        except OverflowError:
+            pass
+        assert received == [0, 1]
+
+    @fact
+    async def block_applies_backpressure_to_producers(self) -> None:
+        o: Observable[int] = Observable()
+        stream = o.stream(maxsize=1)
+
+        async def produce() -> None:
+            for i in range(5):
+                await o.notify_async(i)
+                # the producer never runs ahead of the consumer by more than the buffer
+                assert len(stream) <= 1
+            stream.close()
+        producer = asyncio.create_task(produce())
+        received = [state async for state in stream]
+        await producer
+        assert received == [0, 1, 2, 3, 4]
+        assert stream.dropped == 0
+
+    @fact
+    async def block_bounds_the_items_of_synchronous_producers(self) -> None:
+        source = EventSource(None)
+        stream = source.stream(maxsize=2)
+        for i in range(1000):
+            source(None, i)
+        await asyncio.sleep(0)
+        assert not source.has_handlers
+        received = []
+        try:
+            async for e in stream:
+                received.append(e.args[0])
+            assert False, 'expected OverflowError'
+        except OverflowError:
+            pass
+        # the item which overflowed, and the `maxsize` items waiting for room
+        assert received == [0, 1]
+        assert stream.dropped == 3
+        assert len(asyncio.all_tasks()) == 1
+
+    @fact
+    async def block_preserves_the_order_of_synchronous_producers(self) -> None:
+        source = EventSource(None)
+        stream = source.stream(maxsize=2)
+        for i in range(1, 4):
+            source(None, i)
+        received = [(await stream.__anext__()).args[0]]
+        # a freed slot goes to the item waiting for room, not to a later push
+        source(None, 4)
+        async for e in stream:
+            received.append(e.args[0])
+            if len(received) == 4:
+                stream.close()
+        assert received == [1, 2, 3, 4]
+        assert stream.dropped == 0
+
+    @fact
+    async def streams_accept_items_from_other_threads(self) -> None:
+        source = EventSource(None)
+        stream = source.stream(maxsize=4)
+
+        def produce() -> None:
+            for i in range(100):
+                source(None, i)
+        thread = threading.Thread(target=produce)
+        thread.start()
+        received = []
+        async for e in stream:
+            received.append(e.args[0])
+            if len(received) == 100:
+                stream.close()
+        # the producer waits on the event loop, so it must not be blocked by `join()`
+        await asyncio.to_thread(thread.join)
+        assert received == list(range(100))
+
+    @fact
+    async def unsupported_overflow_policies_raise_valueerror(self) -> None:
+        try:
+            EventSource(None).stream(overflow='discard')
+            assert False, 'expected ValueError'
+        except ValueError:
+            pass
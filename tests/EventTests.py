@@ -2,9 +2,16 @@
 # SPDX-License-Identifier: MIT
 
 import asyncio
+import copy
+import gc
+import itertools
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import IntEnum
-from harami import EventArgs, event
+from harami import DeadLetter, EventArgs, EventArgsField, EventSource, Observable, event
 from punit import fact
+from typing import cast
 
 
 class FakeEventTypeEnum(IntEnum):
@@ -178,3 +185,627 @@ class FakeEventConsumer:
         assert self.e2.data.decode() == 'Hello, World!'
         # verify that `sender` is the class the event was defined on, and not the class calling the Event Source.
         assert id(self.sender2) == id(self.target)
+
+
+@fact
+def events_share_eventargs_across_handlers() -> None:
+    # arrange
+    received: list[FakeEventArgs] = []
+
+    def handler1(sender: object, e: FakeEventArgs) -> None:
+        received.append(e)
+
+    def handler2(sender: object, e: FakeEventArgs) -> None:
+        received.append(e)
+    target = FakeEventProvider()
+    target.sync_event.add_handler(handler1)
+    target.sync_event.add_handler(handler2)
+    # act
+    target.sync_event(FakeEventTypeEnum.ONE, b'')
+    target.sync_event.remove_handler(handler2)
+    target.sync_event(FakeEventTypeEnum.TWO, b'')
+    # assert
+    assert len(received) == 3
+    assert received[0] is received[1]
+    assert received[2].type == FakeEventTypeEnum.TWO
+
+
+@fact
+def events_passthrough_eventargs() -> None:
+    # arrange
+    received: list[EventArgs] = []
+    on_changed = EventSource(None)
+    on_changed.add_handler(lambda s, e: received.append(e))
+    expected = FakeEventArgs(FakeEventTypeEnum.ONE, b'')
+    # act
+    on_changed(None, expected)
+    # assert
+    assert received[0] is expected
+
+
+@fact
+def events_are_instance_scoped() -> None:
+    # arrange
+    received: list[object] = []
+
+    def handler(sender: object, e: FakeEventArgs) -> None:
+        received.append(sender)
+    target1 = FakeEventProvider()
+    target2 = FakeEventProvider()
+    target1.sync_event += handler
+    # act
+    target1.sync_event(FakeEventTypeEnum.ONE, b'')
+    target2.sync_event(FakeEventTypeEnum.ONE, b'')
+    # assert
+    assert target1.sync_event.has_handlers
+    assert not target2.sync_event.has_handlers
+    assert len(received) == 1
+    assert received[0] is target1
+    assert target1.sync_was_executed
+    assert target2.sync_was_executed
+
+
+@fact
+def instances_with_bound_events_can_be_copied() -> None:
+    # arrange
+    received: list[object] = []
+    target = FakeEventProvider()
+    target.sync_event += lambda sender, e: received.append(sender)
+    # act
+    actual = cast(FakeEventProvider, pickle.loads(pickle.dumps(target)))
+    copied = copy.deepcopy(target)
+    shallow = copy.copy(target)
+    actual.sync_event(FakeEventTypeEnum.ONE, b'')
+    copied.sync_event(FakeEventTypeEnum.ONE, b'')
+    shallow.sync_event(FakeEventTypeEnum.ONE, b'')
+    target.sync_event(FakeEventTypeEnum.ONE, b'')
+    # assert
+    assert not actual.sync_event.has_handlers
+    assert not copied.sync_event.has_handlers
+    assert not shallow.sync_event.has_handlers
+    assert shallow.sync_event is not target.sync_event
+    assert actual.sync_was_executed
+    assert copied.sync_was_executed
+    assert shallow.sync_was_executed
+    assert received == [target]
+    assert target.sync_event.has_handlers
+    actual.sync_event += lambda sender, e: received.append(sender)
+    actual.sync_event(FakeEventTypeEnum.ONE, b'')
+    assert received == [target, actual]
+
+
+class FakeSharedEventProvider:
+    """A fake concrete class that exposes an event shared by all instances."""
+
+    @event(FakeEventArgs, shared=True)
+    def shared_event(self, the_type: FakeEventTypeEnum, the_data: bytes) -> None:
+        pass
+
+
+@fact
+def shared_events_signal_all_instances() -> None:
+    # arrange
+    received: list[object] = []
+
+    def handler(sender: object, e: FakeEventArgs) -> None:
+        received.append(sender)
+    target1 = FakeSharedEventProvider()
+    target2 = FakeSharedEventProvider()
+    FakeSharedEventProvider.shared_event.add_handler(handler)
+    # act
+    target1.shared_event(FakeEventTypeEnum.ONE, b'')
+    target2.shared_event(FakeEventTypeEnum.ONE, b'')
+    FakeSharedEventProvider.shared_event.remove_handler(handler)
+    # assert
+    assert received == [target1, target2]
+
+
+@fact
+async def shared_events_raised_through_an_instance_pass_the_instance() -> None:
+    # arrange
+    received: list[tuple[object, int]] = []
+
+    def handler(sender: object, e: EventArgs) -> None:
+        received.append((sender, e.args[1]))
+    target1 = FakeSharedEventProvider()
+    target2 = FakeSharedEventProvider()
+    target1.shared_event += handler
+    stream = target1.shared_event.stream()
+    # act
+    await target1.shared_event.raise_async(FakeEventTypeEnum.ONE, 1)
+    await target2.shared_event.raise_async(FakeEventTypeEnum.ONE, 2)
+    target1.shared_event.raise_later(0, FakeEventTypeEnum.ONE, 3)
+    target2.shared_event.raise_at(0, FakeEventTypeEnum.ONE, 4)
+    while len(received) < 4:
+        await asyncio.sleep(0.001)
+    await stream.aclose()
+    target1.shared_event -= handler
+    # assert
+    assert received == [(target1, 1), (target2, 2), (target1, 3), (target2, 4)]
+    assert [e.args[1] async for e in stream] == [1, 3]
+    assert not FakeSharedEventProvider.shared_event.has_handlers
+
+
+@fact
+def weak_handlers_are_removed_when_collected() -> None:
+    # arrange
+    received: list[EventArgs] = []
+
+    class X:
+        def handler(self, sender: object, e: FakeEventArgs) -> None:
+            received.append(e)
+    x = X()
+    target = FakeEventProvider()
+    target.sync_event.add_handler(x.handler, weak=True)
+    target.sync_event.add_handler(x.handler, weak=True)
+    # act
+    target.sync_event(FakeEventTypeEnum.ONE, b'')
+    del x
+    gc.collect()
+    target.sync_event(FakeEventTypeEnum.TWO, b'')
+    # assert
+    assert len(received) == 1
+    assert not target.sync_event.has_handlers
+
+
+@fact
+async def raise_async_awaits_handlers() -> None:
+    # arrange
+    running = 0
+    peak = 0
+    completed = 0
+
+    async def handler(sender: object, e: FakeEventArgs) -> None:
+        nonlocal running, peak, completed
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        completed += 1
+    source = EventSource(None, FakeEventArgs, max_concurrency=2)
+    handlers = [lambda s, e: handler(s, e) for i in range(5)]
+    for h in handlers:
+        source.add_handler(h)
+    # act
+    await source.raise_async(None, FakeEventTypeEnum.ONE, b'')
+    # assert
+    assert completed == 5
+    assert peak == 2
+
+
+@fact
+async def raise_async_propagates_handler_exceptions() -> None:
+    # arrange
+    async def handler(sender: object, e: EventArgs) -> None:
+        raise ValueError('expected')
+    source = EventSource(None)
+    source.add_handler(handler)
+    # act
+    error: Exception | None = None
+    try:
+        await source.raise_async(None)
+    except ValueError as ex:
+        error = ex
+    # assert
+    assert error is not None
+
+
+@fact
+def handlers_can_remove_themselves_during_raise() -> None:
+    # arrange
+    received: list[str] = []
+    target = FakeEventProvider()
+
+    def handler1(sender: object, e: FakeEventArgs) -> None:
+        received.append('handler1')
+        target.sync_event.remove_handler(handler1)
+        target.sync_event.add_handler(handler3)
+
+    def handler2(sender: object, e: FakeEventArgs) -> None:
+        received.append('handler2')
+
+    def handler3(sender: object, e: FakeEventArgs) -> None:
+        received.append('handler3')
+    target.sync_event.add_handler(handler1)
+    target.sync_event.add_handler(handler2)
+    # act
+    target.sync_event(FakeEventTypeEnum.ONE, b'')
+    target.sync_event(FakeEventTypeEnum.ONE, b'')
+    # assert
+    assert received == ['handler1', 'handler2', 'handler2', 'handler3']
+
+
+@fact
+def events_can_be_raised_and_handled_from_many_threads() -> None:
+    # arrange
+    counter = itertools.count()
+    target = FakeEventProvider()
+
+    def handler(sender: object, e: FakeEventArgs) -> None:
+        next(counter)
+    target.sync_event.add_handler(handler)
+
+    def worker() -> None:
+        for i in range(1000):
+            h = lambda s, e: None
+            target.sync_event.add_handler(h)
+            target.sync_event(FakeEventTypeEnum.ONE, b'')
+            target.sync_event.remove_handler(h)
+    threads = [threading.Thread(target=worker) for i in range(8)]
+    # act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # assert
+    assert next(counter) == 8000
+
+
+@fact
+def handlers_are_signaled_in_priority_order() -> None:
+    # arrange
+    received: list[str] = []
+    target = FakeEventProvider()
+    target.sync_event.add_handler(lambda s, e: received.append('a'))
+    target.sync_event.add_handler(lambda s, e: received.append('b'))
+    target.sync_event.add_handler(lambda s, e: received.append('first'), priority=10)
+    target.sync_event.add_handler(lambda s, e: received.append('last'), priority=-10)
+    target.sync_event.add_handler(lambda s, e: received.append('c'))
+    # act
+    target.sync_event(FakeEventTypeEnum.ONE, b'')
+    # assert
+    assert received == ['first', 'a', 'b', 'c', 'last']
+
+
+@fact
+def handlers_returning_true_stop_propagation() -> None:
+    # arrange
+    received: list[str] = []
+
+    def handler1(sender: object, e: FakeEventArgs) -> bool:
+        received.append('handler1')
+        return e.type == FakeEventTypeEnum.TWO
+
+    def handler2(sender: object, e: FakeEventArgs) -> None:
+        received.append('handler2')
+    target = FakeEventProvider()
+    target.sync_event.add_handler(handler1)
+    target.sync_event.add_handler(handler2)
+    # act
+    target.sync_event(FakeEventTypeEnum.ONE, b'')
+    target.sync_event(FakeEventTypeEnum.TWO, b'')
+    # assert
+    assert received == ['handler1', 'handler2', 'handler1']
+
+
+class FakeSlottedEventArgs(EventArgs):
+    """A fake `EventArgs` subclass using `EventArgsField` accessors."""
+    __slots__ = ()
+    type = EventArgsField(0)
+    data = EventArgsField(1, 'the_data')
+
+
+@fact
+def eventargs_fields_resolve_by_name_or_index() -> None:
+    # arrange
+    received: list[FakeSlottedEventArgs] = []
+    source = EventSource(None, FakeSlottedEventArgs)
+    source.add_handler(lambda s, e: received.append(cast(FakeSlottedEventArgs, e)))
+    # act
+    source(None, FakeEventTypeEnum.ONE, b'a')
+    source(None, FakeEventTypeEnum.TWO, b'b', the_data=None)
+    # assert
+    assert not hasattr(received[0], '__dict__')
+    assert received[0].type == FakeEventTypeEnum.ONE
+    assert received[0].data == b'a'
+    assert received[0].kwargs is EventArgs.empty.kwargs
+    assert received[1].type == FakeEventTypeEnum.TWO
+    assert received[1].data is None
+    assert received[1].get_by_name_or_index('the_data', 1) is None
+
+
+def fail(sender: object, e: EventArgs) -> None:
+    """A picklable Event Handler which raises, submitted to a process pool."""
+    raise ValueError(e.args[0])
+
+
+@fact
+async def executor_handlers_are_submitted_to_the_executor() -> None:
+    # arrange
+    inline: list[str] = []
+    threads: list[str] = []
+    source = EventSource(None)
+    source.add_handler(lambda s, e: inline.append(threading.current_thread().name))
+    with ThreadPoolExecutor(thread_name_prefix='executor') as executor:
+        source.add_handler(lambda s, e: threads.append(threading.current_thread().name), executor=executor)
+        # act
+        source(None, 1)
+        await source.raise_async(None, 2)
+    # assert
+    assert inline == [threading.current_thread().name] * 2
+    assert len(threads) == 2
+    assert all(name.startswith('executor') for name in threads)
+
+
+@fact
+async def executor_handlers_propagate_exceptions_to_raise_async() -> None:
+    # arrange
+    source = EventSource(None)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        source.add_handler(fail, executor=executor)
+        # act
+        try:
+            await source.raise_async(None, 'expected')
+            assert False, 'expected ValueError'
+        except ValueError as ex:
+            # assert
+            assert str(ex) == 'expected'
+
+
+class FakeFactory:
+    """A fake class exposing an instance-scoped event, the sender of which is submitted to a process pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    @event()
+    def on_created(self, value: str) -> None:
+        pass
+
+
+def fail_with_sender(sender: FakeFactory, e: EventArgs) -> None:
+    """A picklable Event Handler which raises, naming its sender."""
+    raise ValueError(f'{sender.name}:{e.args[0]}')
+
+
+@fact
+async def executor_handlers_receive_the_sender_of_instance_scoped_events() -> None:
+    # arrange
+    factory = FakeFactory('factory')
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        factory.on_created.add_handler(fail_with_sender, executor=executor)
+        # act
+        try:
+            await factory.on_created.raise_async('expected')
+            assert False, 'expected ValueError'
+        except ValueError as ex:
+            # assert
+            assert str(ex) == 'factory:expected'
+
+
+@fact
+def eventargs_are_picklable() -> None:
+    # arrange
+    e = FakeSlottedEventArgs(FakeEventTypeEnum.ONE, the_data=b'a')
+    # act
+    actual = cast(FakeSlottedEventArgs, pickle.loads(pickle.dumps(e)))
+    # assert
+    assert actual.type == FakeEventTypeEnum.ONE
+    assert actual.data == b'a'
+    assert pickle.loads(pickle.dumps(EventArgs(1))).kwargs is EventArgs.empty.kwargs
+    try:
+        actual.kwargs['the_data'] = b'b'  # type: ignore[index]
+        assert False, 'expected TypeError, kwargs are read-only'
+    except TypeError:
+        pass
+
+
+class CountingEventArgs(EventArgs):
+    """An `EventArgs` subclass which counts its instances."""
+    __slots__ = ()
+    instances = 0
+    color = EventArgsField(0)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        CountingEventArgs.instances += 1
+
+
+@fact
+def filtered_handlers_only_receive_matching_events() -> None:
+    # arrange
+    source = EventSource(None, CountingEventArgs)
+    received: list[tuple[str, object]] = []
+    source.add_handler(lambda s, e: received.append(('red', cast(CountingEventArgs, e).color)), where={'color': 'red'})
+    source.add_handler(lambda s, e: received.append(('blue', e.args[0])), where={'color': 'blue'})
+    source.add_handler(lambda s, e: received.append(('size', e.kwargs['size'])), where={'size': 2})
+    source.add_handler(lambda s, e: received.append(('predicate', e.args[0])), where=lambda e: cast(CountingEventArgs, e).color == 'green')
+    # act
+    source(None, 'red')
+    source(None, 'blue', size=2)
+    source(None, 'green')
+    source(None, 'orange', color='red')
+    # assert
+    assert received == [('red', 'red'), ('blue', 'blue'), ('size', 2), ('predicate', 'green'), ('red', 'red')]
+
+
+@fact
+async def unmatched_events_do_not_construct_eventargs() -> None:
+    # arrange
+    source = EventSource(None, CountingEventArgs)
+    received: list[CountingEventArgs] = []
+
+    def handler(s: object, e: EventArgs) -> None:
+        received.append(cast(CountingEventArgs, e))
+    source.add_handler(handler, where={'color': 'red'})
+    before = CountingEventArgs.instances
+    # act
+    for color in ('blue', 'green', 'red'):
+        source(None, color)
+    await source.raise_async(None, 'blue')
+    # assert
+    assert CountingEventArgs.instances == before + 1
+    assert [e.color for e in received] == ['red']
+    source.remove_handler(handler)
+    assert not source.has_handlers
+    source(None, 'red')
+    assert len(received) == 1
+
+
+@fact
+async def driver_fanout_runs_coroutines_in_a_single_task() -> None:
+    # arrange
+    tasks: list[asyncio.Task | None] = []
+    errors: list[BaseException] = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context['exception']))
+
+    async def handler(sender: object, e: EventArgs) -> None:
+        await asyncio.sleep(0)
+        tasks.append(asyncio.current_task())
+
+    async def failing_handler(sender: object, e: EventArgs) -> None:
+        raise ValueError('expected')
+    source = EventSource(None, fanout='driver')
+    source.add_handler(handler)
+    source.add_handler(failing_handler)
+    source.add_handler(lambda s, e: handler(s, e))
+    # act
+    for i in range(3):
+        source(None, i)
+    await asyncio.sleep(0.01)
+    source.remove_handler(failing_handler)
+    await source.raise_async(None)
+    # assert
+    assert len(tasks) == 8
+    assert len(set(tasks[:6])) == 1, 'every coroutine of every raise shares one driver task'
+    assert tasks[6] is tasks[7] is asyncio.current_task(), 'raise_async awaits coroutines in the calling task'
+    assert len(errors) == 3 and all(isinstance(ex, ValueError) for ex in errors)
+    try:
+        EventSource(None, fanout='threads')
+        assert False, 'expected ValueError'
+    except ValueError:
+        pass
+
+
+@fact
+async def isolated_handlers_raise_an_exception_group() -> None:
+    # arrange
+    received: list[int] = []
+
+    def failing_handler(sender: object, e: EventArgs) -> None:
+        raise ValueError(e.args[0])
+
+    async def failing_async_handler(sender: object, e: EventArgs) -> None:
+        raise KeyError(e.args[0])
+    source = EventSource(None, errors='isolate')
+    source.add_handler(failing_handler, priority=1)
+    source.add_handler(lambda s, e: received.append(e.args[0]))
+    # act
+    try:
+        source(None, 1)
+        assert False, 'expected ExceptionGroup'
+    except ExceptionGroup as eg:
+        # assert
+        assert [type(ex) for ex in eg.exceptions] == [ValueError]
+    source.add_handler(failing_async_handler)
+    try:
+        await source.raise_async(None, 2)
+        assert False, 'expected ExceptionGroup'
+    except ExceptionGroup as eg:
+        assert [type(ex) for ex in eg.exceptions] == [ValueError, KeyError]
+    assert received == [1, 2], 'every handler is signaled'
+
+
+@fact
+async def dead_letters_and_circuit_breakers() -> None:
+    # arrange
+    dead_letters: Observable[DeadLetter] = Observable()
+    letters: list[DeadLetter] = []
+    dead_letters.attach(letters.append)
+    received: list[int] = []
+
+    def failing_handler(sender: object, e: EventArgs) -> None:
+        if e.args[0] == 1:
+            return
+        raise ValueError(e.args[0])
+    source = EventSource(None, errors=dead_letters, max_failures=2)
+    source.add_handler(failing_handler)
+    source.add_handler(lambda s, e: received.append(e.args[0]))
+    # act
+    for i in range(5):
+        source('sender', i)
+    # assert
+    assert received == [0, 1, 2, 3, 4]
+    assert [(x.args[1].args[0], str(x.exception)) for x in letters] == [(0, '0'), (2, '2'), (3, '3')], 'a raise without a failure resets the count'
+    assert letters[0].source is source and letters[0].subscriber is failing_handler and letters[0].args[0] == 'sender'
+    try:
+        source.remove_handler(failing_handler)
+        assert False, 'expected KeyError, the handler was removed after two consecutive failures'
+    except KeyError:
+        pass
+    try:
+        EventSource(None, errors='ignore')
+        assert False, 'expected ValueError'
+    except ValueError:
+        pass
+
+
+class FakeFailingSubscriber:
+    """A fake subscriber which always raises, added as a weak Event Handler."""
+    calls: int
+
+    def __init__(self):
+        self.calls = 0
+
+    def handler(self, sender: object, e: EventArgs) -> None:
+        self.calls += 1
+        raise ValueError(e.args[0])
+
+
+@fact
+def circuit_breakers_count_failures_of_weak_handlers() -> None:
+    # arrange
+    subscriber = FakeFailingSubscriber()
+    source = EventSource(None, errors='isolate', max_failures=3)
+    source.add_handler(subscriber.handler, weak=True)
+    # act
+    for i in range(6):
+        try:
+            source(None, i)
+        except ExceptionGroup:
+            pass
+    # assert
+    assert subscriber.calls == 3
+    assert not source.has_handlers
+
+
+class FakeCounter:
+    """A class whose event is raised with and without handlers."""
+    count: int
+
+    def __init__(self):
+        self.count = 0
+
+    @event()
+    def on_count(self, amount: int) -> int:
+        self.count += amount
+        return self.count
+
+
+@fact
+async def raises_track_the_kind_of_handlers_added() -> None:
+    # arrange
+    counter = FakeCounter()
+    received: list[tuple[str, int]] = []
+
+    def handler(sender: object, e: EventArgs) -> None:
+        received.append(('sync', e.args[0]))
+
+    async def async_handler(sender: object, e: EventArgs) -> None:
+        received.append(('async', e.args[0]))
+    # act, assert
+    assert counter.on_count(1) == 1
+    counter.on_count += handler
+    assert counter.on_count(2) == 3
+    counter.on_count += async_handler
+    assert counter.on_count(3) == 6
+    await asyncio.sleep(0)
+    counter.on_count -= handler
+    counter.on_count -= async_handler
+    assert counter.on_count(4) == 10
+    counter.on_count.add_handler(handler, where={0: 5})
+    counter.on_count(5)
+    counter.on_count.remove_handler(handler)
+    counter.on_count(5)
+    assert received == [('sync', 2), ('sync', 3), ('async', 3), ('sync', 5)]
+    assert counter.count == 20 and isinstance(counter.on_count, EventSource)
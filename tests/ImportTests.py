@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import os
+import subprocess
+import sys
+import harami
+from harami import EventSource
+from punit import fact
+
+
+def run(code: str) -> list[str]:
+    # a fresh interpreter, the modules imported by the test runner are not representative
+    process = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=os.environ, check=True)
+    return process.stdout.split()
+
+
+class ImportTests:
+
+    @fact
+    def importing_the_package_imports_no_submodules(self) -> None:
+        loaded = run('import sys, harami\nprint(" ".join(m for m in sys.modules if m.startswith("harami") or m == "typing"))')
+        assert loaded == ['harami']
+
+    @fact
+    def synchronous_use_does_not_import_asyncio(self) -> None:
+        loaded = run('\n'.join([
+            'import sys',
+            'from harami import EventSource, Observable',
+            'source = EventSource(None)',
+            'source.add_handler(lambda sender, e: None)',
+            'source(None, 1)',
+            'o = Observable()',
+            'o.attach(lambda state: None)',
+            'o.notify(1)',
+            'print(" ".join(sys.modules))'
+        ]))
+        for name in ('asyncio', 'concurrent.futures', 'inspect'):
+            assert name not in loaded, name
+
+    @fact
+    def exports_are_not_shadowed_by_submodules(self) -> None:
+        import harami.EventSource
+        assert harami.EventSource is EventSource
+        assert 'Observable' in dir(harami)
+        for name in harami.__all__:
+            assert getattr(harami, name) is not None
+        try:
+            harami.NotAnExport  # type: ignore[attr-defined]
+            assert False, 'expected AttributeError'
+        except AttributeError:
+            pass
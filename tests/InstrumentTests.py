@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import gc
+import time
+import weakref
+from harami import DispatchCollector, EventSource, Histogram, Instrument, Observable, set_instrument
+from punit import fact
+from typing import Any, Optional
+
+
+class RecordingInstrument(Instrument):
+    """An Instrument which records every measurement it receives."""
+
+    def __init__(self) -> None:
+        self.subscribers: list[tuple[Any, Any, Optional[BaseException]]] = []
+        self.dispatches: list[tuple[Any, int, int]] = []
+
+    def on_subscriber(self, source: Any, subscriber: Any, elapsed: float, exception: Optional[BaseException]) -> None:
+        self.subscribers.append((source, subscriber, exception))
+
+    def on_dispatch(self, source: Any, invoked: int, elapsed: float, pending: int) -> None:
+        self.dispatches.append((source, invoked, pending))
+
+
+def handler1(sender: object, e: object) -> None:
+    pass
+
+
+def handler2(sender: object, e: object) -> bool:
+    return True
+
+
+def handler3(sender: object, e: object) -> None:
+    pass
+
+
+def slow_handler(sender: object, e: object) -> None:
+    time.sleep(0.002)
+
+
+def failing_handler(sender: object, e: object) -> None:
+    raise ValueError()
+
+
+class FakeSubscriber:
+    """A fake subscriber, added as a weak Event Handler."""
+
+    def handler(self, sender: object, e: object) -> None:
+        pass
+
+
+class InstrumentTests:
+
+    @fact
+    def instruments_measure_each_handler(self) -> None:
+        instrument = RecordingInstrument()
+        source = EventSource(None)
+        source.add_handler(handler1)
+        source.add_handler(handler2)
+        source.add_handler(handler3)
+        source.instrument = instrument
+        source(None, 1)
+        assert instrument.subscribers == [(source, handler1, None), (source, handler2, None)]
+        assert instrument.dispatches == [(source, 2, 0)]
+        source.instrument = None
+        source(None, 1)
+        assert len(instrument.dispatches) == 1
+
+    @fact
+    def instruments_observe_exceptions(self) -> None:
+        instrument = RecordingInstrument()
+        o: Observable[int] = Observable()
+        o.attach(failing_handler)  # type: ignore[arg-type]
+        o.instrument = instrument
+        try:
+            o(1)
+            assert False, 'expected ValueError'
+        except ValueError as ex:
+            assert instrument.subscribers == [(o, failing_handler, ex)]
+            assert instrument.dispatches == [(o, 1, 0)]
+
+    @fact
+    async def instruments_report_pending_tasks(self) -> None:
+        instrument = RecordingInstrument()
+        source = EventSource(None)
+
+        async def handler(sender: object, e: object) -> None:
+            await asyncio.sleep(0.01)
+        source.add_handler(handler)
+        source.instrument = instrument
+        source(None, 1)
+        await source.raise_async(None, 2)
+        assert [(invoked, pending) for s, invoked, pending in instrument.dispatches] == [(1, 1), (1, 1)]
+
+    @fact
+    def default_instrument_applies_to_all_sources(self) -> None:
+        collector = DispatchCollector()
+        source = EventSource(None)
+        source.add_handler(handler1)
+        source.add_handler(slow_handler)
+        o: Observable[int] = Observable()
+        o.attach(lambda v: None)
+        set_instrument(collector)
+        try:
+            for i in range(10):
+                source(None, i)
+                o(i)
+        finally:
+            set_instrument(None)
+        source(None, 1)
+        names = {stats.name: stats for stats in collector.sources}
+        assert len(names) == 2
+        assert all(stats.count == 10 for stats in names.values())
+        slowest = collector.slowest(1)[0]
+        assert slowest.name.endswith('slow_handler')
+        assert slowest.count == 10
+        assert slowest.latency.percentile(50) >= 0.002
+        assert 'slow_handler' in collector.report()
+        collector.reset()
+        assert len(collector.sources) == 0
+
+    @fact
+    def collectors_hold_sources_and_subscribers_weakly(self) -> None:
+        collector = DispatchCollector()
+        subscriber = FakeSubscriber()
+        source = EventSource(None)
+        source.add_handler(subscriber.handler, weak=True)
+        source.instrument = collector
+        for i in range(100):
+            source(None, i)
+        assert [stats.count for stats in collector.subscribers] == [100]
+        assert [stats.count for stats in collector.sources] == [100]
+        subscriber_ref = weakref.ref(subscriber)
+        source_ref = weakref.ref(source)
+        del subscriber
+        gc.collect()
+        assert subscriber_ref() is None
+        assert len(collector.subscribers) == 0
+        del source
+        gc.collect()
+        assert source_ref() is None
+        assert len(collector.sources) == 0
+
+    @fact
+    def histograms_report_percentiles(self) -> None:
+        histogram = Histogram()
+        assert histogram.percentile(50) == 0.0
+        for i in range(1, 1001):
+            histogram.record(i / 1_000_000)
+        # percentiles are reported within ~6% of the recorded value
+        assert abs(histogram.percentile(50) - 0.0005) <= 0.0005 * 0.07
+        assert abs(histogram.percentile(99) - 0.00099) <= 0.00099 * 0.07
+        assert histogram.percentile(100) == histogram.max == 0.001
+        assert histogram.count == 1000
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from harami import DictDelta, ListDelta, ObservableDict, ObservableList
+from punit import fact
+
+
+class ObservableCollectionTests:
+
+    @fact
+    def dicts_notify_deltas(self) -> None:
+        d: ObservableDict[str, int] = ObservableDict({'a': 1, 'b': 2})
+        replica = d.copy()
+        deltas: list[DictDelta[str, int]] = []
+
+        def observer(delta: DictDelta[str, int]) -> None:
+            deltas.append(delta)
+            delta.apply(replica)
+        d.attach(observer)
+        d['a'] = 1
+        assert len(deltas) == 0, 'an unchanged value is not a change'
+        d['a'] = 10
+        d['c'] = 3
+        del d['b']
+        d.update({'a': 10, 'd': 4, 'e': 5})
+        assert [(x.added, x.changed, x.removed) for x in deltas] == [
+            ({}, {'a': 10}, ()),
+            ({'c': 3}, {}, ()),
+            ({}, {}, ('b',)),
+            ({'d': 4, 'e': 5}, {}, ())
+        ]
+        assert replica == d.copy()
+
+    @fact
+    def replacing_a_dict_notifies_the_difference(self) -> None:
+        d: ObservableDict[int, str] = ObservableDict((i, str(i)) for i in range(1000))
+        deltas: list[DictDelta[int, str]] = []
+        d.attach(deltas.append)
+        table = {i: str(i) for i in range(1, 1000)}
+        table[500] = 'five hundred'
+        table[1000] = '1000'
+        delta = d.replace(table)
+        assert deltas == [delta]
+        assert delta.added == {1000: '1000'} and delta.changed == {500: 'five hundred'} and delta.removed == (0,)
+        assert d.copy() == table
+        assert len(d.replace(table)) == 0 and len(deltas) == 1
+
+    @fact
+    def lists_notify_splices(self) -> None:
+        items: ObservableList[int] = ObservableList(range(10))
+        replica = items.copy()
+        deltas: list[ListDelta[int]] = []
+
+        def observer(delta: ListDelta[int]) -> None:
+            deltas.append(delta)
+            delta.apply(replica)
+        items.attach(observer)
+        items[0] = 0
+        assert len(deltas) == 0, 'an unchanged item is not a change'
+        items.append(10)
+        items[2:4] = [20, 30, 40]
+        del items[0]
+        items.insert(-1, 99)
+        del items[::4]
+        assert [x.splices for x in deltas[:4]] == [
+            ((10, 10, (10,)),),
+            ((2, 4, (20, 30, 40)),),
+            ((0, 1, ()),),
+            ((10, 10, (99,)),)
+        ]
+        assert replica == items.copy()
+        deltas.clear()
+        changed = items.copy()
+        changed[1] = -1
+        changed[5] = -5
+        changed[6] = -6
+        items.replace(changed)
+        assert [x.splices for x in deltas] == [((1, 2, (-1,)), (5, 7, (-5, -6)))]
+        items.sort()
+        items.clear()
+        assert replica == items.copy() == []
@@ -2,7 +2,11 @@
 # SPDX-License-Identifier: MIT
 
 import asyncio
-from harami import Observable
+import gc
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from harami import DeadLetter, Observable
 from punit import fact
 
 
@@ -117,6 +121,231 @@ class ObservableTests:
         assert 2 == o()
         assert 1 == x.call_count
 
+    @fact
+    def supportNonStandardObservers(self) -> None:
+        o: Observable[int] = Observable()
+        #
+
+        class X:
+            zero_count: int = 0
+            multi_args: tuple | None = None
+            call_args: tuple | None = None
+
+            def zero(self) -> None:
+                self.zero_count += 1
+
+            def multi(self, v: int, w: int | None = 0, z: int | None = 0) -> None:
+                self.multi_args = (v, w, z)
+
+            def __call__(self, *args) -> None:
+                self.call_args = args
+        x: X = X()
+        o.attach(x.zero)  # type: ignore[arg-type]
+        o.attach(x.multi)
+        o.attach(x)
+        #
+        o(1)
+        assert 1 == x.zero_count
+        assert (1, None, None) == x.multi_args
+        assert (1,) == x.call_args
+        o.detach(x.multi)
+        o(2)
+        assert 2 == x.zero_count
+        assert (1, None, None) == x.multi_args
+        assert (2,) == x.call_args
+
+    @fact
+    def weakObserversAreDetachedWhenCollected(self) -> None:
+        o: Observable[int] = Observable()
+        #
+
+        class X:
+            last: int | None = None
+
+            def s1(self, v: int) -> None:
+                self.last = v
+
+            def s2(self) -> None:
+                pass
+        x: X = X()
+        o.attach(x.s1, weak=True)
+        o.attach(x.s2, weak=True)  # type: ignore[arg-type]
+        o(1)
+        assert 1 == x.last
+        o.detach(x.s2)  # type: ignore[arg-type]
+        o(2)
+        assert 2 == x.last
+        ref = weakref.ref(x)
+        del x
+        gc.collect()
+        assert ref() is None
+        o(3)
+        assert 3 == o()
+
+    @fact
+    async def notifyAsyncAwaitsObservers(self) -> None:
+        o: Observable[int] = Observable(max_concurrency=1)
+        #
+
+        class X:
+            values: list[int]
+
+            def __init__(self):
+                self.values = []
+
+            async def s1(self, v: int):
+                await asyncio.sleep(0.01)
+                self.values.append(v)
+        x: X = X()
+        o.attach(x.s1)
+        await o.notify_async(1)
+        assert [1] == x.values
+        o(2)
+        o(3)
+        assert [1] == x.values
+        await o.notify_async(4)
+        assert [1, 2, 3, 4] == x.values
+
+    @fact
+    def coalescingDefersNotification(self) -> None:
+        latest: Observable[int] = Observable(coalesce='latest')
+        batch: Observable[int] = Observable(coalesce='batch')
+        received: list = []
+        latest.attach(received.append)
+        batch.attach(received.append)
+        #
+        for i in range(1, 4):
+            latest(i)
+            batch(i)
+        assert 3 == latest()
+        assert 3 == batch()
+        assert [] == received
+        latest.flush()
+        batch.flush()
+        assert [3, (1, 2, 3)] == received
+        latest.flush()
+        batch.flush()
+        assert 2 == len(received)
+
+    @fact
+    async def coalescingFlushesOnInterval(self) -> None:
+        o: Observable[int] = Observable(coalesce='batch', flush_interval=0.01)
+        received: list = []
+        o.attach(received.append)
+        #
+        o(1)
+        o(2)
+        assert [] == received
+        await asyncio.sleep(0.05)
+        assert [(1, 2)] == received
+        o(3)
+        await asyncio.sleep(0.05)
+        assert [(1, 2), (3,)] == received
+
+    @fact
+    def observersAreNotifiedInPriorityOrder(self) -> None:
+        o: Observable[int] = Observable()
+        received: list[str] = []
+        o.attach(lambda v: received.append('a'))
+        o.attach(lambda v: received.append('b'), priority=1)
+        o.attach(lambda v: v > 1, priority=1)
+        o.attach(lambda v: received.append('c'))
+        #
+        o(1)
+        o(2)
+        assert ['b', 'a', 'c', 'b'] == received
+
+    @fact
+    async def observersCanBeSubmittedToExecutors(self) -> None:
+        o: Observable[int] = Observable()
+        received: list[tuple[int, str]] = []
+
+        def fail(v: int) -> None:
+            raise ValueError(v)
+        with ThreadPoolExecutor(thread_name_prefix='executor') as executor:
+            o.attach(lambda v: received.append((v, threading.current_thread().name)), executor=executor)
+            o.attach(lambda: received.append((0, threading.current_thread().name)), executor=executor)  # type: ignore[arg-type, misc]
+            o(1)
+            await o.notify_async(2)
+            o.attach(fail, executor=executor)
+            try:
+                await o.notify_async(3)
+                assert False, 'expected ValueError'
+            except ValueError:
+                pass
+        assert sorted(v for v, name in received) == [0, 0, 0, 1, 2, 3]
+        assert all(name.startswith('executor') for v, name in received)
+
+    @fact
+    def filteredObserversOnlyReceiveMatchingStates(self) -> None:
+        o: Observable[dict[str, str]] = Observable()
+        received: list[tuple[str, str]] = []
+
+        def red(state: dict[str, str]) -> None:
+            received.append(('red', state['name']))
+        o.attach(red, where={'color': 'red'})
+        o.attach(lambda state: received.append(('all', state['name'])))
+        o.attach(lambda state: received.append(('predicate', state['name'])), where=lambda state: state['name'] == 'b')
+        o({'color': 'red', 'name': 'a'})
+        o({'color': 'blue', 'name': 'b'})
+        o({'name': 'c'})
+        assert received == [('all', 'a'), ('red', 'a'), ('all', 'b'), ('predicate', 'b'), ('all', 'c')]
+        o.detach(red)
+        o({'color': 'red', 'name': 'd'})
+        assert received[-1] == ('all', 'd')
+
+    @fact
+    def distinctObservablesIgnoreUnchangedStates(self) -> None:
+        equality: Observable[list[int]] = Observable(distinct='equality')
+        identity: Observable[list[int]] = Observable(distinct='identity')
+        received: list[tuple[str, list[int]]] = []
+        equality.attach(lambda state: received.append(('equality', state)))
+        identity.attach(lambda state: received.append(('identity', state)))
+        state = [1]
+        for o in (equality, identity):
+            o(state)
+            o(state)
+            o([1])
+        assert received == [('equality', [1]), ('identity', [1]), ('identity', [1])]
+        try:
+            Observable(distinct='sometimes')
+            assert False, 'expected ValueError'
+        except ValueError:
+            pass
+
+    @fact
+    async def observerErrorPoliciesIsolateFailures(self) -> None:
+        dead_letters: Observable[DeadLetter] = Observable()
+        letters: list[DeadLetter] = []
+        dead_letters.attach(letters.append)
+        received: list[tuple[str, int]] = []
+
+        def failing_observer(state: int) -> None:
+            raise ValueError(state)
+
+        async def failing_async_observer(state: int) -> None:
+            raise KeyError(state)
+        isolated: Observable[int] = Observable(errors='isolate')
+        lettered: Observable[int] = Observable(errors=dead_letters, max_failures=3)
+        isolated.attach(failing_observer, priority=1)
+        isolated.attach(lambda state: received.append(('isolated', state)))
+        lettered.attach(failing_observer, priority=1)
+        lettered.attach(lambda state: received.append(('lettered', state)))
+        try:
+            isolated(1)
+            assert False, 'expected ExceptionGroup'
+        except ExceptionGroup as eg:
+            assert [type(ex) for ex in eg.exceptions] == [ValueError]
+        lettered(1)
+        lettered.attach(failing_async_observer)
+        await lettered.notify_async(2)
+        await lettered.notify_async(3)
+        await lettered.notify_async(4)
+        assert received == [('isolated', 1), ('lettered', 1), ('lettered', 2), ('lettered', 3), ('lettered', 4)]
+        assert [(x.args, type(x.exception)) for x in letters] == [((1,), ValueError), ((2,), ValueError), ((2,), KeyError), ((3,), ValueError), ((3,), KeyError), ((4,), KeyError)]
+        assert letters[0].source is lettered and letters[0].subscriber is failing_observer
+        assert lettered.has_observers
+
     @fact
     async def observablesCanConsumeEvents(self) -> None:
         """
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import asyncio
+from harami import Observable
+from punit import fact
+
+
+class OperatorTests:
+
+    @fact
+    def derivedObservablesOnlyObserveWhileObserved(self) -> None:
+        o: Observable[int] = Observable()
+        d = o.throttle(60)
+        received: list[int] = []
+        #
+        assert not o.has_observers
+        d.attach(received.append)
+        assert o.has_observers
+        d.detach(received.append)
+        assert not o.has_observers
+
+    @fact
+    def throttleWithoutLoopEmitsLeadingEdge(self) -> None:
+        o: Observable[int] = Observable()
+        received: list[int] = []
+        o.throttle(60).attach(received.append)
+        #
+        for i in range(10):
+            o(i)
+        assert [0] == received
+
+    @fact
+    async def throttleWithLoopEmitsTrailingEdge(self) -> None:
+        o: Observable[int] = Observable()
+        received: list[int] = []
+        o.throttle(0.02).attach(received.append)
+        #
+        for i in range(10):
+            o(i)
+        assert [0] == received
+        await asyncio.sleep(0.05)
+        assert [0, 9] == received
+
+    @fact
+    async def debounceEmitsSettledValue(self) -> None:
+        o: Observable[int] = Observable()
+        received: list[int] = []
+        o.debounce(0.02).attach(received.append)
+        #
+        for i in range(10):
+            o(i)
+        assert [] == received
+        await asyncio.sleep(0.05)
+        assert [9] == received
+
+    @fact
+    async def sampleEmitsMostRecentValuePerInterval(self) -> None:
+        o: Observable[int] = Observable()
+        received: list[int] = []
+        o.sample(0.02).attach(received.append)
+        #
+        for i in range(10):
+            o(i)
+        await asyncio.sleep(0.05)
+        assert [9] == received
+        await asyncio.sleep(0.05)
+        assert [9] == received
+
+    @fact
+    def operatorsTransformState(self) -> None:
+        o: Observable[int] = Observable()
+        received: list[int] = []
+        o.skip(1).map(lambda v: v * 10).filter(lambda v: v != 30).scan(lambda acc, v: acc + v, 0).take(3).attach(received.append)
+        #
+        for i in range(10):
+            o(i)
+        assert [10, 30, 70] == received
+
+    @fact
+    def fusedOperatorsCostASingleDispatch(self) -> None:
+        o: Observable[int] = Observable()
+        d = o.map(lambda v: v + 1).filter(lambda v: v % 2 == 0).distinct_until_changed()
+        received: list[int] = []
+        d.attach(received.append)
+        #
+        for v in (1, 1, 2, 3, 3, 5):
+            o(v)
+        assert [2, 4, 6] == received
+        # each derived observable (sharing an upstream) attaches a single fused observer
+        d2 = d.map(str)
+        d2.attach(received.append)
+        o(7)
+        assert [2, 4, 6, 8, '8'] == received
+        d.detach(received.append)
+        assert o.has_observers
+        d2.detach(received.append)
+        assert not o.has_observers
+
+    @fact
+    def mergeAndCombineLatestJoinObservables(self) -> None:
+        a: Observable[int] = Observable()
+        b: Observable[str] = Observable()
+        merged: list = []
+        combined: list = []
+        a.merge(b).attach(merged.append)
+        a.combine_latest(b).map(lambda t: f'{t[0]}{t[1]}').attach(combined.append)
+        #
+        a(1)
+        a(2)
+        b('x')
+        a(3)
+        b('y')
+        assert [1, 2, 'x', 3, 'y'] == merged
+        assert ['2x', '3x', '3y'] == combined
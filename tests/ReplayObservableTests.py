@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import os
+import tempfile
+from harami import EventArgs, EventSource, ReplayObservable, SegmentLog
+from punit import fact
+
+
+class ReplayObservableTests:
+
+    @fact
+    def observers_are_replayed_recent_states(self) -> None:
+        o: ReplayObservable[int] = ReplayObservable(capacity=3)
+        for i in range(5):
+            o(i)
+        received: list[int] = []
+        o.attach(received.append)
+        o(5)
+        assert received == [2, 3, 4, 5]
+        assert list(o.history(4)) == [(4, 4), (5, 5)]
+        assert o.first_offset == 3
+        assert o.next_offset == 6
+
+    @fact
+    def observers_can_attach_without_replay(self) -> None:
+        o: ReplayObservable[int] = ReplayObservable()
+        o(1)
+        received: list[int] = []
+        o.attach(received.append, replay=False)
+        o(2)
+        assert received == [2]
+
+    @fact
+    async def async_observers_are_replayed_in_order(self) -> None:
+        o: ReplayObservable[int] = ReplayObservable()
+        for i in range(5):
+            o(i)
+        received: list[int] = []
+        done = asyncio.Event()
+
+        async def observer(state: int) -> None:
+            await asyncio.sleep(0.001 * (5 - state))
+            received.append(state)
+            if state == 4:
+                done.set()
+        o.replay(observer)
+        await asyncio.wait_for(done.wait(), 5)
+        assert received == [0, 1, 2, 3, 4]
+
+    @fact
+    def event_sources_can_be_recorded(self) -> None:
+        source = EventSource(None)
+        recorder: ReplayObservable[EventArgs] = ReplayObservable()
+        source += recorder
+        source(None, 'a')
+        source(None, 'b')
+        assert [e.args[0] for offset, e in recorder.history() if e is not None] == ['a', 'b']
+
+    @fact
+    def logs_replay_history_older_than_the_ring(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with SegmentLog(path, segment_size=256) as log:
+                o: ReplayObservable[int] = ReplayObservable(capacity=2, log=log)
+                for i in range(50):
+                    o(i)
+                # records are ~24 bytes, so history spans several segments
+                assert len(os.listdir(path)) > 1
+                assert [state for offset, state in o.history(10)] == list(range(10, 50))
+                assert [offset for offset, state in o.history(0)][:3] == [0, 1, 2]
+
+    @fact
+    def logs_are_resumed_by_new_processes(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with SegmentLog(path, segment_size=256) as log:
+                o: ReplayObservable[str] = ReplayObservable(log=log)
+                for i in range(20):
+                    o(str(i))
+            with SegmentLog(path, segment_size=256) as log:
+                assert log.next_offset == 20
+                o = ReplayObservable(capacity=4, log=log)
+                assert o.state == '19'
+                assert [state for offset, state in o.history()] == ['16', '17', '18', '19']
+                o('20')
+                assert [offset for offset, state in log.read(19)] == [19, 20]
+
+    @fact
+    def logs_retain_at_most_max_segments(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with SegmentLog(path, segment_size=256, max_segments=2) as log:
+                for i in range(100):
+                    log.append(bytearray(64))
+                assert len(os.listdir(path)) == 2
+                assert log.first_offset > 0
+                assert [offset for offset, value in log.read()] == list(range(log.first_offset, 100))
+                assert len(log) == 100 - log.first_offset
+                try:
+                    log.append(bytearray(512))
+                    assert False, 'expected ValueError'
+                except ValueError:
+                    pass
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import multiprocessing
+import pickle
+from harami import EventArgs, EventSource, PickleSerializer, SharedMemoryBus
+from punit import fact
+
+
+def _echo_child(bus: SharedMemoryBus, count: int) -> None:
+    # relays each `ping` back to the parent as a `pong`
+    received: list[int] = []
+    bus.channel('ping').add_handler(lambda sender, e: received.append(e.args[0]))
+    while len(received) < count:
+        bus.poll()
+    for value in received:
+        bus.publish('pong', value * 2, payload=pickle.PickleBuffer(bytearray(8192)))
+    bus.flush()
+
+
+class SharedMemoryBusTests:
+
+    @fact
+    def delivers_messages_within_a_process_when_echo_is_enabled(self) -> None:
+        with SharedMemoryBus(capacity=4096, echo=True) as bus:
+            received: list[tuple] = []
+            bus.channel('a').add_handler(lambda sender, e: received.append((sender, e.args, dict(e.kwargs))))
+            bus.publish('a', 1, x='y')
+            bus.publish('b', 2)
+            assert bus.poll() == 0
+            bus.flush()
+            assert bus.poll() == 2
+            assert received == [(bus, (1,), {'x': 'y'})]
+            assert bus.poll() == 0
+
+    @fact
+    def ignores_own_messages_by_default(self) -> None:
+        with SharedMemoryBus(capacity=4096) as bus:
+            received: list[EventArgs] = []
+            bus.channel('a').add_handler(lambda sender, e: received.append(e))
+            bus.publish('a', 1)
+            bus.flush()
+            assert bus.poll() == 0
+            assert len(received) == 0
+
+    @fact
+    def wraps_around_the_ring(self) -> None:
+        with SharedMemoryBus(capacity=512, echo=True) as bus:
+            received: list[int] = []
+            bus.channel('a').add_handler(lambda sender, e: received.append(e.args[0]))
+            for i in range(100):
+                bus.publish('a', i, 'x' * 50)
+                bus.flush()
+                assert bus.poll() == 1
+            assert received == list(range(100))
+            assert bus.overruns == 0
+
+    @fact
+    def readers_skip_ahead_when_lapped(self) -> None:
+        with SharedMemoryBus(capacity=512, echo=True) as bus:
+            for i in range(100):
+                bus.publish('a', i, 'x' * 50)
+                bus.flush()
+            bus.poll()
+            assert bus.overruns == 1
+            received: list[int] = []
+            bus.channel('a').add_handler(lambda sender, e: received.append(e.args[0]))
+            bus.publish('a', 100)
+            bus.flush()
+            assert bus.poll() == 1
+            assert received == [100]
+
+    @fact
+    def rejects_messages_larger_than_the_ring(self) -> None:
+        with SharedMemoryBus(capacity=256, flush_threshold=1 << 20, echo=True) as bus:
+            received: list[int] = []
+            bus.channel('a').add_handler(lambda sender, e: received.append(e.args[0]))
+            bus.publish('a', 1)
+            try:
+                bus.publish('a', 'x' * 1024)
+                assert False, 'expected ValueError'
+            except ValueError:
+                pass
+            bus.publish('a', 2)
+            bus.flush()
+            assert bus.poll() == 2
+            assert received == [1, 2], 'a rejected message does not discard other messages'
+
+    @fact
+    def exports_event_sources(self) -> None:
+        with SharedMemoryBus(capacity=4096, echo=True) as bus:
+            source = EventSource(None)
+            bus.export(source, 'a')
+            received: list[tuple] = []
+            bus.channel('a').add_handler(lambda sender, e: received.append(e.args))
+            source(object(), 1, 2)
+            bus.flush()
+            bus.poll()
+            assert received == [(1, 2)]
+            bus.unexport(source, 'a')
+            assert not source.has_handlers
+
+    @fact
+    def serializes_large_buffers_out_of_band(self) -> None:
+        serializer = PickleSerializer(min_buffer_size=1024)
+        data, buffers = serializer.dumps((pickle.PickleBuffer(bytearray(16)), pickle.PickleBuffer(bytearray(2048))))
+        assert len(buffers) == 1
+        assert buffers[0].nbytes == 2048
+        small, large = serializer.loads(data, [bytearray(b) for b in buffers])
+        assert bytes(small) == bytes(16)
+        assert bytes(large) == bytes(2048)
+
+    @fact
+    def delivers_messages_between_processes(self) -> None:
+        context = multiprocessing.get_context('spawn')
+        with SharedMemoryBus(capacity=1 << 20, context=context) as bus:
+            received: list[tuple] = []
+            bus.channel('pong').add_handler(lambda sender, e: received.append((e.args[0], memoryview(e.kwargs['payload']).nbytes)))
+            child = context.Process(target=_echo_child, args=(bus, 10))
+            child.start()
+            for i in range(10):
+                bus.publish('ping', i)
+            bus.flush()
+            child.join(30)
+            assert child.exitcode == 0
+            bus.poll()
+            assert received == [(i * 2, 8192) for i in range(10)]
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import gc
+import threading
+import weakref
+from harami import EventArgs, EventSource, Observable, TimerWheel
+from punit import fact
+
+
+class TimerWheelTests:
+
+    @fact
+    def callbacks_expire_in_order_across_levels(self) -> None:
+        wheel = TimerWheel(resolution=0.001)
+        start = wheel.time()
+        fired: list[float] = []
+        # within the first level, and cascading from the second, third and fourth levels
+        delays = [0.2, 0.005, 70.0, 1.5, 20000.0, 0.0, 300.0]
+        handles = [wheel.schedule_at(start + delay, fired.append, delay) for delay in delays]
+        assert len(wheel) == len(delays) and all(h.pending for h in handles)
+        assert wheel.advance(start + 0.0045) == 1 and fired == [0.0]
+        wheel.advance(start + 1.502)
+        assert fired == [0.0, 0.005, 0.2, 1.5]
+        assert handles[6].cancel() and not handles[6].cancel()
+        assert not handles[1].cancel(), 'a callback which ran cannot be cancelled'
+        wheel.advance(start + 69.998)
+        assert len(fired) == 4
+        wheel.advance(start + 70.002)
+        assert fired[-1] == 70.0
+        wheel.advance(start + 20000.002)
+        assert fired == [0.0, 0.005, 0.2, 1.5, 70.0, 20000.0]
+        assert len(wheel) == 0 and not any(h.pending for h in handles)
+
+    @fact
+    def many_callbacks_expire_in_batches(self) -> None:
+        wheel = TimerWheel(resolution=0.01)
+        start = wheel.time()
+        fired: list[int] = []
+        handles = [wheel.schedule_at(start + (i % 1000) * 0.25, fired.append, i) for i in range(100_000)]
+        for handle in handles[::2]:
+            handle.cancel()
+        assert len(wheel) == 50_000
+        assert wheel.advance(start + 125.0) == 25_000
+        assert wheel.advance(start + 250.0) == 25_000
+        assert sorted(fired) == list(range(1, 100_000, 2))
+        # a callback scheduled in the past runs on the next tick
+        wheel.schedule_at(start, fired.append, -1)
+        assert wheel.advance(start + 250.02) == 1 and fired[-1] == -1
+
+    @fact
+    async def events_are_raised_later_on_the_event_loop(self) -> None:
+        source = EventSource(None)
+        received: list[tuple[object, int]] = []
+
+        def handler(sender: object, e: EventArgs) -> None:
+            received.append((threading.current_thread(), e.args[0]))
+        source.add_handler(handler)
+        source.raise_later(0.02, None, 2)
+        source.raise_later(0.01, None, 1)
+        cancelled = source.raise_later(0.015, None, 0)
+        assert cancelled.cancel()
+        await asyncio.sleep(0.05)
+        assert received == [(threading.current_thread(), 1), (threading.current_thread(), 2)]
+
+    @fact
+    def wheels_do_not_keep_event_loops_alive(self) -> None:
+        source = EventSource(None)
+        source.add_handler(lambda sender, e: None)
+        loops: list[weakref.ref[asyncio.AbstractEventLoop]] = []
+
+        async def main() -> None:
+            loops.append(weakref.ref(asyncio.get_running_loop()))
+            source.raise_later(0.001, None, 1)
+            # still pending when the loop closes
+            source.raise_later(60.0, None, 2)
+            await asyncio.sleep(0.01)
+
+        def run() -> None:
+            for i in range(3):
+                asyncio.run(main())
+        # a thread without a running event loop
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        assert len(loops) == 3
+        gc.collect()
+        assert all(loop() is None for loop in loops)
+
+    @fact
+    def observers_are_notified_at_a_time_by_a_thread(self) -> None:
+        o: Observable[int] = Observable()
+        notified = threading.Event()
+        received: list[tuple[object, int | None]] = []
+
+        def observer(state: int) -> None:
+            received.append((threading.current_thread(), state))
+            notified.set()
+        o.attach(observer)
+
+        def schedule() -> None:
+            # a thread without an event loop
+            wheel = TimerWheel.current()
+            o.notify_at(wheel.time() + 0.01, 1)
+        thread = threading.Thread(target=schedule)
+        thread.start()
+        thread.join()
+        assert notified.wait(5.0)
+        assert received[0][0] is not threading.current_thread() and received[0][1] == 1
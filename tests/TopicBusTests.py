@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: © 2025 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from harami import EventArgs, EventSource, TopicBus
+from punit import fact
+from typing import Any
+
+
+class TopicBusTests:
+
+    @fact
+    def patterns_match_topics(self) -> None:
+        bus = TopicBus()
+        received: list[tuple[str, Any]] = []
+
+        def subscribe(pattern: str) -> None:
+            bus.subscribe(pattern, lambda topic, e: received.append((pattern, topic)))
+        for pattern in ('widget.created', 'widget.*', 'widget.#', '#', '*.created.*', 'widget.#.red', 'gadget.#'):
+            subscribe(pattern)
+        for topic in ('widget', 'widget.created', 'widget.created.red'):
+            bus.publish(topic)
+        assert received == [
+            ('widget.#', 'widget'), ('#', 'widget'),
+            ('widget.created', 'widget.created'), ('widget.*', 'widget.created'), ('widget.#', 'widget.created'), ('#', 'widget.created'),
+            ('widget.#', 'widget.created.red'), ('#', 'widget.created.red'), ('*.created.*', 'widget.created.red'), ('widget.#.red', 'widget.created.red')
+        ]
+
+    @fact
+    def eventargs_are_shared_by_all_handlers(self) -> None:
+        bus = TopicBus()
+        received: list[EventArgs] = []
+        bus.subscribe('a.b', lambda topic, e: received.append(e))
+        bus.subscribe('a.*', lambda topic, e: received.append(e))
+        bus.publish('a.b', 1, color='red')
+        assert len(received) == 2 and received[0] is received[1]
+        assert received[0].args == (1,) and received[0].kwargs['color'] == 'red'
+
+    @fact
+    def unsubscribing_invalidates_matches(self) -> None:
+        bus = TopicBus()
+        received: list[str] = []
+
+        def handler(topic: str, e: EventArgs) -> None:
+            received.append(topic)
+        bus.subscribe('a.#', handler)
+        bus.publish('a.b')
+        assert bus.has_subscribers('a.b')
+        bus.unsubscribe('a.#', handler)
+        bus.publish('a.b')
+        assert not bus.has_subscribers('a.b')
+        assert received == ['a.b']
+        try:
+            bus.unsubscribe('a.#', handler)
+            assert False, 'expected KeyError'
+        except KeyError:
+            pass
+
+    @fact
+    def invalid_topics_raise_valueerror(self) -> None:
+        bus = TopicBus()
+        for pattern in ('a..b', 'a.b*', ''):
+            try:
+                bus.subscribe(pattern, lambda topic, e: None)
+                assert False, 'expected ValueError'
+            except ValueError:
+                pass
+        try:
+            bus.publish('a.*')
+            assert False, 'expected ValueError'
+        except ValueError:
+            pass
+
+    @fact
+    def event_sources_can_be_exported(self) -> None:
+        bus = TopicBus()
+        source = EventSource(None)
+        received: list[tuple[str, Any]] = []
+        bus.subscribe('widget.created.*', lambda topic, e: received.append((topic, e.args[0])))
+        topic = lambda sender, e: f'widget.created.{e.args[0]}'
+        bus.export(source, topic)
+        source(None, 'red')
+        source(None, 'blue')
+        bus.unexport(source, topic)
+        source(None, 'green')
+        assert received == [('widget.created.red', 'red'), ('widget.created.blue', 'blue')]
+
+    @fact
+    async def publish_async_awaits_handlers(self) -> None:
+        bus = TopicBus()
+        received: list[str] = []
+
+        async def handler(topic: str, e: EventArgs) -> None:
+            received.append(topic)
+        bus.subscribe('a.*', handler)
+        bus.subscribe('#', handler)
+        await bus.publish_async('a.b')
+        assert received == ['a.b', 'a.b']